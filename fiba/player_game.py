@@ -5,6 +5,10 @@ from bs4 import BeautifulSoup
 import time
 from typing import List, Dict, Optional
 
+from wbb.parsers import bs4_parser
+
+HTML_PARSER = bs4_parser()
+
 # Install cache to avoid repeated requests
 requests_cache.install_cache('fiba_player_cache')
 
@@ -80,7 +84,7 @@ def scrape_player_stats(game_url: str) -> Optional[List[Dict]]:
         # Reconstruct final URL with fragment for display
         final_url = final_base_url + '#boxscore'
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, HTML_PARSER)
         
         # Look for boxscore data - this will need to be adjusted based on actual HTML structure
         # First, let's try to find the boxscore section
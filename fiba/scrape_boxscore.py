@@ -7,6 +7,10 @@ from datetime import datetime
 from sqlite_utils import Database
 import re
 
+from wbb.parsers import bs4_parser
+
+HTML_PARSER = bs4_parser()
+
 BASE_URL = "https://www.fiba.basketball"
 
 requests_cache.install_cache('fiba_cache')
@@ -33,7 +37,7 @@ def get_womens_events(competition_type=None):
     for url in urls_to_try:
         try:
             page = requests.get(BASE_URL + url, timeout=10).text
-            soup = BeautifulSoup(page, "html.parser")
+            soup = BeautifulSoup(page, HTML_PARSER)
 
             # Look for links that contain 'women' in the URL
             links = soup.find_all('a', href=True)
@@ -91,7 +95,7 @@ def get_latest_womens_games(limit=10):
     for url in urls_to_try:
         try:
             page = requests.get(BASE_URL + url, timeout=10).text
-            soup = BeautifulSoup(page, "html.parser")
+            soup = BeautifulSoup(page, HTML_PARSER)
 
             # Look for game items
             game_items = soup.select("div.game_item, div.game-item, article.game")[:limit]
@@ -137,7 +141,7 @@ def get_game_result(game_url):
     """
     try:
         page = requests.get(game_url, timeout=10).text
-        soup = BeautifulSoup(page, "html.parser")
+        soup = BeautifulSoup(page, HTML_PARSER)
 
         # Extract teams
         teams = [s.text for s in soup.find_all('span', class_='team-name')[:2]]
@@ -181,7 +185,7 @@ def get_event_player_stats(event_slug):
 
     try:
         page = requests.get(stats_url, timeout=10).text
-        soup = BeautifulSoup(page, "html.parser")
+        soup = BeautifulSoup(page, HTML_PARSER)
 
         # Try to find the statistics table
         stats_tables = soup.find_all('table', class_=['table', 'stats-table', 'player-stats'])
@@ -193,7 +197,7 @@ def get_event_player_stats(event_slug):
                 data_url = stats_tab.get('data-ajax-url')
                 if data_url:
                     page = requests.get(BASE_URL + data_url, timeout=10).text
-                    soup = BeautifulSoup(page, "html.parser")
+                    soup = BeautifulSoup(page, HTML_PARSER)
                     stats_tables = soup.find_all('table')
 
         all_stats = []
@@ -264,7 +268,7 @@ def get_game_urls(event_slug):
         List of game URLs
     """
     page = requests.get(BASE_URL + event_slug).text
-    soup = BeautifulSoup(page, "html.parser")
+    soup = BeautifulSoup(page, HTML_PARSER)
     link_ls = [div.find('a').get("href")
                for div in soup.select("div.game_item")]
     return link_ls
@@ -290,11 +294,11 @@ def get_boxscore(game_url):
         box_sc_p = requests.get(game_url).text
     except:
         box_sc_p = requests.get(game_url).text
-    box_sc = BeautifulSoup(box_sc_p, "html.parser")
+    box_sc = BeautifulSoup(box_sc_p, HTML_PARSER)
 
     data_dir = box_sc.find("li", {"data-tab-content": "boxscore"}).get("data-ajax-url")
     boxsc_p = requests.get(BASE_URL + data_dir).text
-    boxsc = BeautifulSoup(boxsc_p, "html.parser")
+    boxsc = BeautifulSoup(boxsc_p, HTML_PARSER)
 
     # check to see if game completed
     if len(boxsc.find_all("tbody")) == 0:
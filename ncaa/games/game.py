@@ -4,9 +4,10 @@ import requests
 
 class Game(object):
 
-    def __init__(self, url):
+    def __init__(self, url, json_data=None):
         self.json_url = url
-        self.json = self.get_json()
+        # Games already on disk (e.g. from GameStore.read) are passed in instead of fetched
+        self.json = json_data if json_data is not None else self.get_json()
         self.date = self.parse_date()
         self.start_time = self._parse_time()
         self.location = self._parse_location()
@@ -0,0 +1,270 @@
+"""
+Path-addressed, content-addressed storage for downloaded game JSON.
+
+Games are read at <root>/<slug>/<season>/<game_id>.json, the layout the
+wbb-game-data directory already uses. Every read and write takes the path
+explicitly instead of relying on os.chdir, so downloaders and extractors can
+run in threads or processes side by side:
+
+- the JSON itself is stored once, at <root>/objects/<sha256[:2]>/<sha256>.json,
+  and each team's <game_id>.json is a relative symlink to it (a copy where
+  symlinks aren't available), so a game downloaded from both teams' sites
+  with the same content is kept once
+- objects and links are written to a temp file and renamed into place, so
+  readers never see a partial file
+- each write appends one line to <root>/manifest.jsonl (a single O_APPEND
+  write per record, safe across processes) with the game's size, sha256,
+  download source and game_key(), the date and teams that identify a game
+  whichever site it came from
+
+Directories written before objects existed still read the same way; run
+this module to move their files into objects/:
+
+    python game_store.py [root]
+
+The root defaults to $WBB_GAME_DATA or /Users/dwillis/code/wbb-game-data.
+
+Usage:
+    from game_store import GameStore
+    store = GameStore()
+    for game_id in store.game_ids('312-iowa', '2024-25'):
+        game_json = store.read('312-iowa', '2024-25', game_id)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+DEFAULT_ROOT = os.environ.get('WBB_GAME_DATA', '/Users/dwillis/code/wbb-game-data')
+
+# mkstemp creates files 0600; give written games the mode open() would (read once, os.umask isn't thread-safe)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+
+class GameStore:
+    """Game JSON files under root/<slug>/<season>/<game_id>.json, backed by root/objects"""
+
+    MANIFEST = 'manifest.jsonl'
+    OBJECTS = 'objects'
+
+    def __init__(self, root=None):
+        self.root = os.path.expanduser(root or DEFAULT_ROOT)
+        self.manifest_path = os.path.join(self.root, self.MANIFEST)
+        self._lock = threading.Lock()
+        self._sources = None
+
+    @staticmethod
+    def clean_id(game_id):
+        # Sidearm links carry extra query parameters, e.g. 12345&path=wbball
+        return str(game_id).split('&')[0]
+
+    @staticmethod
+    def game_key(game_json):
+        """Identity of a game independent of the site it was downloaded from, or None if unknown"""
+        if not isinstance(game_json, dict):
+            return None
+        game = game_json.get('Game')
+        if isinstance(game, dict):
+            # Livestats: each team's site has its own game ID, but the same date, start and teams
+            try:
+                return '|'.join(str(value) for value in (game.get('Date'), game.get('StartTime'),
+                                                         game['HomeTeam']['Name'], game['VisitingTeam']['Name']))
+            except (KeyError, TypeError):
+                return None
+        data = game_json.get('data')
+        if isinstance(data, dict) and data.get('id') is not None:
+            return f"wmt:{data['id']}"
+        return None
+
+    def season_dir(self, slug, season):
+        return os.path.join(self.root, slug, season)
+
+    def path(self, slug, season, game_id):
+        return os.path.join(self.season_dir(slug, season), self.clean_id(game_id) + '.json')
+
+    def object_path(self, digest):
+        return os.path.join(self.root, self.OBJECTS, digest[:2], digest + '.json')
+
+    def has(self, slug, season, game_id):
+        """True if the game is stored; older runs wrote "null" for failed downloads, which doesn't count"""
+        try:
+            return os.path.getsize(self.path(slug, season, game_id)) > len('null')
+        except OSError:
+            return False
+
+    def read(self, slug, season, game_id):
+        """Parsed JSON of a stored game; raises FileNotFoundError if it isn't stored"""
+        with open(self.path(slug, season, game_id), encoding='utf-8') as f:
+            return json.load(f)
+
+    def write(self, slug, season, game_id, game_json, source=None):
+        """Store a game (once per distinct content), link it for the team and record it; returns its path
+
+        source identifies where it was downloaded from (e.g. "<domain>/<game_id>"), so
+        link_source() can reuse it instead of downloading it again.
+        """
+        data = json.dumps(game_json, ensure_ascii=False, indent=4).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self.object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            self._write_atomic(os.path.dirname(object_path), object_path,
+                               lambda temp_path: self._write_bytes(temp_path, data))
+        path = self._link(object_path, slug, season, game_id)
+        self._record({'slug': slug, 'season': season, 'game_id': self.clean_id(game_id),
+                      'bytes': len(data), 'sha256': digest, 'key': self.game_key(game_json),
+                      'source': source, 'written_at': time.time()})
+        return path
+
+    def link_source(self, source, slug, season, game_id):
+        """Link the team to a game already downloaded from source; False if there is none"""
+        with self._lock:
+            if self._sources is None:
+                self._sources = {record['source']: record for record in self.manifest().values()
+                                 if record.get('source')}
+            record = self._sources.get(source)
+        if not record or not os.path.exists(self.object_path(record['sha256'])):
+            return False
+        self._link(self.object_path(record['sha256']), slug, season, game_id)
+        self._record(dict(record, slug=slug, season=season, game_id=self.clean_id(game_id),
+                          written_at=time.time()))
+        return True
+
+    def _link(self, object_path, slug, season, game_id):
+        directory = self.season_dir(slug, season)
+        os.makedirs(directory, exist_ok=True)
+        path = self.path(slug, season, game_id)
+        self._write_atomic(directory, path, lambda temp_path: self._symlink_or_copy(object_path, temp_path))
+        return path
+
+    @staticmethod
+    def _write_atomic(directory, path, write):
+        # Temp names start with a dot so game_ids() never lists them
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+        os.close(fd)
+        try:
+            write(temp_path)
+            if not os.path.islink(temp_path):
+                os.chmod(temp_path, FILE_MODE)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.lexists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _write_bytes(path, data):
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    @staticmethod
+    def _symlink_or_copy(object_path, temp_path):
+        os.remove(temp_path)
+        try:
+            os.symlink(os.path.relpath(object_path, os.path.dirname(temp_path)), temp_path)
+        except (OSError, NotImplementedError):
+            shutil.copyfile(object_path, temp_path)
+
+    def _record(self, record):
+        line = (json.dumps(record) + '\n').encode('utf-8')
+        with self._lock:
+            os.makedirs(self.root, exist_ok=True)
+            fd = os.open(self.manifest_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+            if self._sources is not None and record.get('source'):
+                self._sources[record['source']] = record
+
+    def manifest(self):
+        """Latest manifest record per (slug, season, game_id)"""
+        records = {}
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # a line cut short by a crash
+                    records[(record['slug'], record['season'], record['game_id'])] = record
+        except FileNotFoundError:
+            pass
+        return records
+
+    def consolidate(self):
+        """Move team files written before objects existed into objects/, linking them back
+
+        Each file is copied into objects/ and then atomically replaced by its
+        link, so an interrupted run leaves it either untouched or linked and
+        can simply be run again.
+
+        Returns:
+            tuple: (files moved, bytes no longer stored twice)
+        """
+        moved = saved = 0
+        for slug in self.slugs():
+            for season in self.seasons(slug):
+                for game_id in self.game_ids(slug, season):
+                    path = self.path(slug, season, game_id)
+                    if os.path.islink(path) or not self.has(slug, season, game_id):
+                        continue
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                    digest = hashlib.sha256(data).hexdigest()
+                    object_path = self.object_path(digest)
+                    if os.path.exists(object_path):
+                        saved += len(data)
+                    else:
+                        # Copy rather than move, so the team's file stays in place until the link replaces it
+                        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                        self._write_atomic(os.path.dirname(object_path), object_path,
+                                           lambda temp_path: self._write_bytes(temp_path, data))
+                    self._link(object_path, slug, season, game_id)
+                    try:
+                        key = self.game_key(json.loads(data))
+                    except ValueError:
+                        key = None
+                    self._record({'slug': slug, 'season': season, 'game_id': game_id, 'bytes': len(data),
+                                  'sha256': digest, 'key': key, 'source': None, 'written_at': time.time()})
+                    moved += 1
+        return moved, saved
+
+    def slugs(self):
+        try:
+            return sorted(entry.name for entry in os.scandir(self.root)
+                          if entry.is_dir() and entry.name != self.OBJECTS)
+        except FileNotFoundError:
+            return []
+
+    def seasons(self, slug):
+        try:
+            return sorted(entry.name for entry in os.scandir(os.path.join(self.root, slug)) if entry.is_dir())
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    def has_season(self, slug, season):
+        return os.path.isdir(self.season_dir(slug, season))
+
+    def game_ids(self, slug, season):
+        """IDs of the games stored for a team season, skipping temp and hidden files"""
+        try:
+            names = os.listdir(self.season_dir(slug, season))
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+        return sorted(name[:-len('.json')] for name in names
+                      if name.endswith('.json') and not name.startswith('.'))
+
+
+if __name__ == '__main__':
+    store = GameStore(sys.argv[1] if len(sys.argv) > 1 else None)
+    moved, saved = store.consolidate()
+    print(f"Moved {moved} game files into {os.path.join(store.root, store.OBJECTS)}, "
+          f"{saved / 1024 / 1024:.1f} MB of duplicates removed")
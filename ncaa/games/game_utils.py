@@ -2,11 +2,45 @@ import os
 import re
 import csv
 import json
+import shutil
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
+from game_store import FILE_MODE, GameStore
+
+from wbb.parsers import bs4_parser
+
+HTML_PARSER = bs4_parser()
+
+# Game JSON lives at <root>/<slug>/<season>/<game_id>.json; root comes from $WBB_GAME_DATA.
+# Assign game_utils.STORE = GameStore(other_root) to work on another copy.
+STORE = GameStore()
+
+# Games of one team season are fetched this many at a time from the team's site
+DOWNLOAD_WORKERS = 4
+
+def make_session(pool_size=DOWNLOAD_WORKERS, retries=3):
+    """
+    Pooled session shared by every request, retrying connection errors and
+    429/5xx responses with exponential backoff (honouring Retry-After).
+    """
+    session = requests.Session()
+    session.headers.update({'User-agent': 'Mozilla/5.0'})
+    retry = Retry(total=retries, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=('GET',), raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+SESSION = make_session()
 
 def validate_season(season):
     """
@@ -129,7 +163,7 @@ def build_url(stats_url, season, section):
     return stats_url + season + "#" + section
 
 def fetch_url(url):
-    r = requests.get(url, headers={'User-agent': 'Mozilla/5.0'})
+    r = SESSION.get(url, timeout=60)
     return r
 
 def fetch_game_ids_playwright(url, page_type='stats'):
@@ -165,7 +199,7 @@ def fetch_game_ids_playwright(url, page_type='stats'):
 def fetch_game_ids(season, stats_url):
     url = build_url(stats_url, season, 'game')
     r = fetch_url(url)
-    season_html = BeautifulSoup(r.text, features="html.parser")
+    season_html = BeautifulSoup(r.text, features=HTML_PARSER)
     games = season_html.find('section', {'id': 'game-team'}).findAll('a')
     game_ids = [x['href'].split("id=")[1].replace("&path=wbball","") for x in games]
     return game_ids
@@ -187,19 +221,44 @@ def parse_roster(season, slug):
         game_json = fetch_game_json(domain, game_id)
         write_json(game_id, game_json, season)
 
-def parse_games(season, domain, game_ids, slug):
+def parse_games(season, domain, game_ids, slug, workers=DOWNLOAD_WORKERS):
     validate_season(season)  # Extra validation layer
-    results = []
-    os.chdir("/Users/dwillis/code/wbb-game-data")
-    if not os.path.exists(slug):
-        os.makedirs(slug)
-    os.chdir(slug)
-    if not os.path.exists(season):
-        os.makedirs(season)
-    os.chdir(season)
-    for game_id in game_ids:
-        game_json = fetch_game_json(domain, game_id)
-        write_json(game_id, game_json, season)
+    downloaded, linked, skipped, failed = download_games(domain, game_ids, slug, season, workers)
+    print(f"{slug} {season}: {downloaded} downloaded, {linked} linked from earlier downloads, "
+          f"{skipped} already on disk, {failed} failed")
+
+def download_games(domain, game_ids, slug, season, workers=DOWNLOAD_WORKERS):
+    """
+    Download livestats JSON for a team season's game_ids into STORE with a pool of workers.
+
+    Games already on disk are skipped, so an interrupted backfill picks up
+    where it stopped, and a game already downloaded from the same URL for
+    another team is linked instead of fetched again. Failed downloads write
+    nothing and are retried on the next run.
+
+    Returns:
+        tuple: (downloaded, linked, skipped, failed) counts
+    """
+    def download(game_id):
+        if STORE.has(slug, season, game_id):
+            return 'skipped'
+        source = f"{domain}/{GameStore.clean_id(game_id)}"
+        if STORE.link_source(source, slug, season, game_id):
+            return 'linked'
+        try:
+            game_json = fetch_game_json(domain, game_id)
+        except requests.RequestException as e:
+            print(f"Error fetching game {game_id}: {e}")
+            return 'failed'
+        if game_json is None:
+            return 'failed'
+        STORE.write(slug, season, game_id, game_json, source=source)
+        return 'downloaded'
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = list(executor.map(download, dict.fromkeys(game_ids)))
+    return (results.count('downloaded'), results.count('linked'), results.count('skipped'),
+            results.count('failed'))
 
 def parse_domain(url):
     domain = urlparse(url).netloc
@@ -217,24 +276,27 @@ def fetch_game_json(domain, game_id):
         pbp = None
     return pbp
 
-def write_json(game_id, game_json, season):
-    game_id = str(game_id).split('&')[0]
-    filename = str(game_id) + '.json'
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(game_json, f, ensure_ascii=False, indent=4)
+def write_json(game_id, game_json, season=None, directory='.'):
+    # Write to a temp file and rename, so an interrupted run never leaves a truncated game behind
+    filename = os.path.join(directory, GameStore.clean_id(game_id) + '.json')
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(game_json, f, ensure_ascii=False, indent=4)
+        os.chmod(temp_path, FILE_MODE)
+        os.replace(temp_path, filename)
+    except BaseException:
+        os.remove(temp_path)
+        raise
 
 def parse_game_json(slug, season, game_id):
-    os.chdir("/Users/dwillis/code/wbb-game-data")
-    os.chdir(slug)
-    os.chdir(season)
-    return json.loads(open(game_id+'.json').read())
+    return STORE.read(slug, season, game_id)
 
 def parse_turnovers(team, slug, season, game_id):
+    return turnover_rows(team, game_id, parse_game_json(slug, season, game_id))
+
+def turnover_rows(team, game_id, game_json):
     turnovers = []
-    try:
-        game_json = parse_game_json(slug, season, game_id)
-    except:
-        raise
     if game_json and game_json['Plays'] != '':
         for play in game_json['Plays']:
             if play['Type'] == 'TURNOVER':
@@ -255,11 +317,10 @@ def parse_turnovers(team, slug, season, game_id):
     return turnovers
 
 def parse_officials(team, slug, season, game_id):
+    return official_rows(team, game_id, parse_game_json(slug, season, game_id))
+
+def official_rows(team, game_id, game_json):
     officials = []
-    try:
-        game_json = parse_game_json(slug, season, game_id)
-    except:
-        raise
     try:
         if game_json and game_json['Game'] != '':
             if game_json['Game']['Officials']:
@@ -271,11 +332,10 @@ def parse_officials(team, slug, season, game_id):
     return officials
 
 def parse_plays(team, slug, season, game_id):
+    return play_rows(team, game_id, parse_game_json(slug, season, game_id))
+
+def play_rows(team, game_id, game_json):
     plays = []
-    try:
-        game_json = parse_game_json(slug, season, game_id)
-    except:
-        raise
     if game_json and game_json['Plays'] != '':
         for play in game_json['Plays']:
             if play['Player'] == None:
@@ -295,11 +355,10 @@ def parse_plays(team, slug, season, game_id):
     return plays
 
 def parse_layups(team, slug, season, game_id):
+    return layup_rows(team, game_id, parse_game_json(slug, season, game_id))
+
+def layup_rows(team, game_id, game_json):
     layups = []
-    try:
-        game_json = parse_game_json(slug, season, game_id)
-    except:
-        raise
     if game_json and game_json['Plays'] != '':
         for play in game_json['Plays']:
             if play['Type'] == 'LAYUP':
@@ -333,19 +392,18 @@ def parse_wmt_layups(team, slug, season, game_id):
     Returns:
         List of layup records: [ncaa_id, game_id, date, team_name, opponent, action, period, seconds, uniform, play_id]
     """
-    layups = []
     try:
-        # Load JSON from wbb-game-data directory
-        json_path = os.path.expanduser(f"~/code/wbb-game-data/{slug}/{season}/{game_id}.json")
-        with open(json_path, 'r') as f:
-            game_json = json.load(f)
+        game_json = STORE.read(slug, season, game_id)
     except FileNotFoundError:
-        print(f"File not found: {json_path}")
-        return layups
+        print(f"File not found: {STORE.path(slug, season, game_id)}")
+        return []
     except Exception as e:
         print(f"Error loading game {game_id}: {e}")
         raise
-    
+    return wmt_layup_rows(team, game_id, game_json)
+
+def wmt_layup_rows(team, game_id, game_json):
+    layups = []
     if not game_json or 'data' not in game_json:
         return layups
     
@@ -433,117 +491,230 @@ def parse_wmt_layups(team, slug, season, game_id):
     
     return layups
 
-def get_all_turnovers(season):
-    teams_json = json.loads(open('/Users/dwillis/code/wbb/ncaa/teams.json').read())
-    with open(f"turnovers_{season}.csv", 'w') as output_file:
-        csv_file = csv.writer(output_file)
-        csv_file.writerow(['ncaa_id', 'game_id', 'date', 'team', 'opponent', 'period', 'seconds', 'player', 'play_id'])
-        for team in teams_json:
-            print(team['ncaa_id'])
-            slug = slugify(team)
-            try:
-                os.chdir(f"/Users/dwillis/code/wbb-game-data/{slug}/{season}")
-            except:
-                continue
-            for root, dirs, files in os.walk(".", topdown=False):
-                for file in files:
-                    if file == '.DS_Store':
-                        continue
-                    game_id = file.split('.')[0]
-                    print(game_id)
-                    turnovers = parse_turnovers(team, slug, season, game_id)
-                    for turnover in turnovers:
-                        csv_file.writerow(turnover)
+def any_layup_rows(team, game_id, game_json):
+    # Livestats games first; WMT games (no 'Plays') fall through to the WMT parser
+    try:
+        return layup_rows(team, game_id, game_json)
+    except Exception as e:
+        print(f"Error with parse_layups for game {game_id}, trying parse_wmt_layups: {e}")
+        return wmt_layup_rows(team, game_id, game_json)
+
+# Season CSVs built from game JSON: output path, header and the row builder run on each parsed game.
+# register_extractor() adds more; extract_season() fills any set of them from one read of each game.
+# A game stored under both teams is extracted once, except by per_team extractors whose rows depend on the team.
+EXTRACTORS = {
+    'turnovers': {
+        'path': "turnovers_{season}.csv",
+        'header': ['ncaa_id', 'game_id', 'date', 'team', 'opponent', 'period', 'seconds', 'player', 'play_id'],
+        'rows': turnover_rows,
+    },
+    'layups': {
+        'path': "/Users/dwillis/code/wbb/ncaa/layups_{season}.csv",
+        'header': ['ncaa_id', 'game_id', 'date', 'team', 'opponent', 'action', 'period', 'seconds', 'player', 'play_id'],
+        'rows': any_layup_rows,
+        'per_team': True,
+    },
+    'officials': {
+        'path': "/Users/dwillis/code/wbb/ncaa/officials_{season}.csv",
+        'header': ['ncaa_id', 'game_id', 'date', 'home', 'home_fouls', 'home_technicals', 'visitor', 'visitor_fouls', 'visitor_technicals', 'officials'],
+        'rows': official_rows,
+    },
+    'plays': {
+        'path': "/Users/dwillis/code/wbb/ncaa/plays_{season}.csv",
+        'header': ['ncaa_id', 'game_id', 'date', 'team', 'opponent', 'type', 'action', 'period', 'seconds', 'player', 'play_id'],
+        'rows': play_rows,
+    },
+}
+
+def register_extractor(name, path, header, rows, per_team=False):
+    """
+    Add a season CSV to extract_season.
+
+    Args:
+        name: Extractor name, e.g. 'fouls'
+        path: Output path, with {season} filled in
+        header: CSV header row
+        rows: Function (team, game_id, game_json) returning a list of rows
+        per_team: Run on every team's copy of a game, not just the first (rows depend on the team)
+    """
+    EXTRACTORS[name] = {'path': path, 'header': header, 'rows': rows, 'per_team': per_team}
 
-def get_all_layups(season, ncaa_id=None):
+def load_teams(ncaa_id=None):
     teams_json = json.loads(open('/Users/dwillis/code/wbb/ncaa/teams.json').read())
-    
-    # Filter to single team if ncaa_id provided
     if ncaa_id:
         teams_json = [t for t in teams_json if t['ncaa_id'] == ncaa_id]
         if not teams_json:
             print(f"Warning: Team ID {ncaa_id} not found in teams.json")
+    return teams_json
+
+def extract_season(season, extractors=None, ncaa_id=None, jobs=1, dedupe=True):
+    """
+    Write season CSVs for several extractors in one sweep over the stored games.
+
+    Each game file is read and parsed once and handed to every extractor,
+    instead of once per get_all_* function. With jobs > 1 the teams are
+    spread over a process pool; each team is written to its own shard files,
+    which are concatenated in teams.json order, so the output is the same
+    as a single-process run.
+
+    A game stored for both teams (the same object in the store, or the same
+    date, start and teams under different game IDs) is only extracted for
+    the first team in teams.json order, so its rows aren't written twice;
+    per_team extractors such as layups still see every team's copy.
+
+    Args:
+        season: Season string (e.g., '2024-25')
+        extractors: Names from EXTRACTORS (default: all of them)
+        ncaa_id: Only this team, if given
+        jobs: Worker processes (default: 1, no pool)
+        dedupe: Extract games stored under several teams once (default: True)
+
+    Returns:
+        dict: Output path written for each extractor
+    """
+    validate_season(season)
+    names = extractors or list(EXTRACTORS)
+    paths = {name: EXTRACTORS[name]['path'].format(season=season) for name in names}
+    teams = load_teams(ncaa_id)
+    if ncaa_id and not teams:
+        return {}
+    if jobs > 1 and len(teams) > 1:
+        extract_teams_parallel(teams, season, names, paths, jobs, dedupe)
+    else:
+        extract_teams(teams, season, names, paths, dedupe)
+    return paths
+
+def extract_teams_parallel(teams, season, names, paths, jobs, dedupe=True):
+    """extract_teams over a pool of jobs processes, one shard per team, merged in input order"""
+    # Workers may be spawned rather than forked, so they get the store root and extractors explicitly
+    specs = {name: EXTRACTORS[name] for name in names}
+    with tempfile.TemporaryDirectory(prefix=f"extract-{season}-") as shard_dir:
+        shards = [{name: os.path.join(shard_dir, f"{i:05d}-{name}.csv") for name in names}
+                  for i in range(len(teams))]
+        tasks = [(STORE.root, specs, team, season, names, shard_paths) for team, shard_paths in zip(teams, shards)]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # Shards are extracted without dedupe; duplicates across teams are dropped while merging
+            games = list(executor.map(extract_shard, tasks))
+        if dedupe:
+            merge_shards_deduped(shards, games, names, paths)
             return
-    
-    with open(f"/Users/dwillis/code/wbb/ncaa/layups_{season}.csv", 'w') as output_file:
-        csv_file = csv.writer(output_file)
-        csv_file.writerow(['ncaa_id', 'game_id', 'date', 'team', 'opponent', 'action', 'period', 'seconds', 'player', 'play_id'])
-        for team in teams_json:
+        for name in names:
+            with open(paths[name], 'w', newline='') as output_file:
+                csv.writer(output_file).writerow(EXTRACTORS[name]['header'])
+                for shard_paths in shards:
+                    with open(shard_paths[name], newline='') as shard:
+                        shard.readline()  # header
+                        shutil.copyfileobj(shard, output_file)
+
+def merge_shards_deduped(shards, games, names, paths):
+    """Concatenate shards, keeping each game's rows only from the first team it was seen for, like extract_teams"""
+    files = {name: open(paths[name], 'w', newline='') for name in names}
+    try:
+        writers = {name: csv.writer(f) for name, f in files.items()}
+        for name in names:
+            writers[name].writerow(EXTRACTORS[name]['header'])
+        seen = set()
+        for shard_paths, shard_games in zip(shards, games):
+            readers = {name: open(shard_paths[name], newline='') for name in names}
+            try:
+                rows = {name: csv.reader(f) for name, f in readers.items()}
+                for name in names:
+                    next(rows[name])  # header
+                for identities, counts in shard_games:
+                    duplicate = not seen.isdisjoint(identities)
+                    seen.update(identities)
+                    for name in names:
+                        game_rows = [next(rows[name]) for _ in range(counts.get(name, 0))]
+                        if not duplicate or EXTRACTORS[name].get('per_team'):
+                            writers[name].writerows(game_rows)
+            finally:
+                for f in readers.values():
+                    f.close()
+    finally:
+        for f in files.values():
+            f.close()
+
+def extract_shard(task):
+    global STORE
+    root, specs, team, season, names, shard_paths = task
+    if STORE.root != root:
+        STORE = GameStore(root)
+    EXTRACTORS.update(specs)
+    return extract_teams([team], season, names, shard_paths, dedupe=False)
+
+def game_identities(slug, season, game_id, game_json=None):
+    """What identifies a stored game across teams: the file it resolves to and, once read, its game_key"""
+    identities = {os.path.realpath(STORE.path(slug, season, game_id))}
+    key = GameStore.game_key(game_json)
+    if key:
+        identities.add(key)
+    return identities
+
+def extract_teams(teams, season, names, paths, dedupe=True):
+    """
+    Run the named extractors over every stored game of teams, writing each to its path with a header.
+
+    With dedupe, a game already seen for an earlier team only goes to per_team
+    extractors, and isn't read at all if there are none.
+
+    Returns:
+        list: (identities, {extractor: rows written}) for each game extracted, in order
+    """
+    files = {name: open(paths[name], 'w', newline='') for name in names}
+    try:
+        writers = {name: csv.writer(f) for name, f in files.items()}
+        for name in names:
+            writers[name].writerow(EXTRACTORS[name]['header'])
+        per_team = [name for name in names if EXTRACTORS[name].get('per_team')]
+        seen = set()
+        games = []
+        for team in teams:
             print(team['ncaa_id'])
             slug = slugify(team)
-            try:
-                os.chdir(f"/Users/dwillis/code/wbb-game-data/{slug}/{season}")
-            except FileNotFoundError:
-                print(f"Directory not found: /Users/dwillis/code/wbb-game-data/{slug}/{season}")
-                continue
-            except Exception as e:
-                print(f"Error accessing directory for {slug}: {e}")
-                continue
-            for root, dirs, files in os.walk(".", topdown=False):
-                for file in files:
-                    if file == '.DS_Store':
-                        continue
-                    game_id = file.split('.')[0]
-#                    print(game_id)
+            for game_id in STORE.game_ids(slug, season):
+                print(game_id)
+                active = names
+                if dedupe and not seen.isdisjoint(game_identities(slug, season, game_id)):
+                    if not per_team:
+                        continue  # same object as a game already extracted
+                    active = per_team
+                try:
+                    game_json = STORE.read(slug, season, game_id)
+                except ValueError as e:
+                    print(f"Error loading game {game_id}: {e}")
+                    continue
+                identities = game_identities(slug, season, game_id, game_json)
+                if dedupe and active is names and not seen.isdisjoint(identities):
+                    active = per_team  # same game under another team's game ID
+                seen.update(identities)
+                counts = {}
+                for name in active:
                     try:
-                        layups = parse_layups(team, slug, season, game_id)
-                        for layup in layups:
-                            csv_file.writerow(layup)
+                        rows = EXTRACTORS[name]['rows'](team, game_id, game_json)
                     except Exception as e:
-                        print(f"Error with parse_layups for game {game_id}, trying parse_wmt_layups: {e}")
-                        try:
-                            layups = parse_wmt_layups(team, slug, season, game_id)
-                            for layup in layups:
-                                csv_file.writerow(layup)
-                        except Exception as e2:
-                            print(f"Error with parse_wmt_layups for game {game_id}: {e2}")
-
-def get_all_officials(season):
-    teams_json = json.loads(open('/Users/dwillis/code/wbb/ncaa/teams.json').read())
-    with open(f"/Users/dwillis/code/wbb/ncaa/officials_{season}.csv", 'w') as output_file:
-        csv_file = csv.writer(output_file)
-        csv_file.writerow(['ncaa_id', 'game_id', 'date', 'home', 'home_fouls', 'home_technicals', 'visitor', 'visitor_fouls', 'visitor_technicals', 'officials'])
-        for team in teams_json:
-            print(team['ncaa_id'])
-            slug = slugify(team)
-            try:
-                os.chdir(f"/Users/dwillis/code/wbb-game-data/{slug}/{season}")
-            except:
-                continue
-            for root, dirs, files in os.walk(".", topdown=False):
-                for file in files:
-                    if file == '.DS_Store':
+                        print(f"Error extracting {name} from game {game_id}: {e}")
                         continue
-                    game_id = file.split('.')[0]
-                    print(game_id)
-                    officials = parse_officials(team, slug, season, game_id)
-                    for official in officials:
-                        csv_file.writerow(official)
+                    writers[name].writerows(rows)
+                    counts[name] = len(rows)
+                games.append((identities, counts))
+        return games
+    finally:
+        for f in files.values():
+            f.close()
 
-def get_all_plays(season):
-    teams_json = json.loads(open('/Users/dwillis/code/wbb/ncaa/teams.json').read())
-    with open(f"/Users/dwillis/code/wbb/ncaa/plays_{season}.csv", 'w') as output_file:
-        csv_file = csv.writer(output_file)
-        csv_file.writerow(['ncaa_id', 'game_id', 'date', 'team', 'opponent', 'type', 'action', 'period', 'seconds', 'player', 'play_id'])
-        for team in teams_json:
-            print(team['ncaa_id'])
-            slug = slugify(team)
-            try:
-                os.chdir(f"/Users/dwillis/code/wbb-game-data/{slug}/{season}")
-            except:
-                continue
-            for root, dirs, files in os.walk(".", topdown=False):
-                for file in files:
-                    if file == '.DS_Store':
-                        continue
-                    game_id = file.split('.')[0]
-                    print(game_id)
-                    plays = parse_plays(team, slug, season, game_id)
-                    for play in plays:
-                        csv_file.writerow(play)
+def get_all_turnovers(season, jobs=1):
+    extract_season(season, ['turnovers'], jobs=jobs)
+
+def get_all_layups(season, ncaa_id=None, jobs=1):
+    extract_season(season, ['layups'], ncaa_id, jobs=jobs)
+
+def get_all_officials(season, jobs=1):
+    extract_season(season, ['officials'], jobs=jobs)
+
+def get_all_plays(season, jobs=1):
+    extract_season(season, ['plays'], jobs=jobs)
 
 def count_game_files_all_seasons():
-    base_path = "/Users/dwillis/code/wbb-game-data"
     teams_json = json.loads(open('/Users/dwillis/code/wbb/ncaa/teams.json').read())
 
     # Regex to match valid season folders like "2024-25"
@@ -555,30 +726,18 @@ def count_game_files_all_seasons():
     all_seasons = set()
     team_season_counts = {}
 
-    for slug in os.listdir(base_path):
-        team_path = os.path.join(base_path, slug)
-        if not os.path.isdir(team_path) or slug not in slug_to_team:
+    for slug in STORE.slugs():
+        if slug not in slug_to_team:
             continue
 
         team_season_counts[slug] = {}
 
-        for season in os.listdir(team_path):
+        for season in STORE.seasons(slug):
             if not season_pattern.match(season):
                 continue  # skip non-season folders
 
-            season_path = os.path.join(team_path, season)
-            if not os.path.isdir(season_path):
-                continue
-
             all_seasons.add(season)
-
-            try:
-                files = os.listdir(season_path)
-                game_files = [f for f in files if f.endswith('.json') and not f.startswith('.')]
-                team_season_counts[slug][season] = len(game_files)
-            except Exception as e:
-                print(f"Error reading {season_path}: {e}")
-                team_season_counts[slug][season] = 0
+            team_season_counts[slug][season] = len(STORE.game_ids(slug, season))
 
     all_seasons = sorted(all_seasons)
 
@@ -609,3 +768,32 @@ def get_teams_with_zero_games(season, file_path="game_file_counts_all_seasons.cs
         raise ValueError(f"Season '{season}' not found in the data.")
 
     return df[df[season] == 0]['team_name'].tolist()
+
+def main():
+    parser = argparse.ArgumentParser(description='Build season CSVs (turnovers, layups, officials, plays) from stored game JSON')
+    parser.add_argument('season', help='Season (e.g., "2024-25")')
+    parser.add_argument('--extractors', nargs='*', choices=list(EXTRACTORS),
+                        help='CSVs to build in one pass over the games (default: all)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes to spread the teams over (default: 1)')
+    parser.add_argument('--team', type=int, help='Only this NCAA team ID')
+    parser.add_argument('--keep-duplicates', action='store_true',
+                        help="Extract games stored under both teams once per team (default: only the first team's copy)")
+    parser.add_argument('--data-dir', help='Game data root (default: $WBB_GAME_DATA or /Users/dwillis/code/wbb-game-data)')
+    args = parser.parse_args()
+
+    try:
+        validate_season(args.season)
+    except ValueError as e:
+        parser.error(str(e))
+
+    global STORE
+    if args.data_dir:
+        STORE = GameStore(args.data_dir)
+    paths = extract_season(args.season, args.extractors, args.team, jobs=args.jobs,
+                           dedupe=not args.keep_duplicates)
+    for name, path in paths.items():
+        print(f"Wrote {name} to {path}")
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,9 @@
-import os
 import requests
 from bs4 import BeautifulSoup
 import json
+from game_store import GameStore
+
+STORE = GameStore()
 
 def slugify(team):
     slug = str(team['ncaa_id'])+'-'+team['team'].lower().replace(" ","-").replace('.','').replace(',','').replace("'","").replace(')','').replace('(','')
@@ -116,13 +118,5 @@ def get_plays(id, team, season):
     game = response.json()
     if 'data' in game['data']['plays']:
         slug = slugify(team)
-        # Base directory for JSON files
-        base_dir = os.path.expanduser("~/code/wbb-game-data")
-        # Create directory structure: base_dir/slug/season/
-        season_dir = os.path.join(base_dir, slug, season)
-        os.makedirs(season_dir, exist_ok=True)
-
-        json_file_path = os.path.join(season_dir, f'{id}.json')
-        with open(json_file_path, 'w') as json_file:
-            json.dump(game, json_file, indent=4)
+        json_file_path = STORE.write(slug, season, id, game)
         print(f"Saved: {json_file_path}")
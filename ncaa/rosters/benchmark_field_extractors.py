@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark FieldExtractors against the original uncompiled implementations.
+
+Usage:
+    cd ncaa/rosters
+    uv run python benchmark_field_extractors.py                       # all rosters_*.csv files here
+    uv run python benchmark_field_extractors.py rosters_2025-26.csv --repeat 3
+
+Every field of every row (plus label-prefixed and combined variants such as
+"Hometown: Austin, Texas" and "#12 Jane Doe") is run through both versions.
+The script exits non-zero if any output differs, then prints the time each
+version takes over the whole corpus.
+"""
+
+import argparse
+import csv
+import glob
+import re
+import sys
+import time
+from typing import Dict
+
+from rosters import FieldExtractors
+
+
+class LegacyFieldExtractors:
+    """The pre-compilation implementations, kept verbatim as the reference"""
+
+    @staticmethod
+    def extract_jersey_number(text: str) -> str:
+        patterns = [
+            r'Jersey Number (\d+)',
+            r'#(\d{1,2})\b',
+            r'\b(\d{1,2})\s+(?=\w)',  # Number followed by name
+        ]
+
+        for pattern in patterns:
+            match = re.search(pattern, text)
+            if match:
+                return match.group(1)
+        return ''
+
+    @staticmethod
+    def extract_height(text: str) -> str:
+        patterns = [
+            r"(\d+'\s*\d+\")",     # 6'2"
+            r"(\d+[′']\s*\d+[″\"])", # Unicode quotes
+            r"Height:\s*([^,\n]+)", # Height: label format
+        ]
+
+        for pattern in patterns:
+            match = re.search(pattern, text)
+            if match:
+                return match.group(1).strip()
+        return ''
+
+    @staticmethod
+    def parse_hometown_school(text: str) -> Dict[str, str]:
+        result = {'hometown': '', 'high_school': '', 'previous_school': ''}
+
+        if not text:
+            return result
+
+        text = re.sub(r'\s*(Instagram|Twitter|Opens in a new window).*$', '', text)
+        text = re.sub(r'\s+', ' ', text).strip()
+
+        if ' / ' in text:
+            parts = [p.strip() for p in text.split(' / ')]
+            if len(parts) >= 1:
+                result['hometown'] = parts[0]
+            if len(parts) >= 2 and parts[1]:
+                result['high_school'] = parts[1]
+            if len(parts) >= 3 and parts[2]:
+                result['previous_school'] = parts[2]
+            return result
+
+        state_pattern = r'(.+?),\s*([A-Z][a-z]+\.?|[A-Z]{2})\s+(.*)'
+        match = re.match(state_pattern, text)
+
+        if match:
+            city, state, school_info = match.groups()
+            result['hometown'] = f"{city.strip()}, {state.strip()}"
+
+            college_indicators = ['University', 'College', 'State', 'Tech']
+            for indicator in college_indicators:
+                if indicator in school_info:
+                    parts = school_info.split(indicator, 1)
+                    result['high_school'] = parts[0].strip()
+                    result['previous_school'] = (indicator + parts[1]).strip()
+                    break
+            else:
+                result['high_school'] = school_info.strip()
+        else:
+            result['hometown'] = text
+
+        return result
+
+    @staticmethod
+    def clean_text(text: str) -> str:
+        if not text:
+            return ""
+        cleaned = re.sub(r'\s+', ' ', text.strip())
+        cleaned = re.sub(r'\s*(Full Bio|Instagram|Twitter|Opens in a new window).*$', '', cleaned)
+        cleaned = LegacyFieldExtractors.clean_field_labels(cleaned)
+        return cleaned
+
+    @staticmethod
+    def clean_field_labels(text: str) -> str:
+        if not text:
+            return text
+
+        patterns = [
+            r'^\s*Hometown / Previous School / High School:\s*', r'\bHometown / Previous School / High School:\s*',
+            r'^Hometown / Previous School /\s*', r'\bHometown / Previous School /\s*',
+            r'^Hometown/High School \(Former School\):\s*', r'\bHometown/High School \(Former School\):\s*',
+            r'^Hometown / High School:\s*', r'\bHometown / High School:\s*',
+            r'^High School/Previous School:\s*', r'\bHigh School/Previous School:\s*',
+            r'^High School/\s*', r'\bHigh School/\s*',
+            r'^Hometown/\s*', r'\bHometown/\s*',
+            r'\bClass:\s*', r'\bPrevious College:\s*',
+            r'\bPrevious School:\s*', r'\bHt\.:\s*', r'\bPos\.:\s*', r'^High school:\s*',
+            r'\bNo\.:\s*', r'\bYr\.:\s*', r'^No\.:\s*', r'^Yr\.:\s*',
+            r'\bCl\.:\s*', r'^Cl\.:\s*',
+            r'^\s*Hometown\s*:?\s*$',
+            r'\bHigh school:\s*', r'\bHometown:\s*', r'^Hometown:\s*'
+        ]
+
+        for p in patterns:
+            text = re.sub(p, '', text, flags=re.IGNORECASE).strip()
+
+        words = text.split()
+        if len(words) >= 4:
+            half = len(words) // 2
+            if words[:half] == words[half:half*2]:
+                text = ' '.join(words[:half])
+
+        return text
+
+
+LABELS = ['Class:', 'Hometown:', 'HOMETOWN', 'High school:', 'Ht.:', 'Pos.:', 'No.:', 'Yr.:', 'Cl.:',
+          'Previous School:', 'Previous College:', 'Hometown / High School:', 'Hometown/', 'High School/',
+          'Hometown / Previous School / High School:', 'Hometown/High School (Former School):']
+
+
+def load_corpus(paths):
+    """Field values from roster CSVs plus the labelled and combined strings scrapers see"""
+    texts = []
+    for path in paths:
+        with open(path, newline='', encoding='utf-8') as f:
+            for i, row in enumerate(csv.DictReader(f)):
+                values = [row.get(field) or '' for field in
+                          ('jersey', 'name', 'position', 'height', 'academic_year', 'hometown', 'high_school',
+                           'previous_school')]
+                texts.extend(values)
+                label = LABELS[i % len(LABELS)]
+                texts.append(f"{label} {values[5]}")
+                texts.append(f"  {values[1]} {values[1]}  Full Bio")
+                texts.append(f"#{values[0]} {values[1]} Height: {values[3]}")
+                texts.append(f"Jersey Number {values[0]} {values[4]} Instagram")
+                texts.append(f"{values[5]} / {values[6]} / {values[7]}")
+                texts.append(f"{values[5]} {values[6]} {values[7]} Twitter")
+    return texts
+
+
+FUNCTIONS = ['clean_field_labels', 'clean_text', 'extract_jersey_number', 'extract_height', 'parse_hometown_school']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare compiled FieldExtractors with the original implementation')
+    parser.add_argument('paths', nargs='*', help='Roster CSV files (default: rosters_*.csv)')
+    parser.add_argument('--repeat', type=int, default=1, help='Passes over the corpus per timing (default: 1)')
+    args = parser.parse_args()
+
+    texts = load_corpus(args.paths or sorted(glob.glob('rosters_*.csv')))
+    print(f"Corpus: {len(texts):,} strings")
+
+    mismatches = 0
+    for name in FUNCTIONS:
+        legacy, current = getattr(LegacyFieldExtractors, name), getattr(FieldExtractors, name)
+        for text in texts:
+            if legacy(text) != current(text):
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"MISMATCH {name}({text!r}): {legacy(text)!r} != {current(text)!r}")
+    if mismatches:
+        sys.exit(f"{mismatches} mismatched outputs")
+    print(f"Outputs identical for {len(FUNCTIONS)} functions")
+
+    print(f"\n{'function':<24} {'legacy':>10} {'compiled':>10} {'speedup':>8}")
+    for name in FUNCTIONS:
+        timings = []
+        for impl in (LegacyFieldExtractors, FieldExtractors):
+            func = getattr(impl, name)
+            FieldExtractors.clean_field_labels.cache_clear()  # time from a cold cache
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                for text in texts:
+                    func(text)
+            timings.append(time.perf_counter() - start)
+        print(f"{name:<24} {timings[0]:9.2f}s {timings[1]:9.2f}s {timings[0] / timings[1]:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTML parser backends used by rosters.py on recorded pages.
+
+Usage:
+    cd ncaa/rosters
+    uv run python benchmark_parsers.py pages/            # directory of .html files
+    uv run python benchmark_parsers.py .http-cache/      # an HTTPCache directory (--cache-dir)
+    uv run python benchmark_parsers.py page1.html page2.html --repeat 10
+    uv run python benchmark_parsers.py pages/ --scope standard   # SoupStrainer-scoped parse (--scoped-parse)
+
+Each page is parsed with every installed backend and then queried the way the
+Sidearm scraper does (roster list items, table rows, text extraction). The
+report shows the median parse and query time per page in milliseconds.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from rosters import HTML_PARSERS, LXML_AVAILABLE, PARSE_SCOPES, SELECTOLAX_AVAILABLE, make_soup
+
+
+def load_pages(paths):
+    """Collect page bodies from files and directories (.html, .htm and HTTPCache .body files)"""
+    pages = []
+    for path in map(Path, paths):
+        files = sorted(p for p in path.rglob('*') if p.suffix in ('.html', '.htm', '.body')) if path.is_dir() else [path]
+        for file in files:
+            pages.append((file.name, file.read_bytes().decode('utf-8', errors='replace')))
+    return pages
+
+
+def query(soup):
+    """Run the lookups a roster scrape performs on a parsed page"""
+    items = soup.find_all('li', class_='sidearm-roster-player') or soup.select('table tr')
+    for item in items:
+        item.get_text(separator=' ', strip=True)
+        link = item.find('a')
+        if link:
+            link.get('href', '')
+    soup.find('script', id='__NUXT_DATA__')
+    return len(items)
+
+
+def time_backend(markup, backend, repeat, parse_only=None):
+    parse_times, query_times = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        soup = make_soup(markup, backend, parse_only=parse_only)
+        parsed = time.perf_counter()
+        query(soup)
+        parse_times.append(parsed - start)
+        query_times.append(time.perf_counter() - parsed)
+    return statistics.median(parse_times) * 1000, statistics.median(query_times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare HTML parser backends on recorded roster pages')
+    parser.add_argument('paths', nargs='+', help='HTML files or directories of recorded pages')
+    parser.add_argument('--repeat', type=int, default=5, help='Parses per page and backend (default: 5)')
+    parser.add_argument('--scope', choices=sorted(PARSE_SCOPES),
+                        help='Parse only the subtrees this scraper type needs (selectolax always parses everything)')
+    args = parser.parse_args()
+
+    available = {'html.parser': True, 'lxml': LXML_AVAILABLE, 'selectolax': SELECTOLAX_AVAILABLE}
+    backends = [name for name in HTML_PARSERS if available[name]]
+    skipped = [name for name in HTML_PARSERS if not available[name]]
+    if skipped:
+        print(f"Skipping backends that are not installed: {', '.join(skipped)}")
+
+    pages = load_pages(args.paths)
+    if not pages:
+        sys.exit('No pages found')
+
+    totals = {backend: [] for backend in backends}
+    print(f"{'page':<40} {'KB':>7} " + ' '.join(f"{backend:>22}" for backend in backends))
+    for name, markup in pages:
+        cells = []
+        for backend in backends:
+            parse_ms, query_ms = time_backend(markup, backend, args.repeat, PARSE_SCOPES.get(args.scope))
+            totals[backend].append(parse_ms + query_ms)
+            cells.append(f"{parse_ms:9.1f} + {query_ms:7.1f} ms")
+        print(f"{name[:40]:<40} {len(markup) / 1024:7.0f} " + ' '.join(f"{cell:>22}" for cell in cells))
+
+    print()
+    baseline = statistics.mean(totals['html.parser'])
+    for backend in backends:
+        mean = statistics.mean(totals[backend])
+        print(f"{backend:<12} mean {mean:8.1f} ms/page  ({baseline / mean:4.1f}x html.parser)")
+
+
+if __name__ == '__main__':
+    main()
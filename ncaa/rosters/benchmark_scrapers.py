@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Benchmark every roster scraper type offline against a recorded page archive.
+
+Usage:
+    cd ncaa/rosters
+    uv run python rosters.py -season 2025-26 --record archive/2025-26      # record the corpus once
+    uv run python benchmark_scrapers.py archive/2025-26 -season 2025-26 --output bench.json
+    uv run python benchmark_scrapers.py archive/2025-26 -season 2025-26 --compare bench.json
+    uv run python benchmark_scrapers.py archive/2025-26 -season 2025-26 -teams 8 51 164 --repeat 5
+
+Each team in the archive is scraped the way a run does it (scraper,
+season check, CSV row cleanup) with pages replayed from the archive, so
+timings are deterministic and never touch the network. For each scraper
+type the report shows pages/sec, players/sec, peak traced memory and the
+exclusive time spent in each phase:
+
+    fetch    reading responses (here: from the archive)
+    parse    building soups (make_soup)
+    verify   SeasonVerifier and the season check
+    extract  scraper code finding and reading roster elements
+    clean    FieldExtractors and CSV row post-processing
+
+Results are written as JSON; --compare prints the change against an
+earlier results file, e.g. one saved before a parser change.
+"""
+
+import argparse
+import functools
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+import rosters
+from rosters import (FieldExtractors, JavaScriptScraper, PageArchive, PageCache, RosterManager, ScrapeContext,
+                     SeasonVerifier, StandardScraper, TableScraper, TeamConfig, VueDataScraper, set_html_parser,
+                     HTML_PARSERS)
+
+PHASES = ('fetch', 'parse', 'verify', 'extract', 'clean')
+CLEAN_FUNCTIONS = ('clean_text', 'clean_field_labels', 'extract_height', 'extract_jersey_number',
+                   'parse_hometown_school', 'normalize_academic_year')
+
+
+class PhaseTimer:
+    """Exclusive wall time per phase; a nested phase pauses the phase that called it"""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self.calls = defaultdict(int)
+        self._stack = []
+
+    def reset(self):
+        self.totals.clear()
+        self.calls.clear()
+
+    def wrap(self, phase, func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            now = time.perf_counter()
+            if self._stack:
+                self.totals[self._stack[-1][0]] += now - self._stack[-1][1]
+            self._stack.append([phase, now])
+            self.calls[phase] += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                name, started = self._stack.pop()
+                self.totals[name] += end - started
+                if self._stack:
+                    self._stack[-1][1] = end
+        return timed
+
+
+def instrument(timer):
+    """Wrap the functions behind each phase; returns the uninstrumented clean_field_labels cache"""
+    label_cache = FieldExtractors.clean_field_labels
+    ScrapeContext.get = timer.wrap('fetch', ScrapeContext.get)
+    for name in ('rendered', 'script_result'):
+        setattr(PageArchive, name, timer.wrap('fetch', getattr(PageArchive, name)))
+    rosters.make_soup = timer.wrap('parse', rosters.make_soup)
+    for name in ('verify_season_on_page', 'is_sidearm_site'):
+        setattr(SeasonVerifier, name, staticmethod(timer.wrap('verify', getattr(SeasonVerifier, name))))
+    RosterManager._verify_team_season = timer.wrap('verify', RosterManager._verify_team_season)
+    for scraper_class in (StandardScraper, TableScraper, JavaScriptScraper, VueDataScraper):
+        scraper_class.scrape_roster = timer.wrap('extract', scraper_class.scrape_roster)
+    for name in CLEAN_FUNCTIONS:
+        setattr(FieldExtractors, name, staticmethod(timer.wrap('clean', getattr(FieldExtractors, name))))
+    RosterManager._csv_row = timer.wrap('clean', RosterManager._csv_row)
+    return label_cache
+
+
+def scrape_teams(manager, archive, teams, season):
+    """Scrape teams as a run would, with a fresh page cache per team; returns the number of players"""
+    players = 0
+    for team in teams:
+        manager.context = ScrapeContext(page_cache=PageCache(), archive=archive)
+        roster = manager.scrape_team_roster(team, season)
+        manager._verify_team_season(team, season)
+        for player in roster:
+            manager._csv_row(player)
+        players += len(roster)
+    return players
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(results, previous):
+    print(f"\nCompared with {previous.get('commit') or 'previous results'}:")
+    print(f"{'scraper':<12} {'pages/s':>16} {'players/s':>18}")
+    for scraper_type, current in results['scrapers'].items():
+        before = previous.get('scrapers', {}).get(scraper_type)
+        if not before or not before['pages_per_sec']:
+            continue
+        change = current['pages_per_sec'] / before['pages_per_sec'] - 1
+        players_change = (current['players_per_sec'] / before['players_per_sec'] - 1
+                          if before['players_per_sec'] else 0)
+        print(f"{scraper_type:<12} {current['pages_per_sec']:8.1f} ({change:+6.1%}) "
+              f"{current['players_per_sec']:9.1f} ({players_change:+6.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark roster scrapers offline against a --record archive')
+    parser.add_argument('archive', help='Directory written by rosters.py --record')
+    parser.add_argument('-season', required=True, help='Season the archive was recorded for (e.g., "2025-26")')
+    parser.add_argument('-teams', nargs='*', type=int, help='Team IDs to include (default: all teams)')
+    parser.add_argument('--teams-file', help='teams.json to read team URLs from (default: RosterManager default)')
+    parser.add_argument('-entity', '--entity-type', choices=['player', 'coach'], default='player')
+    parser.add_argument('--parser', choices=HTML_PARSERS, default=rosters.HTML_PARSER, help='HTML parser backend')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes over the corpus (default: 3)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass for peak memory')
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument('--compare', help='Earlier results JSON to compare against')
+    args = parser.parse_args()
+
+    rosters.logger.setLevel('ERROR')
+    set_html_parser(args.parser)
+    archive = PageArchive(args.archive, replay=True)
+    manager_kwargs = {'teams_file': args.teams_file} if args.teams_file else {}
+    manager = RosterManager(entity_type=args.entity_type, context=ScrapeContext(archive=archive), **manager_kwargs)
+
+    by_type = defaultdict(list)
+    for team in manager.get_teams(args.teams):
+        by_type[TeamConfig.get_config(team['ncaa_id'])['type']].append(team)
+    if not by_type:
+        sys.exit('No teams to benchmark')
+
+    timer = PhaseTimer()
+    label_cache = instrument(timer)
+
+    results = {'commit': git_commit(), 'parser': args.parser, 'season': args.season,
+               'entity_type': args.entity_type, 'repeat': args.repeat, 'scrapers': {}}
+    for scraper_type, teams in sorted(by_type.items()):
+        timer.reset()
+        label_cache.cache_clear()  # every type starts from a cold label cache
+        start = time.perf_counter()
+        players = 0
+        for _ in range(args.repeat):
+            players += scrape_teams(manager, archive, teams, args.season)
+        elapsed = time.perf_counter() - start
+        pages = timer.calls['fetch']
+        phases = {phase: timer.totals[phase] / args.repeat for phase in PHASES}
+
+        peak_mb = None
+        if not args.no_memory:
+            label_cache.cache_clear()
+            tracemalloc.start()
+            scrape_teams(manager, archive, teams, args.season)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+
+        results['scrapers'][scraper_type] = {
+            'teams': len(teams),
+            'pages': pages // args.repeat,
+            'players': players // args.repeat,
+            'seconds': elapsed / args.repeat,
+            'pages_per_sec': pages / elapsed if elapsed else 0,
+            'players_per_sec': players / elapsed if elapsed else 0,
+            'peak_memory_mb': peak_mb,
+            'phases': phases,
+        }
+
+    print(f"{'scraper':<12} {'teams':>6} {'pages':>6} {'players':>8} {'pages/s':>8} {'players/s':>10} {'peak MB':>8}  "
+          + ' '.join(f"{phase:>8}" for phase in PHASES))
+    for scraper_type, result in results['scrapers'].items():
+        peak = f"{result['peak_memory_mb']:8.1f}" if result['peak_memory_mb'] is not None else f"{'-':>8}"
+        print(f"{scraper_type:<12} {result['teams']:6d} {result['pages']:6d} {result['players']:8d} "
+              f"{result['pages_per_sec']:8.1f} {result['players_per_sec']:10.1f} {peak}  "
+              + ' '.join(f"{result['phases'][phase] * 1000:6.0f}ms" for phase in PHASES))
+    print(f"\n{archive.stats()}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            print_comparison(results, json.load(f))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
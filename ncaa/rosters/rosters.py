@@ -7,20 +7,38 @@ A clean, modular scraper for NCAA women's basketball rosters
 import os
 import re
 import csv
+import gzip
 import json
+import time
+import hashlib
 import argparse
 import logging
+import shutil
+import socket
+import sqlite3
 import subprocess
+import queue
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import tldextract
 import urllib3
 
+from wbb.parsers import HTML_PARSERS, html_parser_from_env
+from wbb.ratelimit import HostRateLimiter
+
 # Disable SSL warnings for sites with certificate issues
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -37,15 +55,40 @@ try:
 except ImportError:
     REQUESTS_HTML_AVAILABLE = False
 
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/95.0.4638.69 Safari/537.36'
+# What shot-scraper has always been run with (--user-agent Firefox); pooled browsers send the same
+BROWSER_USER_AGENT = 'Firefox'
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
-    """Player data structure"""
+    """Player data structure (slotted: no per-instance __dict__ across large multi-season runs)"""
     team_id: int
     team: str
     player_id: Optional[str] = None
@@ -62,7 +105,7 @@ class Player:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for CSV output"""
-        d = asdict(self)
+        d = {name: getattr(self, name) for name in self.__slots__}
         # Map 'year' field to 'academic_year' for CSV output
         d['academic_year'] = d.pop('year', '')
         return d
@@ -70,18 +113,58 @@ class Player:
 
 class FieldExtractors:
     """Common utilities for extracting player fields from text and HTML"""
+
+    # Patterns are compiled once here; each list is still tried in order, first match wins
+    JERSEY_PATTERNS = [
+        re.compile(r'Jersey Number (\d+)'),
+        re.compile(r'#(\d{1,2})\b'),
+        re.compile(r'\b(\d{1,2})\s+(?=\w)'),  # Number followed by name
+    ]
+    HEIGHT_PATTERNS = [
+        re.compile(r"(\d+'\s*\d+\")"),     # 6'2"
+        re.compile(r"(\d+[′']\s*\d+[″\"])"), # Unicode quotes
+        re.compile(r"Height:\s*([^,\n]+)"), # Height: label format
+    ]
+    DIGIT = re.compile(r'\d')
+    WHITESPACE = re.compile(r'\s+')
+    SOCIAL_SUFFIX = re.compile(r'\s*(Instagram|Twitter|Opens in a new window).*$')
+    BIO_SUFFIX = re.compile(r'\s*(Full Bio|Instagram|Twitter|Opens in a new window).*$')
+    CITY_STATE = re.compile(r'(.+?),\s*([A-Z][a-z]+\.?|[A-Z]{2})\s+(.*)')
+
+    # Label prefixes stripped by clean_field_labels, applied in order
+    # NOTE: More specific patterns MUST come first to avoid partial matches
+    LABEL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+        # Multi-word patterns first (most specific)
+        r'^\s*Hometown / Previous School / High School:\s*', r'\bHometown / Previous School / High School:\s*',
+        r'^Hometown / Previous School /\s*', r'\bHometown / Previous School /\s*',
+        r'^Hometown/High School \(Former School\):\s*', r'\bHometown/High School \(Former School\):\s*',
+        r'^Hometown / High School:\s*', r'\bHometown / High School:\s*',  # For Olivet-style tables
+        r'^High School/Previous School:\s*', r'\bHigh School/Previous School:\s*',
+        r'^High School/\s*', r'\bHigh School/\s*',
+        # Slash-format labels (Ohio Northern style)
+        r'^Hometown/\s*', r'\bHometown/\s*',  # Match "Hometown/" prefix
+        # Single-word patterns (less specific)
+        r'\bClass:\s*', r'\bPrevious College:\s*',
+        r'\bPrevious School:\s*', r'\bHt\.:\s*', r'\bPos\.:\s*', r'^High school:\s*',
+        r'\bNo\.:\s*', r'\bYr\.:\s*', r'^No\.:\s*', r'^Yr\.:\s*',
+        r'\bCl\.:\s*', r'^Cl\.:\s*',
+        # Match standalone labels (just the word with optional colon)
+        r'^\s*Hometown\s*:?\s*$',  # Match "Hometown" or "Hometown:" as entire cell content
+        # These must be last as they're most general
+        r'\bHigh school:\s*', r'\bHometown:\s*', r'^Hometown:\s*'
+    )]
+    # Every LABEL_PATTERNS entry contains one of these literals, so text without them
+    # cannot match any label and skips the substitution pass entirely
+    LABEL_KEYWORDS = re.compile(r'hometown|high school|class:|previous (?:college|school):|(?:ht|pos|no|yr|cl)\.:',
+                                re.IGNORECASE)
     
     @staticmethod
     def extract_jersey_number(text: str) -> str:
         """Extract jersey number from various text patterns"""
-        patterns = [
-            r'Jersey Number (\d+)',
-            r'#(\d{1,2})\b',
-            r'\b(\d{1,2})\s+(?=\w)',  # Number followed by name
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        if not FieldExtractors.DIGIT.search(text):
+            return ''
+        for pattern in FieldExtractors.JERSEY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         return ''
@@ -89,14 +172,8 @@ class FieldExtractors:
     @staticmethod
     def extract_height(text: str) -> str:
         """Extract height from various formats"""
-        patterns = [
-            r"(\d+'\s*\d+\")",     # 6'2"
-            r"(\d+[′']\s*\d+[″\"])", # Unicode quotes
-            r"Height:\s*([^,\n]+)", # Height: label format
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in FieldExtractors.HEIGHT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return ''
@@ -153,8 +230,8 @@ class FieldExtractors:
             return result
         
         # Clean the text
-        text = re.sub(r'\s*(Instagram|Twitter|Opens in a new window).*$', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = FieldExtractors.SOCIAL_SUFFIX.sub('', text)
+        text = FieldExtractors.WHITESPACE.sub(' ', text).strip()
         
         # Handle format with slashes: "City, State / High School / Previous College"
         if ' / ' in text:
@@ -168,8 +245,7 @@ class FieldExtractors:
             return result
         
         # Pattern: City, State followed by school info
-        state_pattern = r'(.+?),\s*([A-Z][a-z]+\.?|[A-Z]{2})\s+(.*)'
-        match = re.match(state_pattern, text)
+        match = FieldExtractors.CITY_STATE.match(text)
         
         if match:
             city, state, school_info = match.groups()
@@ -197,10 +273,10 @@ class FieldExtractors:
             return ""
 
         # Remove extra whitespace and normalize
-        cleaned = re.sub(r'\s+', ' ', text.strip())
+        cleaned = FieldExtractors.WHITESPACE.sub(' ', text.strip())
 
         # Remove common unwanted elements
-        cleaned = re.sub(r'\s*(Full Bio|Instagram|Twitter|Opens in a new window).*$', '', cleaned)
+        cleaned = FieldExtractors.BIO_SUFFIX.sub('', cleaned)
 
         # Strip common labelled prefixes that appear on some smaller sites (e.g. "Class: Freshman")
         cleaned = FieldExtractors.clean_field_labels(cleaned)
@@ -208,39 +284,22 @@ class FieldExtractors:
         return cleaned
 
     @staticmethod
+    @lru_cache(maxsize=16384)
     def clean_field_labels(text: str) -> str:
         """Remove label prefixes like 'Class:', 'Hometown:', 'High school:', 'Ht.:', 'Pos.:'
 
         This helps with sites that dump labelled content into table cells or bio blocks.
+        Results are memoized since the same values (years, positions, states) repeat
+        across thousands of players.
         """
         if not text:
             return text
 
-        # Common label patterns to strip
-        # NOTE: More specific patterns MUST come first to avoid partial matches
-        patterns = [
-            # Multi-word patterns first (most specific)
-            r'^\s*Hometown / Previous School / High School:\s*', r'\bHometown / Previous School / High School:\s*',
-            r'^Hometown / Previous School /\s*', r'\bHometown / Previous School /\s*',
-            r'^Hometown/High School \(Former School\):\s*', r'\bHometown/High School \(Former School\):\s*',
-            r'^Hometown / High School:\s*', r'\bHometown / High School:\s*',  # For Olivet-style tables
-            r'^High School/Previous School:\s*', r'\bHigh School/Previous School:\s*',
-            r'^High School/\s*', r'\bHigh School/\s*',
-            # Slash-format labels (Ohio Northern style)
-            r'^Hometown/\s*', r'\bHometown/\s*',  # Match "Hometown/" prefix
-            # Single-word patterns (less specific)
-            r'\bClass:\s*', r'\bPrevious College:\s*',
-            r'\bPrevious School:\s*', r'\bHt\.:\s*', r'\bPos\.:\s*', r'^High school:\s*',
-            r'\bNo\.:\s*', r'\bYr\.:\s*', r'^No\.:\s*', r'^Yr\.:\s*',
-            r'\bCl\.:\s*', r'^Cl\.:\s*',
-            # Match standalone labels (just the word with optional colon)
-            r'^\s*Hometown\s*:?\s*$',  # Match "Hometown" or "Hometown:" as entire cell content
-            # These must be last as they're most general
-            r'\bHigh school:\s*', r'\bHometown:\s*', r'^Hometown:\s*'
-        ]
-
-        for p in patterns:
-            text = re.sub(p, '', text, flags=re.IGNORECASE).strip()
+        if FieldExtractors.LABEL_KEYWORDS.search(text):
+            for pattern in FieldExtractors.LABEL_PATTERNS:
+                text = pattern.sub('', text).strip()
+        else:
+            text = text.strip()
 
         # Remove accidental duplicate full-name repeats like "Harmony Sullivan Harmony Sullivan"
         words = text.split()
@@ -1328,6 +1387,231 @@ new Promise((resolve) => {
         return custom_selectors.get(selector_name, '')
 
 
+class NuxtDataDecoder:
+    """Decoder for Nuxt 3 __NUXT_DATA__ payloads (devalue's flattened array format)
+
+    The payload is a JSON array in which every object and array member is an
+    index into the array itself, so repeated values are stored only once.
+    Index 0 is the root, negative indices stand for undefined/NaN/infinities,
+    and arrays whose first element is a string are typed values such as
+    ["Reactive", 12] or ["Date", "2025-11-01T00:00:00Z"]. Decoding this in
+    Python lets Nuxt teams be scraped with a plain HTTP GET.
+    """
+
+    SPECIAL_VALUES = {-1: None, -2: None, -3: float('nan'), -4: float('inf'), -5: float('-inf'), -6: -0.0}
+
+    # Typed values whose payload is simply the referenced element
+    WRAPPER_TYPES = {'Reactive', 'ShallowReactive', 'Ref', 'ShallowRef', 'Object', 'NuxtError', 'Island', 'Signal'}
+
+    def __init__(self, payload: list):
+        self.values = payload
+        self._resolved: Dict[int, Any] = {}
+
+    @classmethod
+    def from_html(cls, html) -> Optional['NuxtDataDecoder']:
+        """Build a decoder from the page's __NUXT_DATA__ script, if it has one"""
+        script = html.find('script', id='__NUXT_DATA__') if html else None
+        if not script or not script.string:
+            return None
+        try:
+            payload = json.loads(script.string)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Failed to parse __NUXT_DATA__ JSON: {e}")
+            return None
+        return cls(payload) if isinstance(payload, list) and payload else None
+
+    def resolve(self, index: int) -> Any:
+        """Fully hydrate the value stored at index"""
+        if isinstance(index, bool) or not isinstance(index, int):
+            return index
+        if index < 0:
+            return self.SPECIAL_VALUES.get(index)
+        if index in self._resolved:
+            return self._resolved[index]
+        if index >= len(self.values):
+            return None
+
+        value = self.values[index]
+        if isinstance(value, dict):
+            # Register the container before filling it so cyclic references terminate
+            result = {}
+            self._resolved[index] = result
+            for key, ref in value.items():
+                result[key] = self.resolve(ref)
+            return result
+
+        if isinstance(value, list):
+            if value and isinstance(value[0], str):
+                result = self._resolve_typed(value)
+                self._resolved[index] = result
+                return result
+            result = []
+            self._resolved[index] = result
+            # A hole (-2) keeps its slot as None, so later elements stay at the indexes devalue gives them
+            result.extend(self.resolve(ref) for ref in value)
+            return result
+
+        self._resolved[index] = value
+        return value
+
+    def _resolve_typed(self, value: list) -> Any:
+        type_name = value[0]
+        if type_name in self.WRAPPER_TYPES:
+            return self.resolve(value[1]) if len(value) > 1 else None
+        if type_name in ('EmptyRef', 'EmptyShallowRef'):
+            raw = self.resolve(value[1]) if len(value) > 1 else '_'
+            try:
+                return None if raw == '_' else json.loads(raw)
+            except (TypeError, json.JSONDecodeError):
+                return None
+        if type_name in ('Date', 'RegExp'):
+            return value[1] if len(value) > 1 else ''
+        if type_name == 'BigInt':
+            return int(value[1])
+        if type_name == 'Set':
+            return [self.resolve(ref) for ref in value[1:]]
+        if type_name == 'Map':
+            pairs = value[1:]
+            result = {}
+            for i in range(0, len(pairs) - 1, 2):
+                key = self.resolve(pairs[i])
+                try:
+                    result[key] = self.resolve(pairs[i + 1])
+                except TypeError:
+                    result[str(key)] = self.resolve(pairs[i + 1])
+            return result
+        if type_name == 'null':
+            # Object with a null prototype: alternating raw keys and value references
+            pairs = value[1:]
+            return {pairs[i]: self.resolve(pairs[i + 1]) for i in range(0, len(pairs) - 1, 2)}
+        logger.debug(f"Unknown __NUXT_DATA__ type {type_name}")
+        return self.resolve(value[1]) if len(value) == 2 else None
+
+    def find_records(self, required_keys: tuple) -> List[Dict]:
+        """Hydrate every object in the payload that has all of required_keys"""
+        return [self.resolve(i) for i, value in enumerate(self.values)
+                if isinstance(value, dict) and all(key in value for key in required_keys)]
+
+    def roster_players(self) -> List[Dict]:
+        """Player dicts in the same shape as JSTemplates.nuxt_data_template() returns"""
+        def text(value) -> str:
+            if value is None or isinstance(value, (dict, list)):
+                return ''
+            return str(value).strip()
+
+        players = []
+        for record in self.find_records(('firstName', 'lastName', 'rosterPlayerId')):
+            name = f"{text(record.get('firstName'))} {text(record.get('lastName'))}".strip()
+            if len(name) <= 2:
+                continue
+            height_feet = text(record.get('heightFeet'))
+            height_inches = text(record.get('heightInches'))
+            height = f"{height_feet}'{height_inches}\"" if height_feet and height_inches else ''
+            url = record.get('call_to_action')
+            players.append({
+                'name': name,
+                'jersey': text(record.get('jerseyNumber')),
+                'position': text(record.get('positionShort')) or text(record.get('positionLong')),
+                'year': text(record.get('academicYearLong')) or text(record.get('academicYearShort')),
+                'height': height,
+                'hometown': text(record.get('hometown')),
+                'high_school': text(record.get('highSchool')),
+                'previous_school': text(record.get('previousSchool')),
+                'url': url if isinstance(url, str) else '',
+            })
+        return players
+
+
+class NuxtIndex:
+    """Name and URL-slug lookup over the person records in a page's Nuxt payload
+
+    Built once per page from __NUXT_DATA__ (or a plain-JSON window.__NUXT__
+    assignment), so enriching each roster card is a dict lookup instead of a
+    walk over the whole payload. Every record with firstName and lastName is
+    indexed, players and staff alike; when several share a key the first in
+    payload order wins.
+    """
+
+    REQUIRED_KEYS = ('firstName', 'lastName')
+    SLUG_KEYS = ('slug', 'call_to_action', 'url')
+    # Hyphenated path segments that name a section rather than a person
+    GENERIC_SEGMENTS = frozenset({'womens-basketball', 'mens-basketball', 'w-baskbl', 'w-bball', 'wbkb-roster',
+                                  'coaching-staff', 'support-staff', 'roster-bio', 'player-bio'})
+    MAX_DEPTH = 10
+
+    def __init__(self, records: List[Dict]):
+        self.by_name: Dict[str, Dict] = {}
+        self.by_slug: Dict[str, Dict] = {}
+        for record in records:
+            name = self.normalize_name(f"{record.get('firstName') or ''} {record.get('lastName') or ''}")
+            if name:
+                self.by_name.setdefault(name, record)
+            for key in self.SLUG_KEYS:
+                slug = self.slug(record.get(key))
+                if slug:
+                    self.by_slug.setdefault(slug, record)
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+    @classmethod
+    def from_html(cls, html) -> 'NuxtIndex':
+        """Index the page's Nuxt payload; empty if it has none or it can't be parsed"""
+        decoder = NuxtDataDecoder.from_html(html)
+        if decoder:
+            return cls(decoder.find_records(cls.REQUIRED_KEYS))
+        if html:
+            # NOTE: window.__NUXT__ written as a function call (window.__NUXT__=(function(a,b){...})(...))
+            # still needs a browser to evaluate
+            match = re.search(r'window\.__NUXT__\s*=\s*({.+?});?\s*</script>', str(html), re.DOTALL)
+            if match:
+                try:
+                    return cls(cls._walk(json.loads(match.group(1))))
+                except json.JSONDecodeError as e:
+                    logger.debug(f"Failed to parse __NUXT__ JSON: {e}")
+        return cls([])
+
+    @classmethod
+    def _walk(cls, obj: Any, depth: int = 0, records: Optional[List[Dict]] = None) -> List[Dict]:
+        """Person records of a plain JSON payload in depth-first order"""
+        records = [] if records is None else records
+        if depth > cls.MAX_DEPTH:
+            return records
+        if isinstance(obj, dict):
+            if all(key in obj for key in cls.REQUIRED_KEYS):
+                records.append(obj)
+            for value in obj.values():
+                cls._walk(value, depth + 1, records)
+        elif isinstance(obj, list):
+            for item in obj:
+                cls._walk(item, depth + 1, records)
+        return records
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        return ' '.join(name.split()).lower()
+
+    @classmethod
+    def slug(cls, url: Any) -> str:
+        """Last non-numeric path segment if it looks like a name, e.g. jane-doe for /roster/jane-doe/12345
+
+        URLs without one (/roster/12345) give '' rather than a generic segment
+        like roster, which every such record would share.
+        """
+        if not isinstance(url, str) or not url:
+            return ''
+        for segment in reversed(urlparse(url).path.lower().split('/')):
+            if segment and not segment.isdigit():
+                if '-' in segment and re.search(r'[a-z]', segment) and segment not in cls.GENERIC_SEGMENTS:
+                    return segment
+                return ''
+        return ''
+
+    def lookup(self, name: str, url: str = '') -> Optional[Dict]:
+        """Record matching name, else the one whose URL slug matches url"""
+        return self.by_name.get(self.normalize_name(name or '')) or self.by_slug.get(self.slug(url))
+
+
 class HeaderMapper:
     """Maps various header formats to standardized field names"""
     
@@ -1942,34 +2226,1078 @@ ENTITY_CONFIGS = {
 }
 
 
+HTML_PARSER = html_parser_from_env()
+
+
+def set_html_parser(name: str):
+    """Select the backend used by make_soup for the rest of the run"""
+    global HTML_PARSER
+    if name not in HTML_PARSERS:
+        raise ValueError(f"Unknown HTML parser '{name}' (choose from {', '.join(HTML_PARSERS)})")
+    if name == 'lxml' and not LXML_AVAILABLE:
+        logger.warning("lxml not installed, falling back to html.parser")
+        name = 'html.parser'
+    elif name == 'selectolax' and not SELECTOLAX_AVAILABLE:
+        logger.warning("selectolax not installed, falling back to html.parser")
+        name = 'html.parser'
+    HTML_PARSER = name
+
+
+def make_soup(markup, parser: Optional[str] = None, parse_only: Optional[SoupStrainer] = None):
+    """Parse markup with the configured backend
+
+    html.parser and lxml return a regular BeautifulSoup tree, restricted to
+    parse_only when given. selectolax returns a SelectolaxSoup, which
+    implements the subset of the BeautifulSoup API the scrapers use and
+    always builds the whole document.
+    """
+    parser = parser or HTML_PARSER
+    if parser == 'selectolax' and SELECTOLAX_AVAILABLE:
+        return SelectolaxSoup(markup)
+    if parser == 'lxml' and LXML_AVAILABLE:
+        return BeautifulSoup(markup, 'lxml', parse_only=parse_only)
+    return BeautifulSoup(markup, 'html.parser', parse_only=parse_only)
+
+
+class RosterPageStrainer(SoupStrainer):
+    """SoupStrainer that keeps only the subtrees a scraper reads
+
+    A tag is kept, with everything inside it, when its name is in tags, its id
+    is in ids or its class contains one of class_keywords. Tags that are not
+    kept are skipped but their children are still considered, so a roster
+    container nested in unrelated layout markup is found. Every scope also
+    keeps <title>, <h1> and <h2> for SeasonVerifier and inline <script> tags
+    for the Nuxt/JSON extractors.
+    """
+
+    ALWAYS_KEPT = ('title', 'h1', 'h2')
+
+    def __init__(self, tags=(), ids=(), class_keywords=()):
+        super().__init__()
+        self.tags = set(self.ALWAYS_KEPT) | set(tags)
+        self.ids = set(ids)
+        self.class_keywords = tuple(class_keywords)
+
+    def keep(self, name: str, attrs) -> bool:
+        if name in self.tags:
+            return True
+        attrs = attrs or {}
+        if name == 'script':
+            return not attrs.get('src')
+        if attrs.get('id') in self.ids:
+            return True
+        classes = attrs.get('class') or ''
+        if isinstance(classes, list):
+            classes = ' '.join(classes)
+        return any(keyword in classes for keyword in self.class_keywords)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self.keep(name, attrs)
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        # bs4 < 4.13 calls search_tag instead of allow_tag_creation
+        return self.keep(markup_name, markup_attrs)
+
+
+# Subtrees each scraper type needs when ScrapeContext.scoped_parse is on
+PARSE_SCOPES = {
+    'standard': RosterPageStrainer(
+        ids=('cardPanel', 'listPanel', 'tablePanel', 'coaching-staff', 'roster-staff'),
+        class_keywords=('roster', 'person-card', 'player-card', 'coach', 'staff')
+    ),
+    'table': RosterPageStrainer(tags=('h3', 'h4', 'table')),
+}
+
+
+class SelectolaxNode:
+    """BeautifulSoup-compatible wrapper around a selectolax node
+
+    Supports find/find_all (tag names, attribute dicts, class_, string and
+    callable/regex/list matchers), select/select_one, find_next, get_text,
+    text, string, attrs, get, parent and name.
+    """
+
+    def __init__(self, node):
+        self._node = node
+
+    @staticmethod
+    def _is_element(node) -> bool:
+        return not node.tag.startswith(('-', '_', '!'))
+
+    @staticmethod
+    def _is_text(node) -> bool:
+        return node.tag == '-text'
+
+    def _children(self, include_text: bool = False):
+        return self._node.iter(include_text=include_text)
+
+    def _descendants(self, include_text: bool = False):
+        stack = list(self._node.iter(include_text=True))[::-1]
+        while stack:
+            node = stack.pop()
+            if self._is_element(node):
+                yield node
+                stack.extend(list(node.iter(include_text=True))[::-1])
+            elif include_text and self._is_text(node):
+                yield node
+
+    def __eq__(self, other):
+        return isinstance(other, SelectolaxNode) and self._node.mem_id == other._node.mem_id
+
+    def __hash__(self):
+        return hash(self._node.mem_id)
+
+    def __bool__(self):
+        return True
+
+    def __str__(self):
+        return self._node.html or ''
+
+    def __repr__(self):
+        return str(self)
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def __contains__(self, key):
+        return key in self.attrs
+
+    @property
+    def name(self) -> str:
+        return self._node.tag
+
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        attrs = {key: value if value is not None else '' for key, value in self._node.attributes.items()}
+        if 'class' in attrs:
+            attrs['class'] = attrs['class'].split()
+        return attrs
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def has_attr(self, key) -> bool:
+        return key in self.attrs
+
+    @property
+    def parent(self) -> Optional['SelectolaxNode']:
+        parent = self._node.parent
+        if parent is None or not self._is_element(parent):
+            return None
+        return SelectolaxNode(parent)
+
+    @property
+    def children(self):
+        for node in self._children(include_text=True):
+            if self._is_text(node):
+                yield node.text(deep=False)
+            elif self._is_element(node):
+                yield SelectolaxNode(node)
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        pieces = (node.text(deep=False) for node in self._descendants(include_text=True) if self._is_text(node))
+        if strip:
+            pieces = (piece.strip() for piece in pieces)
+            return separator.join(piece for piece in pieces if piece)
+        return separator.join(pieces)
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    @property
+    def string(self) -> Optional[str]:
+        children = [node for node in self._children(include_text=True) if self._is_text(node) or self._is_element(node)]
+        if len(children) != 1:
+            return None
+        if self._is_text(children[0]):
+            return children[0].text(deep=False)
+        return SelectolaxNode(children[0]).string
+
+    @staticmethod
+    def _match(matcher, value) -> bool:
+        if matcher is None:
+            return True
+        if matcher is True:
+            return value is not None
+        if matcher is False:
+            return value is None
+        if isinstance(value, list):
+            return any(SelectolaxNode._match(matcher, v) for v in value) or \
+                (bool(value) and SelectolaxNode._match(matcher, ' '.join(value)))
+        if callable(matcher) and not isinstance(matcher, re.Pattern):
+            return bool(matcher(value))
+        if value is None:
+            return False
+        if isinstance(matcher, re.Pattern):
+            return matcher.search(value) is not None
+        if isinstance(matcher, (list, tuple, set)):
+            return value in matcher
+        return value == matcher
+
+    def _matches(self, node, name, attrs, string) -> bool:
+        if name is not None and not self._match(name, node.tag):
+            return False
+        if attrs:
+            element = SelectolaxNode(node)
+            element_attrs = element.attrs
+            for key, matcher in attrs.items():
+                if not self._match(matcher, element_attrs.get(key)):
+                    return False
+        if string is not None and not self._match(string, SelectolaxNode(node).string):
+            return False
+        return True
+
+    @staticmethod
+    def _filters(attrs, kwargs) -> Dict[str, Any]:
+        filters = dict(attrs or {})
+        if 'class_' in kwargs:
+            filters['class'] = kwargs.pop('class_')
+        filters.update(kwargs)
+        return filters
+
+    def _candidates(self, recursive: bool):
+        if recursive:
+            return self._descendants()
+        return (node for node in self._children() if self._is_element(node))
+
+    def find_all(self, name=None, attrs=None, recursive: bool = True, string=None,
+                 limit: Optional[int] = None, **kwargs) -> List['SelectolaxNode']:
+        string = kwargs.pop('text', string)
+        filters = self._filters(attrs, kwargs)
+        results = []
+        for node in self._candidates(recursive):
+            if self._matches(node, name, filters, string):
+                results.append(SelectolaxNode(node))
+                if limit and len(results) >= limit:
+                    break
+        return results
+
+    def find(self, name=None, attrs=None, recursive: bool = True, string=None, **kwargs) -> Optional['SelectolaxNode']:
+        results = self.find_all(name, attrs, recursive, string, limit=1, **kwargs)
+        return results[0] if results else None
+
+    def find_next(self, name=None, attrs=None, string=None, **kwargs) -> Optional['SelectolaxNode']:
+        string = kwargs.pop('text', string)
+        filters = self._filters(attrs, kwargs)
+        root = self._node
+        while root.parent is not None:
+            root = root.parent
+        seen = False
+        for node in SelectolaxNode(root)._descendants():
+            if seen and self._matches(node, name, filters, string):
+                return SelectolaxNode(node)
+            if node.mem_id == self._node.mem_id:
+                seen = True
+        return None
+
+    def select(self, selector: str) -> List['SelectolaxNode']:
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector: str) -> Optional['SelectolaxNode']:
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+
+class SelectolaxSoup(SelectolaxNode):
+    """Document-level SelectolaxNode returned by make_soup"""
+
+    def __init__(self, markup):
+        if isinstance(markup, bytes):
+            markup = markup.decode('utf-8', errors='replace')
+        self._tree = LexborHTMLParser(markup)
+        super().__init__(self._tree.root)
+
+    @property
+    def name(self) -> str:
+        return '[document]'
+
+    def _descendants(self, include_text: bool = False):
+        if self._is_element(self._node):
+            yield self._node
+        yield from super()._descendants(include_text)
+
+    def _candidates(self, recursive: bool):
+        if recursive:
+            return self._descendants()
+        return iter([self._node])
+
+    def __str__(self):
+        return self._tree.html or ''
+
+
+class PageCache:
+    """Per-run cache of parsed pages keyed by URL
+
+    Every page is stored under both the requested URL and the final URL after
+    redirects, so RosterManager's season check can reuse the BeautifulSoup tree
+    a scraper already built instead of downloading and parsing it again.
+    Only successful pages and 404s (which drive the season_first fallback) are
+    cached; transient failures are always retried.
+
+    Pages parsed with a PARSE_SCOPES strainer are tagged with the scope name
+    and only returned to callers asking for that scope (or any_scope, which
+    the season check uses since every scope keeps the page headings).
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._pages: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str, scope: Optional[str] = None, any_scope: bool = False) -> Optional[tuple]:
+        """Return (html, status_code) for url, or None if not cached"""
+        with self._lock:
+            entry = self._pages.get(url)
+            if entry is None:
+                return None
+            html, status_code, entry_scope = entry
+            if entry_scope is not None and entry_scope != scope and not any_scope:
+                return None
+            self._pages.move_to_end(url)
+            return html, status_code
+
+    def put(self, url: str, html: Optional[BeautifulSoup], status_code: Optional[int], final_url: Optional[str] = None,
+            scope: Optional[str] = None):
+        """Cache a fetched page under its requested and final URLs"""
+        if html is None and status_code != 404:
+            return
+        with self._lock:
+            for key in {url, final_url or url}:
+                self._pages[key] = (html, status_code, scope if html is not None else None)
+                self._pages.move_to_end(key)
+            while len(self._pages) > self.max_entries:
+                self._pages.popitem(last=False)
+
+
+class HTTPCache:
+    """Persistent on-disk HTTP response cache with conditional revalidation
+
+    Responses are stored as a body file plus a JSON metadata file holding the
+    status, final URL, encoding and ETag/Last-Modified validators. Entries
+    younger than ttl seconds are served without touching the network; older
+    ones are revalidated with If-None-Match/If-Modified-Since, so unchanged
+    pages come back as a cheap 304. The cache is capped at max_bytes and
+    evicts the least recently used entries first.
+    """
+
+    VALIDATOR_HEADERS = ('ETag', 'Last-Modified', 'Content-Type')
+
+    def __init__(self, cache_dir: str, ttl: float = 3600, max_bytes: int = 1024 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # key -> [size in bytes, last access time]
+        self._index: Dict[str, list] = {}
+        for meta_path in self.cache_dir.glob('*.json'):
+            body_path = meta_path.with_suffix('.body')
+            if body_path.exists():
+                self._index[meta_path.stem] = [body_path.stat().st_size, meta_path.stat().st_mtime]
+        self._total_bytes = sum(size for size, _ in self._index.values())
+        with self._lock:
+            self._evict()
+
+    def get(self, requester, url: str, **kwargs) -> requests.Response:
+        """GET url via requester (a Session or the requests module), using the cache"""
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        meta = self._load_meta(key)
+
+        if meta and time.time() - meta['stored_at'] < self.ttl:
+            with self._lock:
+                self.hits += 1
+            return self._build_response(key, meta)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if meta:
+            if meta['headers'].get('ETag'):
+                headers['If-None-Match'] = meta['headers']['ETag']
+            if meta['headers'].get('Last-Modified'):
+                headers['If-Modified-Since'] = meta['headers']['Last-Modified']
+
+        response = requester.get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and meta:
+            with self._lock:
+                self.revalidated += 1
+            meta['stored_at'] = time.time()
+            self._write_meta(key, meta)
+            return self._build_response(key, meta)
+
+        with self._lock:
+            self.misses += 1
+        if response.status_code == 200:
+            self._store(key, url, response)
+        return response
+
+    def _load_meta(self, key: str) -> Optional[Dict]:
+        meta_path = self.cache_dir / f"{key}.json"
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not (self.cache_dir / f"{key}.body").exists():
+            return None
+        # Touch the metadata file so eviction order survives restarts
+        now = time.time()
+        os.utime(meta_path, (now, now))
+        with self._lock:
+            if key in self._index:
+                self._index[key][1] = now
+        return meta
+
+    def _write_meta(self, key: str, meta: Dict):
+        tmp_path = self.cache_dir / f"{key}.json.tmp.{threading.get_ident()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.cache_dir / f"{key}.json")
+
+    def _store(self, key: str, url: str, response: requests.Response):
+        body = response.content
+        tmp_path = self.cache_dir / f"{key}.body.tmp.{threading.get_ident()}"
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, self.cache_dir / f"{key}.body")
+        self._write_meta(key, {
+            'url': url,
+            'final_url': response.url,
+            'status': response.status_code,
+            'encoding': response.encoding,
+            'headers': {h: response.headers[h] for h in self.VALIDATOR_HEADERS if h in response.headers},
+            'stored_at': time.time(),
+        })
+        with self._lock:
+            previous = self._index.get(key)
+            if previous:
+                self._total_bytes -= previous[0]
+            self._index[key] = [len(body), time.time()]
+            self._total_bytes += len(body)
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (caller holds the lock)"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            for suffix in ('.json', '.body'):
+                try:
+                    (self.cache_dir / f"{key}{suffix}").unlink()
+                except FileNotFoundError:
+                    pass
+            self._total_bytes -= size
+            del self._index[key]
+
+    def _build_response(self, key: str, meta: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = meta['status']
+        response.url = meta['final_url']
+        response.encoding = meta.get('encoding')
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response._content = (self.cache_dir / f"{key}.body").read_bytes()
+        return response
+
+    def stats(self) -> str:
+        return (f"HTTP cache: {self.hits} fresh hits, {self.revalidated} revalidated (304), "
+                f"{self.misses} downloaded, {self._total_bytes / 1024 / 1024:.1f} MB on disk")
+
+
+class PageArchive:
+    """Gzipped record of every page a run fetched, for re-running the scrapers offline
+
+    In record mode each raw HTTP response (status, final URL, headers, body),
+    each browser-rendered page and each JavaScript template result is written
+    to <dir>/<kind>-<sha256>.gz as a JSON header line followed by the body.
+    In replay mode the same lookups are answered from the archive and nothing
+    touches the network or a browser; a request that was never recorded fails
+    like a connection error.
+    """
+
+    def __init__(self, archive_dir: str, replay: bool = False):
+        self.archive_dir = Path(archive_dir)
+        self.replaying = replay
+        if replay and not self.archive_dir.is_dir():
+            raise FileNotFoundError(f"Replay archive not found: {archive_dir}")
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+        self._lock = threading.Lock()
+
+    def _path(self, kind: str, url: str, extra: str = '') -> Path:
+        key = hashlib.sha256(f"{url}\n{extra}".encode('utf-8')).hexdigest()
+        return self.archive_dir / f"{kind}-{key}.gz"
+
+    def _write(self, path: Path, meta: Dict, body: bytes):
+        tmp_path = path.with_name(f"{path.name}.tmp.{threading.get_ident()}")
+        with gzip.open(tmp_path, 'wb') as f:
+            f.write(json.dumps(meta).encode('utf-8') + b'\n')
+            f.write(body)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.recorded += 1
+
+    def _read(self, path: Path) -> Optional[tuple]:
+        try:
+            with gzip.open(path, 'rb') as f:
+                header, _, body = f.read().partition(b'\n')
+        except FileNotFoundError:
+            with self._lock:
+                self.missing += 1
+            return None
+        with self._lock:
+            self.replayed += 1
+        return json.loads(header), body
+
+    def save_response(self, url: str, response: requests.Response):
+        self._write(self._path('http', url), {
+            'url': url,
+            'final_url': response.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'encoding': response.encoding,
+            'headers': dict(response.headers),
+        }, response.content)
+
+    def response(self, url: str) -> requests.Response:
+        """The recorded response for url; raises ConnectionError if it was never fetched"""
+        entry = self._read(self._path('http', url))
+        if entry is None:
+            raise requests.ConnectionError(f"{url} is not in the replay archive")
+        meta, body = entry
+        response = requests.Response()
+        response.status_code = meta['status']
+        response.reason = meta.get('reason')
+        response.url = meta['final_url']
+        response.encoding = meta.get('encoding')
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response._content = body
+        return response
+
+    def save_rendered(self, url: str, markup: str):
+        self._write(self._path('rendered', url), {'url': url}, markup.encode('utf-8'))
+
+    def rendered(self, url: str) -> Optional[str]:
+        """The recorded browser-rendered HTML of url"""
+        entry = self._read(self._path('rendered', url))
+        return entry[1].decode('utf-8') if entry else None
+
+    def save_script_result(self, url: str, js_code: str, result: Any):
+        self._write(self._path('script', url, js_code), {'url': url}, json.dumps(result).encode('utf-8'))
+
+    def script_result(self, url: str, js_code: str) -> Any:
+        """The recorded result of running js_code on url"""
+        entry = self._read(self._path('script', url, js_code))
+        return json.loads(entry[1]) if entry else None
+
+    def stats(self) -> str:
+        if self.replaying:
+            return f"Page archive: {self.replayed} pages replayed, {self.missing} not in archive"
+        return f"Page archive: {self.recorded} pages recorded to {self.archive_dir}"
+
+
+class BrowserPool:
+    """Pool of long-lived headless Chromium contexts shared by every team in a run
+
+    Replaces launching shot-scraper (Python + Chromium) or a fresh Playwright
+    browser for each JavaScript team. Playwright's sync API is tied to the
+    thread that started it, so each slot owns a single-thread executor that
+    launches its browser once and then runs every page checked out to it.
+    Pages wait for a selector (or network idle) instead of a fixed sleep.
+    """
+
+    def __init__(self, size: int = 2, user_agent: Optional[str] = BROWSER_USER_AGENT, timeout_ms: int = 30000,
+                 wait_timeout_ms: int = 10000):
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright is not installed. Install with: uv add playwright && playwright install chromium")
+        self.user_agent = user_agent
+        self.timeout_ms = timeout_ms
+        self.wait_timeout_ms = wait_timeout_ms
+        self._slots: queue.Queue = queue.Queue()
+        self._all_slots = []
+        for i in range(max(1, size)):
+            slot = {'executor': ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'browser-{i}'),
+                    'playwright': None, 'browser': None, 'context': None}
+            self._all_slots.append(slot)
+            self._slots.put(slot)
+
+    def evaluate(self, url: str, js_code: str, wait_for: Optional[str] = None) -> Any:
+        """Load url and return the result of evaluating js_code in the page"""
+        return self._run(url, wait_for, lambda page: page.evaluate(js_code))
+
+    def content(self, url: str, wait_for: Optional[str] = None) -> str:
+        """Load url and return the rendered HTML"""
+        return self._run(url, wait_for, lambda page: page.content())
+
+    def _run(self, url: str, wait_for: Optional[str], action):
+        slot = self._slots.get()
+        try:
+            return slot['executor'].submit(self._run_in_slot, slot, url, wait_for, action).result()
+        finally:
+            self._slots.put(slot)
+
+    def _run_in_slot(self, slot: Dict, url: str, wait_for: Optional[str], action):
+        """Runs on the slot's own thread"""
+        if slot['browser'] is None or not slot['browser'].is_connected():
+            self._start_slot(slot)
+
+        page = slot['context'].new_page()
+        try:
+            page.goto(url, wait_until='domcontentloaded', timeout=self.timeout_ms)
+            try:
+                if wait_for:
+                    page.wait_for_selector(wait_for, state='attached', timeout=self.wait_timeout_ms)
+                else:
+                    page.wait_for_load_state('networkidle', timeout=self.wait_timeout_ms)
+            except Exception:
+                # Evaluate whatever has rendered; the templates handle missing elements
+                logger.debug(f"Timed out waiting for {wait_for or 'network idle'} on {url}")
+            return action(page)
+        finally:
+            page.close()
+
+    def _start_slot(self, slot: Dict):
+        self._stop_slot(slot)
+        slot['playwright'] = sync_playwright().start()
+        slot['browser'] = slot['playwright'].chromium.launch(headless=True)
+        context_options = {'bypass_csp': True, 'ignore_https_errors': True}
+        if self.user_agent:
+            context_options['user_agent'] = self.user_agent
+        slot['context'] = slot['browser'].new_context(**context_options)
+        logger.info("Launched pooled Chromium browser")
+
+    def _stop_slot(self, slot: Dict):
+        for name in ('context', 'browser'):
+            try:
+                if slot[name] is not None:
+                    slot[name].close()
+            except Exception:
+                pass
+            slot[name] = None
+        if slot['playwright'] is not None:
+            try:
+                slot['playwright'].stop()
+            except Exception:
+                pass
+            slot['playwright'] = None
+
+    def close(self):
+        """Shut down every browser; must be called once the run is finished"""
+        for slot in self._all_slots:
+            slot['executor'].submit(self._stop_slot, slot).result()
+            slot['executor'].shutdown()
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that counts requests sent and TCP/TLS connections opened
+
+    Every request that does not open a new connection reused a pooled one,
+    so stats() reports the connection reuse rate for the run.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self._stats_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        new_pool = self.poolmanager._new_pool
+
+        def counting_new_pool(*pool_args, **pool_kwargs):
+            pool = new_pool(*pool_args, **pool_kwargs)
+            new_conn = pool._new_conn
+
+            def counting_new_conn():
+                conn = new_conn()
+                connect = conn.connect
+
+                # Count sockets rather than connection objects, since a pooled
+                # connection the server closed reconnects in place
+                def counting_connect():
+                    with self._stats_lock:
+                        self.connections_opened += 1
+                    return connect()
+
+                conn.connect = counting_connect
+                return conn
+
+            pool._new_conn = counting_new_conn
+            return pool
+
+        self.poolmanager._new_pool = counting_new_pool
+
+    def send(self, request, **kwargs):
+        with self._stats_lock:
+            self.requests_sent += 1
+        return super().send(request, **kwargs)
+
+    def stats(self) -> str:
+        reused = max(0, self.requests_sent - self.connections_opened)
+        rate = reused / self.requests_sent * 100 if self.requests_sent else 0
+        return (f"HTTP connections: {self.requests_sent} requests over {self.connections_opened} new connections "
+                f"({rate:.0f}% reused)")
+
+
+class ThrottledRequester:
+    """Session (or requests module) stand-in whose get() goes through a HostRateLimiter"""
+
+    def __init__(self, limiter: HostRateLimiter, requester, on_retry=None):
+        self.limiter = limiter
+        self.requester = requester
+        self.on_retry = on_retry
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.limiter.get(self.requester, url, on_retry=self.on_retry, **kwargs)
+
+
+def create_session(pool_connections: int = 64, pool_maxsize: int = 4, retries: int = 3,
+                   backoff_factor: float = 0.5, retry_statuses=(429, 500, 502, 503, 504)) -> requests.Session:
+    """Build the connection-pooled session shared by every scraper in a run
+
+    pool_connections is the number of hosts kept alive at once and
+    pool_maxsize the connections kept per host (match it to --per-host).
+    Connection errors and retry_statuses responses on GET are retried with
+    exponential backoff, honouring Retry-After. Leave 429/503 out when a
+    HostRateLimiter handles them, so the whole host backs off instead.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=retry_statuses,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = CountingHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+
+class PlatformCache:
+    """Persisted record of the URL format and scraper path that worked for each team
+
+    Several scrapers walk a fallback chain (default URL -> season_first on a
+    404, coaching-staff template -> __NUXT_DATA__, browser rendering -> plain
+    fetch). The winning option of each chain is stored per team and entity
+    type in a JSON file, so later runs try it first and walk the rest of the
+    chain only when it stops working. The file is rewritten whenever a
+    decision changes.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.decisions: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.updates = 0
+        if self.path.exists():
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self.decisions = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable platform cache {self.path}: {e}")
+
+    @staticmethod
+    def _key(team_id: int, entity_type: str) -> str:
+        return f"{team_id}:{entity_type}"
+
+    def order(self, team_id: int, entity_type: str, decision: str, options: tuple) -> tuple:
+        """options with the one that last worked for the team moved to the front"""
+        with self._lock:
+            winner = self.decisions.get(self._key(team_id, entity_type), {}).get(decision)
+            if winner not in options or winner == options[0]:
+                return options
+            self.hits += 1
+        return (winner,) + tuple(option for option in options if option != winner)
+
+    def record(self, team_id: int, entity_type: str, decisions: Dict[str, str]):
+        """Remember the options that produced a team's roster"""
+        with self._lock:
+            entry = self.decisions.setdefault(self._key(team_id, entity_type), {})
+            changed = {decision: option for decision, option in decisions.items() if entry.get(decision) != option}
+            if not changed:
+                return
+            entry.update(changed)
+            self.updates += len(changed)
+            tmp_path = self.path.with_name(f"{self.path.name}.tmp.{threading.get_ident()}")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.decisions, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+    def stats(self) -> str:
+        return (f"Platform cache: {self.hits} fallback chains skipped, {self.updates} decisions updated "
+                f"({len(self.decisions)} teams)")
+
+
+class RunTelemetry:
+    """Per-team metrics for a run, written as JSON Lines to the --report file
+
+    A team is tracked on the thread that scrapes it, so the fetches, parses,
+    retries and fallbacks made on that thread are added to its record. The
+    record is written as one JSON line when the team finishes; summary()
+    lists the slowest teams and the time spent per scraper type.
+    """
+
+    TIMINGS = ('fetch_seconds', 'browser_seconds', 'parse_seconds', 'extract_seconds', 'verify_seconds')
+
+    def __init__(self, report_file: str):
+        self.report_file = report_file
+        self.records: List[Dict] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._file = open(report_file, 'w', encoding='utf-8')
+
+    def current(self) -> Optional[Dict]:
+        """The record of the team being scraped on this thread, if any"""
+        return getattr(self._local, 'record', None)
+
+    @contextmanager
+    def track(self, team: Dict):
+        record = {'team_id': team['ncaa_id'], 'team': team.get('team', ''), 'scraper': None, 'url_format': None,
+                  'path': {}, 'players': 0, 'failed_year_check': None, 'fetches': 0, 'bytes': 0, 'retries': 0, 'fallbacks': 0,
+                  **{timing: 0.0 for timing in self.TIMINGS}, 'total_seconds': 0.0, 'error': None}
+        self._local.record = record
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['total_seconds'] = time.perf_counter() - start
+            self._local.record = None
+            for key in self.TIMINGS + ('total_seconds',):
+                record[key] = round(record[key], 4)
+            with self._lock:
+                self.records.append(record)
+                self._file.write(json.dumps(record) + '\n')
+                self._file.flush()
+
+    def add(self, metric: str, amount: float = 1):
+        record = self.current()
+        if record is not None:
+            record[metric] += amount
+
+    @contextmanager
+    def timed(self, metric: str):
+        """Add the time spent in the block, less its fetches and parses, to metric"""
+        record = self.current()
+        if record is None:
+            yield
+            return
+        nested = ('fetch_seconds', 'browser_seconds', 'parse_seconds')
+        before = sum(record[key] for key in nested)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            inner = sum(record[key] for key in nested) - before
+            record[metric] += max(0.0, time.perf_counter() - start - inner)
+
+    def summary(self, top: int = 10) -> str:
+        lines = [f"Run report: {len(self.records)} teams written to {self.report_file}", "Slowest teams:"]
+        for record in sorted(self.records, key=lambda r: r['total_seconds'], reverse=True)[:top]:
+            lines.append(f"  {record['total_seconds']:7.2f}s  {record['team']} ({record['team_id']}, "
+                         f"{record['scraper']}) fetch {record['fetch_seconds']:.2f}s, "
+                         f"browser {record['browser_seconds']:.2f}s, parse {record['parse_seconds']:.2f}s, "
+                         f"{record['fallbacks']} fallbacks, {record['retries']} retries")
+        lines.append("Time per scraper type:")
+        by_type: Dict[str, List[Dict]] = {}
+        for record in self.records:
+            by_type.setdefault(record['scraper'] or 'unknown', []).append(record)
+        for scraper, records in sorted(by_type.items(), key=lambda item: -sum(r['total_seconds'] for r in item[1])):
+            total = sum(r['total_seconds'] for r in records)
+            lines.append(f"  {scraper:<10} {total:8.1f}s over {len(records)} teams "
+                         f"({total / len(records):.2f}s/team, {sum(r['players'] for r in records)} found)")
+        return '\n'.join(lines)
+
+    def close(self):
+        self._file.close()
+
+
+@dataclass
+class ScrapeContext:
+    """Resources shared by all scrapers (and the season check) within one run"""
+    page_cache: Optional[PageCache] = None
+    http_cache: Optional[HTTPCache] = None
+    browser_pool: Optional[BrowserPool] = None
+    session: Optional[requests.Session] = None
+    scoped_parse: bool = False
+    rate_limiter: Optional[HostRateLimiter] = None
+    platform_cache: Optional[PlatformCache] = None
+    archive: Optional[PageArchive] = None
+    telemetry: Optional[RunTelemetry] = None
+
+    def get(self, requester, url: str, **kwargs) -> requests.Response:
+        """GET url with requester (a Session or the requests module) through the run's HTTP cache
+
+        Only requests that reach the network are rate limited; cache hits are free.
+        When replaying an archive the response comes from it instead.
+        """
+        start = time.perf_counter()
+        self.record('fetches')
+        try:
+            response = self._get(requester, url, **kwargs)
+        finally:
+            self.record('fetch_seconds', time.perf_counter() - start)
+        if self.telemetry:
+            self.record('bytes', len(response.content))
+            # Connection errors and 5xx responses retried inside urllib3
+            self.record('retries', len(getattr(getattr(response.raw, 'retries', None), 'history', ())))
+        return response
+
+    def _get(self, requester, url: str, **kwargs) -> requests.Response:
+        if self.archive and self.archive.replaying:
+            return self.archive.response(url)
+        if self.rate_limiter:
+            requester = ThrottledRequester(self.rate_limiter, requester, on_retry=lambda: self.record('retries'))
+        if self.http_cache:
+            response = self.http_cache.get(requester, url, **kwargs)
+        else:
+            response = requester.get(url, **kwargs)
+        if self.archive:
+            self.archive.save_response(url, response)
+        return response
+
+    def parse(self, markup, parse_only: Optional[SoupStrainer] = None):
+        """make_soup, timed for the run report"""
+        start = time.perf_counter()
+        try:
+            return make_soup(markup, parse_only=parse_only)
+        finally:
+            self.record('parse_seconds', time.perf_counter() - start)
+
+    def record(self, metric: str, amount: float = 1):
+        """Add to a metric of the team being scraped on this thread (for --report)"""
+        if self.telemetry:
+            self.telemetry.add(metric, amount)
+
+    def note(self, key: str, value: Any):
+        """Set a field of the team being scraped on this thread (for --report)"""
+        record = self.telemetry.current() if self.telemetry else None
+        if record is not None:
+            record[key] = value
+
+    def track(self, team: Dict):
+        return self.telemetry.track(team) if self.telemetry else nullcontext()
+
+    def timed(self, metric: str):
+        return self.telemetry.timed(metric) if self.telemetry else nullcontext()
+
+    def throttle(self, url: str):
+        """Wait for the rate limiter before a browser loads url"""
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
+
+
 class BaseScraper:
     """Base class for all roster scrapers"""
-    
-    def __init__(self, session: Optional[requests.Session] = None, entity_type: str = 'player'):
-        self.session = session or requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/95.0.4638.69 Safari/537.36'
-        })
+
+    # Key into PARSE_SCOPES for scoped parsing, None to always build the whole page
+    PARSE_SCOPE: Optional[str] = None
+
+    def __init__(self, session: Optional[requests.Session] = None, entity_type: str = 'player',
+                 context: Optional[ScrapeContext] = None):
+        self.context = context or ScrapeContext()
+        if session is None and self.context.session is not None:
+            # The run's shared pooled session, already configured
+            self.session = self.context.session
+        else:
+            self.session = session or requests.Session()
+            self.session.headers.update({'User-Agent': USER_AGENT})
         self.entity_type = entity_type
         self.entity_config = ENTITY_CONFIGS[entity_type]
-
-    def fetch_html(self, url: str, return_status: bool = False) -> Optional[Union[BeautifulSoup, tuple]]:
+        self._last_markup = None
+        # Options that worked in fallback chains, stored in the platform cache once the roster is found
+        self.decisions: Dict[str, str] = {}
+        self.use_platform_cache = True
+        self.followed_platform_cache = False
+
+    def _preferred(self, team: Dict, decision: str, options: tuple) -> tuple:
+        """Order a fallback chain so the option that last worked for the team comes first"""
+        cache = self.context.platform_cache
+        if not cache or not self.use_platform_cache:
+            return options
+        ordered = cache.order(team['ncaa_id'], self.entity_type, decision, options)
+        if ordered != options:
+            self.followed_platform_cache = True
+        return ordered
+
+    def _url_formats(self, team: Dict, url_format: str) -> tuple:
+        """URL formats to try in order; a 404 on the default format falls back to season_first"""
+        if url_format != 'default':
+            return (url_format,)
+        return self._preferred(team, 'url_format', ('default', 'season_first'))
+
+    def _fetch_first_found(self, team: Dict, season: str, formats: tuple, fetch) -> tuple:
+        """Fetch the team's page in each URL format until one is not a 404
+
+        Returns (html, status, url) and notes the format that worked.
+        """
+        for i, url_format in enumerate(formats):
+            url = URLBuilder.build_url(team['url'], season, url_format, entity_type=self.entity_type)
+            html, status = fetch(url)
+            logger.debug(f"Fetch result: html={'present' if html else 'None'}, status={status}, url_format={url_format}")
+            if html or status != 404 or i == len(formats) - 1:
+                break
+            logger.info(f"Got 404 for {team['team']} at {url}, trying {formats[i + 1]} URL format as fallback")
+            self.context.record('fallbacks')
+        if html and len(formats) > 1:
+            self.decisions['url_format'] = url_format
+        return html, status, url
+
+    def fetch_html(self, url: str, return_status: bool = False, full: bool = False) -> Optional[Union[BeautifulSoup, tuple]]:
         """Fetch and parse HTML from URL
         
         Args:
             url: URL to fetch
             return_status: If True, return (html, status_code) tuple instead of just html
+            full: If True, build the whole document even when scoped parsing is enabled
         
         Returns:
             BeautifulSoup object if return_status=False, or (BeautifulSoup, status_code) tuple if return_status=True
         """
+        scope = None if full else self.parse_scope
+        page_cache = self.context.page_cache
+        cached = page_cache.get(url, scope=scope) if page_cache else None
+        if cached is not None:
+            logger.debug(f"Using cached page for {url}")
+            return cached if return_status else cached[0]
+
+        if full and self._last_markup and self._last_markup[0] == url:
+            # Reparse the page we just fetched with a scope instead of downloading it again
+            html = self.context.parse(self._last_markup[1])
+            self._last_markup = None
+            if page_cache:
+                page_cache.put(url, html, 200)
+            return (html, 200) if return_status else html
+
         try:
-            response = self.session.get(url, timeout=30, verify=False)
+            response = self.context.get(self.session, url, timeout=30, verify=False)
             status_code = response.status_code  # Capture before raise_for_status()
             response.raise_for_status()
-            html = BeautifulSoup(response.text, 'html.parser')
+            html = self.context.parse(response.text, parse_only=PARSE_SCOPES[scope] if scope else None)
+            self._last_markup = (url, response.text) if scope else None
+            if page_cache:
+                page_cache.put(url, html, status_code, final_url=response.url, scope=scope)
             return (html, status_code) if return_status else html
         except requests.HTTPError as e:
+            if page_cache:
+                page_cache.put(url, None, status_code, final_url=response.url)
             if return_status:
                 logger.error(f"Failed to fetch {url}: {e}")
                 return (None, status_code)  # Use the status_code we captured
@@ -1978,13 +3306,45 @@ class BaseScraper:
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return (None, None) if return_status else None
+
+    @property
+    def parse_scope(self) -> Optional[str]:
+        """PARSE_SCOPES key used for this scraper's pages, or None for a full parse"""
+        return self.PARSE_SCOPE if self.context.scoped_parse else None
+
+    def _is_scoped(self, html) -> bool:
+        """True if html was built from a PARSE_SCOPES strainer rather than the whole page"""
+        return isinstance(html, BeautifulSoup) and html.parse_only is not None
     
     def fetch_html_with_javascript(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch HTML using shot-scraper to execute JavaScript"""
-        import subprocess
-        import tempfile
-        import os
-        
+        """Fetch HTML using the shared browser pool, or shot-scraper, to execute JavaScript"""
+        archive = self.context.archive
+        if archive and archive.replaying:
+            markup = archive.rendered(url)
+        else:
+            self.context.throttle(url)
+            with self.context.timed('browser_seconds'):
+                markup = self._render_javascript(url)
+            if archive and markup:
+                archive.save_rendered(url, markup)
+        if not markup:
+            return None
+
+        html = self.context.parse(markup)
+        if self.context.page_cache:
+            self.context.page_cache.put(url, html, 200)
+        return html
+
+    def _render_javascript(self, url: str) -> Optional[str]:
+        """Rendered HTML of url from the shared browser pool or shot-scraper"""
+        if self.context.browser_pool:
+            try:
+                logger.info(f"Using pooled browser to render JavaScript for {url}")
+                return self.context.browser_pool.content(url)
+            except Exception as e:
+                logger.error(f"Pooled browser failed for {url}: {e}")
+                return None
+
         try:
             logger.info(f"Using shot-scraper to render JavaScript for {url}")
             
@@ -1998,7 +3358,7 @@ class BaseScraper:
             
             if result.returncode == 0 and result.stdout:
                 logger.info("Successfully rendered HTML with JavaScript")
-                return BeautifulSoup(result.stdout, 'html.parser')
+                return result.stdout
             else:
                 logger.warning(f"shot-scraper failed with return code {result.returncode}")
                 if result.stderr:
@@ -2027,6 +3387,10 @@ class BaseScraper:
 
 class StandardScraper(BaseScraper):
     """Scraper for standard sidearm-roster-player layouts"""
+
+    PARSE_SCOPE = 'standard'
+    # Baylor, Mercer, Cal Poly, Dartmouth, Saint Mary's (CA), Kent State, North Florida, CSUN, Florida, Kansas City, St. Cloud St., St. Thomas (MN)
+    JAVASCRIPT_TEAMS = [51, 406, 90, 172, 610, 331, 2711, 101, 235, 2707, 598, 620]
     
     def scrape_roster(self, team: Dict, season: str, url_format: str = "default") -> List[Player]:
         """Scrape roster using standard sidearm layout"""
@@ -2039,34 +3403,15 @@ class StandardScraper(BaseScraper):
         else:
             self.team_config = {}
         
-        url = URLBuilder.build_url(team['url'], season, url_format, entity_type=self.entity_type)
-        
-        # Use shot-scraper for Vue.js teams to handle JavaScript rendering
-        if team.get('ncaa_id') in [51, 406, 90, 172, 610, 331, 2711, 101, 235, 2707, 598, 620]:  # Baylor, Mercer, Cal Poly, Dartmouth, Saint Mary's (CA), Kent State, North Florida, CSUN, Florida, Kansas City, St. Cloud St., St. Thomas (MN)
-            html = self.fetch_html_with_javascript(url)
-            status = 200 if html else None  # Set status for JavaScript-rendered pages
-            if not html:
-                logger.warning(f"shot-scraper failed for {team['team']}, falling back to regular fetch")
-                html, status = self.fetch_html(url, return_status=True)
-        else:
-            html, status = self.fetch_html(url, return_status=True)
-        
-        # Debug logging
-        logger.debug(f"Fetch result: html={'present' if html else 'None'}, status={status}, url_format={url_format}")
-        
-        # If 404 and using default format, try season_first as fallback
-        if not html and status == 404 and url_format == "default":
-            logger.info(f"Got 404 for {team['team']} at {url}, trying season_first URL format as fallback")
-            url = URLBuilder.build_url(team['url'], season, "season_first", entity_type=self.entity_type)
-            logger.info(f"Trying fallback URL: {url}")
-            html = self.fetch_html(url)
+        html, status, url = self._fetch_first_found(team, season, self._url_formats(team, url_format),
+                                                    lambda url: self._fetch_roster_page(team, url))
         
         if not html:
             return []
         
         # Cache HTML for JSON data extraction
         self._last_html = html
-        self._nuxt_data_cache = None  # Reset cache for new page
+        self._nuxt_index = None  # Reset index for new page
 
         # Verify season if it's a Sidearm site
         if SeasonVerifier.is_sidearm_site(html):
@@ -2081,6 +3426,14 @@ class StandardScraper(BaseScraper):
 
         # Find player/coach elements
         elements = self._find_player_elements(html)
+        if not elements and self._is_scoped(html):
+            logger.info(f"No {self.entity_type} elements in scoped parse for {team['team']}, parsing full page")
+            self.context.record('fallbacks')
+            html = self.fetch_html(url, full=True)
+            if html:
+                self._last_html = html
+                self._nuxt_index = None
+                elements = self._find_player_elements(html)
         entity_label = self.entity_config['entity_label']
         logger.info(f"Found {len(elements)} {entity_label} for {team['team']}")
         
@@ -2111,82 +3464,39 @@ class StandardScraper(BaseScraper):
                 
         return roster
 
-    def _get_nuxt_player_data(self, player_name: str, player_url: str) -> Optional[Dict]:
-        """Extract player data from __NUXT__ JSON embedded in page (for Baylor-style sites)
-        
-        NOTE: This method currently cannot parse Baylor's window.__NUXT__ format because
-        it uses a complex deduplicated array structure that requires the actual JavaScript
-        values to be resolved. BeautifulSoup sees the raw HTML source, not the rendered data.
-        
-        FUTURE: This could be enhanced with shot-scraper or Playwright:
-        - Use shot-scraper to execute: `return JSON.stringify(window.__NUXT__)`
-        - Parse the returned JSON and use the existing search logic below
-        - Or use shot-scraper to render the HTML fully, then extract from DOM elements
-        
-        Example shot-scraper command:
-            shot-scraper javascript URL 'return window.__NUXT__' --output data.json
+    def _fetch_roster_page(self, team: Dict, url: str) -> tuple:
+        """Fetch url, rendering JavaScript for JAVASCRIPT_TEAMS unless a plain fetch worked last time"""
+        if team.get('ncaa_id') not in self.JAVASCRIPT_TEAMS:
+            return self.fetch_html(url, return_status=True)
+
+        html, status = None, None
+        for method in self._preferred(team, 'render', ('javascript', 'plain')):
+            if method == 'javascript':
+                html = self.fetch_html_with_javascript(url)
+                status = 200 if html else None  # Set status for JavaScript-rendered pages
+            else:
+                html, status = self.fetch_html(url, return_status=True)
+            if html:
+                self.decisions['render'] = method
+                break
+            logger.warning(f"{'Browser rendering' if method == 'javascript' else 'Regular fetch'} failed "
+                           f"for {team['team']}")
+            self.context.record('fallbacks')
+        return html, status
+
+    def _get_nuxt_record(self, name: str, url: str) -> Optional[Dict]:
+        """Nuxt record of a player or coach on the current page (for Baylor-style sites)
+
+        The page's payload is indexed by NuxtIndex on the first lookup and
+        reused for every other card on the page.
         """
-        if not hasattr(self, '_nuxt_data_cache'):
-            # Cache the NUXT data for this page load
-            self._nuxt_data_cache = None
-            
-        if self._nuxt_data_cache is None:
-            # Try to parse NUXT data from the current page
+        if getattr(self, '_nuxt_index', None) is None:
             try:
-                if hasattr(self, '_last_html') and self._last_html:
-                    import json
-                    import re
-                    
-                    # Look for window.__NUXT__ data
-                    html_text = str(self._last_html)
-                    nuxt_match = re.search(r'window\.__NUXT__\s*=\s*({.+?});?\s*</script>', html_text, re.DOTALL)
-                    if nuxt_match:
-                        try:
-                            nuxt_json = json.loads(nuxt_match.group(1))
-                            self._nuxt_data_cache = nuxt_json
-                            logger.debug("Successfully parsed __NUXT__ data")
-                        except json.JSONDecodeError as e:
-                            logger.debug(f"Failed to parse __NUXT__ JSON: {e}")
+                self._nuxt_index = NuxtIndex.from_html(getattr(self, '_last_html', None))
             except Exception as e:
-                logger.debug(f"Error extracting __NUXT__ data: {e}")
-        
-        # Search for player data in the cached NUXT data
-        if self._nuxt_data_cache:
-            try:
-                # Navigate the NUXT data structure to find roster data
-                # The structure varies but typically: state.data or state.roster
-                def search_for_player(obj, depth=0):
-                    """Recursively search for player data"""
-                    if depth > 10:  # Prevent infinite recursion
-                        return None
-                    
-                    if isinstance(obj, dict):
-                        # Check if this dict looks like player data
-                        if 'firstName' in obj and 'lastName' in obj:
-                            full_name = f"{obj.get('firstName', '')} {obj.get('lastName', '')}".strip()
-                            if full_name.lower() == player_name.lower():
-                                return obj
-                        
-                        # Recurse into dict values
-                        for value in obj.values():
-                            result = search_for_player(value, depth + 1)
-                            if result:
-                                return result
-                    
-                    elif isinstance(obj, list):
-                        # Recurse into list items
-                        for item in obj:
-                            result = search_for_player(item, depth + 1)
-                            if result:
-                                return result
-                    
-                    return None
-                
-                return search_for_player(self._nuxt_data_cache)
-            except Exception as e:
-                logger.debug(f"Error searching __NUXT__ data: {e}")
-        
-        return None
+                logger.debug(f"Error indexing __NUXT__ data: {e}")
+                self._nuxt_index = NuxtIndex([])
+        return self._nuxt_index.lookup(name, url)
 
     def _find_player_elements(self, html):
         """Find player/coach elements using entity-specific selectors"""
@@ -2367,11 +3677,9 @@ class StandardScraper(BaseScraper):
                 relative_url = player_elem.find('a').get('href', '')
                 player_url = self.build_player_url(team['url'], relative_url)
             
-            # For Baylor and similar sites, try to enrich data from JSON if fields are empty
-            # NOTE: Currently non-functional without JavaScript execution (see _get_nuxt_player_data)
-            # This provides the framework for a future shot-scraper/Playwright enhancement
+            # For Baylor and similar sites, try to enrich data from Nuxt JSON if fields are empty
             if player_url and not all([fields.get('position'), fields.get('height'), fields.get('hometown')]):
-                json_data = self._get_nuxt_player_data(name, player_url)
+                json_data = self._get_nuxt_record(name, player_url)
                 if json_data:
                     if not fields.get('position'):
                         fields['position'] = json_data.get('positionShort') or json_data.get('positionLong', '')
@@ -2489,7 +3797,13 @@ class StandardScraper(BaseScraper):
             if coach_elem.find('a'):
                 relative_url = coach_elem.find('a').get('href', '')
                 coach_url = self.build_player_url(team['url'], relative_url)
-            
+
+            # Nuxt staff cards may leave the title to the page's payload
+            if coach_url and not title:
+                record = self._get_nuxt_record(name, coach_url)
+                if record and isinstance(record.get('title'), str):
+                    title = FieldExtractors.clean_text(record['title'])
+
             # Create Player object (reusing same dataclass for coaches)
             # Map coach fields to player fields
             return Player(
@@ -2566,18 +3880,13 @@ class StandardScraper(BaseScraper):
 
 class TableScraper(BaseScraper):
     """Scraper for table-based rosters"""
+
+    PARSE_SCOPE = 'table'
     
     def scrape_roster(self, team: Dict, season: str, url_format: str = "default") -> List[Player]:
         """Scrape roster from table format"""
-        url = URLBuilder.build_url(team['url'], season, url_format, entity_type=self.entity_type)
-        html, status = self.fetch_html(url, return_status=True)
-        
-        # If 404 and using default format, try season_first as fallback
-        if not html and status == 404 and url_format == "default":
-            logger.info(f"Got 404 for {team['team']} at {url}, trying season_first URL format as fallback")
-            url = URLBuilder.build_url(team['url'], season, "season_first", entity_type=self.entity_type)
-            logger.info(f"Trying fallback URL: {url}")
-            html = self.fetch_html(url)
+        html, status, url = self._fetch_first_found(team, season, self._url_formats(team, url_format),
+                                                    lambda url: self.fetch_html(url, return_status=True))
         
         if not html:
             return []
@@ -2603,6 +3912,11 @@ class TableScraper(BaseScraper):
         if not table:
             table = html.find('table')
 
+        if not table and self._is_scoped(html):
+            self.context.record('fallbacks')
+            html = self.fetch_html(url, full=True)
+            table = html.find('table') if html else None
+
         if not table:
             logger.warning(f"No table found for {team['team']} at {url}")
             return []
@@ -2818,9 +4132,33 @@ class TableScraper(BaseScraper):
 
 class JavaScriptScraper(BaseScraper):
     """Scraper using JavaScript execution for dynamic content"""
+
+    # Elements each player template reads; the pooled browser waits for these instead of sleeping
+    WAIT_SELECTORS = {
+        'nuxt_roster': '#__NUXT_DATA__',
+        's_person_card': '.s-person-card',
+        'sidearm_roster_player': '.sidearm-roster-player',
+        'wyoming_roster': '.sidearm-roster-list-item',
+        'auburn_roster': 'a[href*="/roster/player/"]',
+        'oregon_state_roster': '.s-table-body__row',
+        'virginia_roster_table': '#players-table tbody tr',
+        'miami_table_roster': '#players-table tbody tr',
+    }
+
+    # Fallback chains for Nuxt sites by entity type: the platform cache decision and its options in default order
+    NUXT_CHAINS = {
+        'player': ('nuxt_players', ('native', 'browser')),
+        'coach': ('nuxt_coaches', ('coaching_staff', 'nuxt_data')),
+    }
+    NUXT_TEMPLATES = {
+        'browser': JSTemplates.nuxt_data_template,
+        'coaching_staff': JSTemplates.coaching_staff_template,
+        'nuxt_data': JSTemplates.nuxt_data_coaches_template,
+    }
     
-    def __init__(self, use_playwright: bool = False, entity_type: str = 'player'):
-        super().__init__(entity_type=entity_type)
+    def __init__(self, use_playwright: bool = False, entity_type: str = 'player',
+                 context: Optional[ScrapeContext] = None):
+        super().__init__(entity_type=entity_type, context=context)
         self.use_playwright = use_playwright and PLAYWRIGHT_AVAILABLE
 
     def scrape_roster(self, team: Dict, season: str, js_selector: str, url_format: str = "default", base_url: str = "") -> List[Player]:
@@ -2829,19 +4167,20 @@ class JavaScriptScraper(BaseScraper):
         
         # Get JavaScript code from templates based on entity type
         if js_selector == 'nuxt_roster':
-            if self.entity_type == 'coach':
-                # Try coaching-staff section first, fallback to __NUXT_DATA__
-                js_code = JSTemplates.coaching_staff_template()
-                result = self._scrape_with_shot_scraper(url, js_code, team, season, base_url) if not self.use_playwright else self._scrape_with_playwright(url, js_code, team, season, base_url)
-                
-                # If no coaches found, try __NUXT_DATA__ approach
-                if not result:
-                    logger.info(f"No coaches found in #coaching-staff, trying __NUXT_DATA__ for {team['team']}")
-                    js_code = JSTemplates.nuxt_data_coaches_template()
+            # Players: decode __NUXT_DATA__ from the static page, else render it in a browser.
+            # Coaches: the #coaching-staff section, else __NUXT_DATA__. Whatever worked last time goes first.
+            decision, options = self.NUXT_CHAINS[self.entity_type]
+            for option in self._preferred(team, decision, options):
+                if option == 'native':
+                    result = self._scrape_nuxt_data_natively(url, team, season, base_url)
                 else:
+                    result = self._run_js(url, self.NUXT_TEMPLATES[option](), team, season, base_url, js_selector)
+                if result:
+                    self.decisions[decision] = option
                     return result
-            else:
-                js_code = JSTemplates.nuxt_data_template()
+                logger.info(f"No {self.entity_config['entity_label']} found via {option} for {team['team']}")
+                self.context.record('fallbacks')
+            return []
         elif js_selector == 's_person_card':
             if self.entity_type == 'coach':
                 js_code = JSTemplates.s_person_card_coaches_template()
@@ -2868,26 +4207,66 @@ class JavaScriptScraper(BaseScraper):
         if '{{SEASON}}' in js_code:
             js_code = js_code.replace('{{SEASON}}', season)
         
-        if self.use_playwright:
-            return self._scrape_with_playwright(url, js_code, team, season, base_url)
+        return self._run_js(url, js_code, team, season, base_url, js_selector)
+
+    def _scrape_nuxt_data_natively(self, url: str, team: Dict, season: str, base_url: str = "") -> List[Player]:
+        """Scrape a Nuxt roster by decoding its __NUXT_DATA__ payload without a browser"""
+        html = self.fetch_html(url)
+        decoder = NuxtDataDecoder.from_html(html)
+        if not decoder:
+            return []
+        try:
+            players = decoder.roster_players()
+        except (IndexError, TypeError, ValueError, RecursionError) as e:
+            logger.warning(f"Failed to decode __NUXT_DATA__ for {team['team']}: {e}")
+            return []
+        if players:
+            logger.info(f"Decoded {len(players)} players from __NUXT_DATA__ for {team['team']}")
+        return self._process_js_result(players, team, season, base_url)
+
+    def _run_js(self, url: str, js_code: str, team: Dict, season: str, base_url: str, js_selector: str) -> List[Player]:
+        """Run a template with the shared browser pool, Playwright, or shot-scraper (or replay its result)"""
+        archive = self.context.archive
+        if archive and archive.replaying:
+            data = archive.script_result(url, js_code)
         else:
-            return self._scrape_with_shot_scraper(url, js_code, team, season, base_url)
+            self.context.throttle(url)
+            with self.context.timed('browser_seconds'):
+                data = self._evaluate(url, js_code, js_selector)
+            if archive and data is not None:
+                archive.save_script_result(url, js_code, data)
+        return self._process_js_result(data or [], team, season, base_url)
+
+    def _evaluate(self, url: str, js_code: str, js_selector: str) -> Any:
+        """Result of running js_code on url with the shared browser pool, Playwright, or shot-scraper"""
+        if self.context.browser_pool:
+            # Coach templates read a variety of containers, so let the network settle instead
+            wait_for = self.WAIT_SELECTORS.get(js_selector) if self.entity_type == 'player' else None
+            return self._evaluate_with_browser_pool(url, js_code, wait_for)
+        if self.use_playwright:
+            return self._evaluate_with_playwright(url, js_code)
+        return self._evaluate_with_shot_scraper(url, js_code)
+
+    def _evaluate_with_browser_pool(self, url: str, js_code: str, wait_for: Optional[str] = None) -> Any:
+        """Evaluate a template in a persistent browser context from the shared pool"""
+        try:
+            return self.context.browser_pool.evaluate(url, js_code, wait_for=wait_for)
+        except Exception as e:
+            logger.error(f"Pooled browser scraping failed for {url}: {e}")
+            return None
 
-    def _scrape_with_shot_scraper(self, url: str, js_code: str, team: Dict, season: str, base_url: str = "") -> List[Player]:
-        """Scrape using shot-scraper"""
+    def _evaluate_with_shot_scraper(self, url: str, js_code: str) -> Any:
+        """Evaluate a template using shot-scraper"""
         try:
-            cmd = ['uv', 'run', 'shot-scraper', 'javascript', url, js_code, '--user-agent', 'Firefox', '--bypass-csp']
+            cmd = ['uv', 'run', 'shot-scraper', 'javascript', url, js_code, '--user-agent', BROWSER_USER_AGENT, '--bypass-csp']
             result = subprocess.check_output(cmd, timeout=120)
-            data = json.loads(result.decode('utf-8'))
-            
-            return self._process_js_result(data, team, season, base_url)
-            
+            return json.loads(result.decode('utf-8'))
         except (subprocess.CalledProcessError, json.JSONDecodeError, subprocess.TimeoutExpired) as e:
             logger.error(f"Shot-scraper failed for {url}: {e}")
-            return []
+            return None
 
-    def _scrape_with_playwright(self, url: str, js_code: str, team: Dict, season: str, base_url: str = "") -> List[Player]:
-        """Scrape using Playwright"""
+    def _evaluate_with_playwright(self, url: str, js_code: str) -> Any:
+        """Evaluate a template using a one-off Playwright browser"""
         try:
             with sync_playwright() as p:
                 browser = p.chromium.launch()
@@ -2897,11 +4276,10 @@ class JavaScriptScraper(BaseScraper):
                 
                 result = page.evaluate(js_code)
                 browser.close()
-                
-                return self._process_js_result(result, team, season, base_url)
+                return result
         except Exception as e:
             logger.error(f"Playwright scraping failed for {url}: {e}")
-            return []
+            return None
 
     def _process_js_result(self, data: List[Dict], team: Dict, season: str, base_url: str = "") -> List[Player]:
         """Process JavaScript scraping result"""
@@ -2969,7 +4347,7 @@ class VueDataScraper(BaseScraper):
         url = URLBuilder.build_url(team['url'], season, url_format, entity_type=self.entity_type)
         
         try:
-            response = self.session.get(url, timeout=30)
+            response = self.context.get(self.session, url, timeout=30)
             response.raise_for_status()
             html_text = response.text
         except requests.RequestException as e:
@@ -3064,27 +4442,418 @@ class ScraperFactory:
     @classmethod
     def create_scraper(cls, scraper_type: str, entity_type: str = 'player', **kwargs) -> BaseScraper:
         """Create appropriate scraper based on type"""
+        context = kwargs.get('context')
         if scraper_type == "standard":
-            return StandardScraper(entity_type=entity_type)
+            return StandardScraper(entity_type=entity_type, context=context)
         elif scraper_type == "table":
-            return TableScraper(entity_type=entity_type)
+            return TableScraper(entity_type=entity_type, context=context)
         elif scraper_type == "javascript":
-            return JavaScriptScraper(entity_type=entity_type, use_playwright=kwargs.get('use_playwright', False))
+            return JavaScriptScraper(entity_type=entity_type, use_playwright=kwargs.get('use_playwright', False),
+                                     context=context)
         elif scraper_type == "vue_data":
-            return VueDataScraper(entity_type=entity_type)
+            return VueDataScraper(entity_type=entity_type, context=context)
         else:
-            return StandardScraper(entity_type=entity_type)
+            return StandardScraper(entity_type=entity_type, context=context)
+
+
+class RosterCSVWriter:
+    """Streams roster rows to CSV as each team finishes, with a journal for --resume
+
+    After a team's rows are written and synced, one JSON line is appended to
+    <output>.journal recording the team, its zero-player/failed-year-check
+    entries and the CSV size at that point. Resuming truncates the CSV back to
+    the last journaled size (dropping a team that was only partly written) and
+    skips every journaled team. The journal is removed once the run completes.
+    """
+
+    def __init__(self, output_file: str, fieldnames: List[str], resume: bool = False):
+        self.output_file = output_file
+        self.journal_file = f"{output_file}.journal"
+        self.completed: Dict[int, Dict] = {}
+        self.rows_written = 0
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+
+        offset = self._load_journal() if resume else 0
+        if offset:
+            os.truncate(output_file, offset)
+            self._file = open(output_file, 'a', newline='', encoding='utf-8')
+        else:
+            self.completed = {}
+            self._file = open(output_file, 'w', newline='', encoding='utf-8')
+            csv.DictWriter(self._file, fieldnames=fieldnames).writeheader()
+            self._sync(self._file)
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+
+        # Rewrite the journal so a partial last line from a crash is not appended to; the rewrite goes
+        # through a temp file so a crash part-way keeps the old journal (and --resume still has it)
+        tmp_path = f"{self.journal_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in self.completed.values():
+                f.write(json.dumps(record) + '\n')
+            self._sync(f)
+        os.replace(tmp_path, self.journal_file)
+        self._journal = open(self.journal_file, 'a', encoding='utf-8')
+
+    def _load_journal(self) -> int:
+        """Read completed teams from the journal and return the CSV size to resume from"""
+        if not os.path.exists(self.journal_file) or not os.path.exists(self.output_file):
+            logger.info(f"Nothing to resume for {self.output_file}, starting a new run")
+            return 0
+        offset = 0
+        with open(self.journal_file, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # Interrupted while writing this line
+                self.completed[record['team_id']] = record
+                offset = record['offset']
+        if offset > os.path.getsize(self.output_file):
+            logger.warning(f"{self.output_file} is shorter than its journal, starting a new run")
+            return 0
+        self.rows_written = sum(record['players'] for record in self.completed.values())
+        logger.info(f"Resuming {self.output_file}: {len(self.completed)} teams and {self.rows_written} rows already written")
+        return offset
+
+    @staticmethod
+    def _sync(f) -> int:
+        f.flush()
+        os.fsync(f.fileno())
+        return os.fstat(f.fileno()).st_size
+
+    def write_team(self, team: Dict, rows: List[Dict], zero_player: Optional[Dict] = None,
+                   failed_year_check: Optional[Dict] = None, fingerprint: Optional[str] = None,
+                   changed: bool = False):
+        """Append a finished team's rows and journal it"""
+        for row in rows:
+            self._writer.writerow(row)
+        record = {
+            'team_id': team['ncaa_id'],
+            'team_name': team.get('team', ''),
+            'players': len(rows),
+            'offset': self._sync(self._file),
+            'zero_player': zero_player,
+            'failed_year_check': failed_year_check,
+            'fingerprint': fingerprint,
+            'changed': changed
+        }
+        self._journal.write(json.dumps(record) + '\n')
+        self._sync(self._journal)
+        self.completed[team['ncaa_id']] = record
+        self.rows_written += len(rows)
+
+    def close(self, complete: bool = True):
+        """Close the CSV, removing the journal if every team was written"""
+        self._file.close()
+        self._journal.close()
+        if complete:
+            os.remove(self.journal_file)
+
+
+class RosterSnapshot:
+    """The previous run's rows and roster fingerprints, used by --incremental
+
+    Fingerprints (a hash of the normalized roster section of each team's page)
+    are kept in <output>.hashes.json. Before the output CSV is rewritten it is
+    copied to <output>.previous, so rows of unchanged teams can be carried over
+    even if the run is interrupted and resumed. The copy is removed when the
+    run completes.
+    """
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self.hashes_file = f"{output_file}.hashes.json"
+        self.previous_file = f"{output_file}.previous"
+        self.selected: Optional[set] = None
+        self.records: Dict[int, Dict] = {}
+        self.rows_by_team: Dict[int, List[Dict]] = {}
+
+        if os.path.exists(self.hashes_file):
+            with open(self.hashes_file, encoding='utf-8') as f:
+                self.records = {int(team_id): record for team_id, record in json.load(f).items()}
+        if not os.path.exists(self.previous_file) and os.path.exists(output_file):
+            shutil.copyfile(output_file, self.previous_file)
+        if os.path.exists(self.previous_file):
+            with open(self.previous_file, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    self.rows_by_team.setdefault(int(row['team_id']), []).append(row)
+
+    def is_unchanged(self, team_id: int, fingerprint: Optional[str]) -> bool:
+        """True if the team's roster section hashes the same as in the last run, which scraped it successfully"""
+        record = self.records.get(team_id)
+        if not record or record.get('zero_player') or record.get('failed_year_check'):
+            return False  # hashes files from before failed scrapes were left unfingerprinted
+        return bool(fingerprint and record.get('fingerprint') == fingerprint)
+
+    def carries(self, team_id: int) -> bool:
+        """True if the team is outside a -teams selection, so its previous rows are kept as-is"""
+        return self.selected is not None and team_id not in self.selected
+
+    def rows(self, team_id: int) -> List[Dict]:
+        return self.rows_by_team.get(team_id, [])
+
+    def save(self, records: Dict[int, Dict]):
+        """Write the fingerprints of a completed run and drop the previous-rows copy"""
+        hashes = {str(team_id): {key: record.get(key) for key in
+                                 ('fingerprint', 'players', 'zero_player', 'failed_year_check')}
+                  for team_id, record in records.items()}
+        with open(self.hashes_file, 'w', encoding='utf-8') as f:
+            json.dump(hashes, f, indent=1)
+        if os.path.exists(self.previous_file):
+            os.remove(self.previous_file)
+
+
+class ColumnarExport:
+    """Parquet or Arrow IPC copies of roster CSVs, for --format
+
+    Columns are typed rather than text: team_id is an integer and the
+    low-cardinality columns (team, season, position/title, academic year)
+    are dictionary encoded. Notebooks load a multi-season file with
+    pandas.read_parquet / read_feather, or arrow::read_parquet in R, in a
+    fraction of the time and memory of re-parsing the CSV. Everything else
+    stays a string, so jerseys like "00" survive.
+    """
+
+    EXTENSIONS = {'parquet': '.parquet', 'arrow': '.arrow'}
+    INTEGER_COLUMNS = ('team_id',)
+    DICTIONARY_COLUMNS = ('team', 'season', 'position', 'title', 'academic_year')
+
+    @classmethod
+    def output_file(cls, csv_file: str, fmt: str) -> str:
+        base = csv_file[:-4] if csv_file.endswith('.csv') else csv_file
+        return base + cls.EXTENSIONS[fmt]
+
+    @classmethod
+    def read_csv(cls, csv_file: str) -> 'pa.Table':
+        """Read a roster CSV into a typed Arrow table"""
+        with open(csv_file, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), [])
+        if not header:
+            return pa.table({})  # an empty file; pyarrow refuses to read one
+        # A blank team_id reads as null rather than failing the whole file
+        table = pa_csv.read_csv(csv_file, convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.int32() if name in cls.INTEGER_COLUMNS else pa.string() for name in header},
+            strings_can_be_null=False))
+        columns = [table.column(name).dictionary_encode() if name in cls.DICTIONARY_COLUMNS else table.column(name)
+                   for name in table.column_names]
+        return pa.table(columns, names=table.column_names)
+
+    @classmethod
+    def export(cls, csv_file: str, fmt: str) -> str:
+        """Write csv_file as fmt alongside it, replacing any earlier copy atomically; returns the new path"""
+        table = cls.read_csv(csv_file)
+        output_file = cls.output_file(csv_file, fmt)
+        temp_file = f"{output_file}.tmp"
+        if fmt == 'parquet':
+            pq.write_table(table, temp_file, compression='zstd')
+        else:
+            with pa.OSFile(temp_file, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temp_file, output_file)
+        logger.info(f"Saved {table.num_rows} rows as {fmt} to {output_file}")
+        return output_file
+
+
+class CrawlQueue:
+    """SQLite work queue of (team, season, entity type) jobs with leases, for --enqueue/--work/--merge
+
+    Any number of worker processes, on this machine or on others sharing the
+    database file, claim jobs by leasing them for lease_seconds and keep
+    renewing the lease while they run. A job whose lease runs out (its worker
+    died or lost the filesystem) goes back to the pool; one that fails or
+    loses its lease max_attempts times is given up and merged as a
+    zero-player team. Finished jobs keep their CSV rows and zero-player /
+    failed-year-check entries in the database until --merge writes the
+    usual output files.
+
+    The database keeps SQLite's default rollback journal: WAL mode does not
+    work across machines on a network filesystem.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            team_id INTEGER NOT NULL,
+            season TEXT NOT NULL,
+            entity_type TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            team TEXT NOT NULL,
+            state TEXT NOT NULL DEFAULT 'pending',
+            worker TEXT,
+            lease_expires REAL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            result TEXT,
+            error TEXT,
+            PRIMARY KEY (team_id, season, entity_type)
+        );
+        CREATE INDEX IF NOT EXISTS jobs_by_state ON jobs (state, position);
+    """
+    KEY = "team_id = ? AND season = ? AND entity_type = ?"
+
+    def __init__(self, db_path: str, lease_seconds: float = 600, max_attempts: int = 3):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        with self._db() as db:
+            db.executescript(self.SCHEMA)
+
+    @contextmanager
+    def _db(self):
+        # A connection per call, so worker threads never share one
+        db = sqlite3.connect(self.db_path, timeout=60, isolation_level=None)
+        db.create_function('url_host', 1, lambda url: urlparse(url or '').netloc.lower(), deterministic=True)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @staticmethod
+    def _key(job: Dict) -> tuple:
+        return job['team_id'], job['season'], job['entity_type']
+
+    def enqueue(self, teams: List[Dict], seasons: List[str], entity_types: List[str]) -> int:
+        """Add a job for every team, season and entity type not queued yet; returns how many were added"""
+        with self._db() as db:
+            db.execute('BEGIN IMMEDIATE')
+            before = db.total_changes
+            db.executemany(
+                "INSERT OR IGNORE INTO jobs (team_id, season, entity_type, position, team) VALUES (?, ?, ?, ?, ?)",
+                [(team['ncaa_id'], season, entity_type, position, json.dumps(team))
+                 for position, team in enumerate(teams) for season in seasons for entity_type in entity_types])
+            added = db.total_changes - before
+            db.execute('COMMIT')
+        return added
+
+    def claim(self, worker: str, after: Optional[Dict] = None) -> Optional[Dict]:
+        """Lease the next pending (or abandoned) job to worker, or None when there is nothing left to claim
+
+        after is the job the claiming thread last held: another season of the
+        same team, then another team on the same host, comes first so the
+        thread reuses its warm connection. Otherwise the job comes from the
+        host with the fewest live leases, so threads and processes spread over
+        hosts instead of queueing on one host's per-host limit.
+        """
+        now = time.time()
+        last_team = after['team_id'] if after else None
+        last_host = urlparse(after['team'].get('url') or '').netloc.lower() if after else None
+        with self._db() as db:
+            db.execute('BEGIN IMMEDIATE')
+            db.execute("UPDATE jobs SET state = 'failed', error = 'lease expired on every attempt' "
+                       "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?", (now, self.max_attempts))
+            row = db.execute("WITH busy AS (SELECT url_host(json_extract(team, '$.url')) AS host, COUNT(*) AS leases "
+                             "FROM jobs WHERE state = 'leased' AND lease_expires >= ? GROUP BY host) "
+                             "SELECT team_id, season, entity_type, team, attempts FROM jobs "
+                             "LEFT JOIN busy ON busy.host = url_host(json_extract(jobs.team, '$.url')) "
+                             "WHERE state = 'pending' OR (state = 'leased' AND lease_expires < ?) "
+                             "ORDER BY team_id IS ? DESC, url_host(json_extract(jobs.team, '$.url')) IS ? DESC, "
+                             "COALESCE(busy.leases, 0), position, season, entity_type LIMIT 1",
+                             (now, now, last_team, last_host)).fetchone()
+            if row:
+                db.execute(f"UPDATE jobs SET state = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1 "
+                           f"WHERE {self.KEY}", (worker, now + self.lease_seconds) + tuple(row[:3]))
+            db.execute('COMMIT')
+        if not row:
+            return None
+        return {'team_id': row[0], 'season': row[1], 'entity_type': row[2], 'team': json.loads(row[3]),
+                'attempts': row[4] + 1}
+
+    def renew(self, worker: str):
+        """Extend the leases of every job worker holds"""
+        with self._db() as db:
+            db.execute("UPDATE jobs SET lease_expires = ? WHERE worker = ? AND state = 'leased'",
+                       (time.time() + self.lease_seconds, worker))
+
+    def complete(self, job: Dict, worker: str, result: Dict) -> bool:
+        """Store a finished job's result; False if its lease was lost and the result is discarded"""
+        with self._db() as db:
+            cursor = db.execute(f"UPDATE jobs SET state = 'done', result = ?, lease_expires = NULL, error = NULL "
+                                f"WHERE {self.KEY} AND state = 'leased' AND worker = ?",
+                                (json.dumps(result),) + self._key(job) + (worker,))
+            return cursor.rowcount == 1
+
+    def fail(self, job: Dict, worker: str, error: str):
+        """Release a job that raised, to be retried unless it has used up its attempts"""
+        with self._db() as db:
+            db.execute(f"UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                       f"error = ?, worker = NULL, lease_expires = NULL "
+                       f"WHERE {self.KEY} AND state = 'leased' AND worker = ?",
+                       (self.max_attempts, error) + self._key(job) + (worker,))
+
+    def results(self, entity_type: str, season: str) -> List[tuple]:
+        """(team, state, result, error) for every job of an entity type and season, in teams.json order"""
+        with self._db() as db:
+            rows = db.execute("SELECT team, state, result, error FROM jobs WHERE entity_type = ? AND season = ? "
+                              "ORDER BY position", (entity_type, season)).fetchall()
+        return [(json.loads(team), state, json.loads(result) if result else None, error)
+                for team, state, result, error in rows]
+
+    def counts(self) -> Dict[str, int]:
+        with self._db() as db:
+            return dict(db.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall())
+
+    def stats(self) -> str:
+        counts = self.counts()
+        return "Work queue: " + ', '.join(f"{counts.get(state, 0)} {state}"
+                                          for state in ('pending', 'leased', 'done', 'failed'))
+
+
+class QueueJobWriter:
+    """Stands in for RosterCSVWriter in --work mode, storing a finished team's rows in the queue"""
+
+    def __init__(self, queue: CrawlQueue, job: Dict, worker: str):
+        self.queue = queue
+        self.job = job
+        self.worker = worker
+        self.completed: Dict[int, Dict] = {}
+
+    def write_team(self, team: Dict, rows: List[Dict], zero_player: Optional[Dict] = None,
+                   failed_year_check: Optional[Dict] = None, fingerprint: Optional[str] = None,
+                   changed: bool = False):
+        result = {'rows': rows, 'zero_player': zero_player, 'failed_year_check': failed_year_check}
+        if not self.queue.complete(self.job, self.worker, result):
+            logger.warning(f"Lease on {team['team']} {self.job['season']} expired before it finished; "
+                           f"discarding this result")
+
+
+def interleave_by_host(items: List, url_of) -> List:
+    """Reorder items round-robin across their hosts, keeping each host's items in their original order
+
+    Hosts take turns in order of first appearance, so consecutive items (the
+    ones a worker pool starts together) are for different hosts and no
+    worker sits waiting on a host that is already at its per-host limit.
+    """
+    by_host: Dict[str, List] = {}
+    for item in items:
+        by_host.setdefault(urlparse(url_of(item)).netloc.lower(), []).append(item)
+    rounds = max((len(host_items) for host_items in by_host.values()), default=0)
+    return [host_items[i] for i in range(rounds) for host_items in by_host.values() if i < len(host_items)]
 
 
 class RosterManager:
     """Main class for managing roster scraping operations"""
     
-    def __init__(self, teams_file: str = "/Users/dwillis/code/wbb/ncaa/teams.json", entity_type: str = 'player'):
+    def __init__(self, teams_file: str = "/Users/dwillis/code/wbb/ncaa/teams.json", entity_type: str = 'player',
+                 workers: int = 1, per_host_limit: int = 2, context: Optional[ScrapeContext] = None,
+                 teams_data: Optional[List[Dict]] = None):
         self.teams_file = teams_file
-        self.teams_data = self._load_teams()
+        # Managers for other seasons or entity types of the same run share the loaded teams
+        self.teams_data = teams_data if teams_data is not None else self._load_teams()
         self.zero_player_teams = []
         self.failed_year_check_teams = []
         self.entity_type = entity_type
+        self.workers = max(1, workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_semaphores_lock = threading.Lock()
+        self._team_state_map: Optional[Dict[int, str]] = None
+        # Set by scrape_to_csv(incremental=True)
+        self.snapshot: Optional[RosterSnapshot] = None
+        self._fingerprints: Dict[int, Optional[str]] = {}
+        self.changed_teams: List[Dict] = []
+        # Keep a few pages per worker so the season check can reuse what the scraper fetched
+        self.context = context or ScrapeContext(page_cache=PageCache(max_entries=max(128, self.workers * 8)),
+                                                session=create_session(pool_maxsize=self.per_host_limit,
+                                                                       retry_statuses=(500, 502, 504)),
+                                                rate_limiter=HostRateLimiter())
 
     def _load_teams(self) -> List[Dict]:
         """Load teams data from JSON file"""
@@ -3107,75 +4876,476 @@ class RosterManager:
     def scrape_team_roster(self, team: Dict, season: str) -> List[Player]:
         """Scrape roster for a single team"""
         config = TeamConfig.get_config(team['ncaa_id'])
-        scraper = ScraperFactory.create_scraper(config['type'], entity_type=self.entity_type)
+        scraper = ScraperFactory.create_scraper(config['type'], entity_type=self.entity_type, context=self.context)
+        self.context.note('scraper', config['type'])
 
         logger.info(f"Scraping {team['team']} (ID: {team['ncaa_id']}) for {season}")
         logger.info(f"Using config: {config}")
 
         try:
-            if config['type'] == 'javascript':
-                selector = config.get('selector', 'nuxt_roster')
-                url_format = config.get('url_format', 'default')
-                base_url = config.get('base_url', '')
-                return scraper.scrape_roster(team, season, selector, url_format, base_url)
-            elif config['type'] == 'table':
-                url_format = config.get('url_format', 'default')
-                return scraper.scrape_roster(team, season, url_format)
-            elif config['type'] == 'vue_data':
-                url_format = config.get('url_format', 'default')
-                return scraper.scrape_roster(team, season, url_format)
-            else:
-                url_format = config.get('url_format', 'default')
-                return scraper.scrape_roster(team, season, url_format)
+            players = self._run_scraper(scraper, config, team, season)
+            platform_cache = self.context.platform_cache
+            if platform_cache and not players and scraper.followed_platform_cache:
+                # The path that worked last time found nothing; walk the whole fallback chain
+                logger.info(f"Cached scraping path found nothing for {team['team']}, trying all fallbacks")
+                self.context.record('fallbacks')
+                scraper = ScraperFactory.create_scraper(config['type'], entity_type=self.entity_type,
+                                                        context=self.context)
+                scraper.use_platform_cache = False
+                players = self._run_scraper(scraper, config, team, season)
+            if platform_cache and players and scraper.decisions:
+                platform_cache.record(team['ncaa_id'], self.entity_type, scraper.decisions)
+            self.context.note('url_format', scraper.decisions.get('url_format', config.get('url_format', 'default')))
+            self.context.note('path', scraper.decisions)
+            return players
         except Exception as e:
             logger.error(f"Failed to scrape {team['team']}: {e}")
+            self.context.note('error', str(e))
             return []
 
-    def scrape_multiple_teams(self, season: str, team_ids: Optional[List[int]] = None) -> List[Player]:
-        """Scrape rosters for multiple teams"""
-        teams = self.get_teams(team_ids)
+    def _run_scraper(self, scraper: BaseScraper, config: Dict, team: Dict, season: str) -> List[Player]:
+        """Call the scraper with the arguments its type takes"""
+        url_format = config.get('url_format', 'default')
+        with self.context.timed('extract_seconds'):
+            if config['type'] == 'javascript':
+                selector = config.get('selector', 'nuxt_roster')
+                base_url = config.get('base_url', '')
+                return scraper.scrape_roster(team, season, selector, url_format, base_url)
+            return scraper.scrape_roster(team, season, url_format)
+
+    def _url_formats(self, team: Dict, url_format: str) -> tuple:
+        """URL formats to try in order, starting with the one the platform cache says worked last"""
+        if url_format != 'default':
+            return (url_format,)
+        if not self.context.platform_cache:
+            return ('default', 'season_first')
+        return self.context.platform_cache.order(team['ncaa_id'], self.entity_type, 'url_format',
+                                                 ('default', 'season_first'))
+
+    def scrape_multiple_teams(self, season: str, team_ids: Optional[List[int]] = None,
+                              writer: Optional[RosterCSVWriter] = None) -> List[Player]:
+        """Scrape rosters for multiple teams
+
+        With more than one worker, teams are scraped concurrently (at most
+        per_host_limit at a time against any one host), but results are still
+        recorded in teams.json order so the output is deterministic.
+
+        With a writer, each team's rows are streamed to its CSV as soon as the
+        team finishes instead of being returned, and teams the writer already
+        completed in an interrupted run are skipped.
+        """
+        teams = self._pending_teams(self.get_teams(team_ids), writer)
         all_players = []
+        for team, (players, year_check_failed, error) in zip(teams, self._scrape_teams(teams, season)):
+            all_players.extend(self._record_team(team, players, year_check_failed, error, writer))
+        return all_players
+
+    def _pending_teams(self, teams: List[Dict], writer: Optional[RosterCSVWriter]) -> List[Dict]:
+        """Drop teams the writer already completed in an interrupted run, restoring their zero/failed entries"""
+        if not writer or not writer.completed:
+            return teams
+        for record in writer.completed.values():
+            if record['zero_player']:
+                self.zero_player_teams.append(record['zero_player'])
+            if record['failed_year_check']:
+                self.failed_year_check_teams.append(record['failed_year_check'])
+        teams = [t for t in teams if t['ncaa_id'] not in writer.completed]
+        logger.info(f"Skipping {len(writer.completed)} teams already written, {len(teams)} remaining")
+        return teams
+
+    def _record_team(self, team: Dict, players: Optional[List[Player]], year_check_failed: bool,
+                     error: Optional[Exception], writer: Optional[RosterCSVWriter]) -> List[Player]:
+        """Log a scraped team, note zero-player/failed-year-check teams and write or return its players"""
         entity_label = ENTITY_CONFIGS[self.entity_type]['entity_label']
+        zero_player = None
+        failed_year_check = None
+
+        if players is None:
+            # Roster unchanged since the last incremental run (or outside its -teams selection)
+            record = self.snapshot.records.get(team['ncaa_id'], {})
+            if record.get('zero_player'):
+                self.zero_player_teams.append(record['zero_player'])
+            if record.get('failed_year_check'):
+                self.failed_year_check_teams.append(record['failed_year_check'])
+            if writer:
+                writer.write_team(team, self.snapshot.rows(team['ncaa_id']), record.get('zero_player'),
+                                  record.get('failed_year_check'),
+                                  self._fingerprints.get(team['ncaa_id'], record.get('fingerprint')))
+            return []
 
-        for team in teams:
-            try:
-                players = self.scrape_team_roster(team, season)
-                all_players.extend(players)
+        if error:
+            logger.error(f"Failed to scrape {team['team']}: {error}")
+            # Only add to zero players, not year check failures
+            zero_player = {
+                'team_id': team['ncaa_id'],
+                'team_name': team['team']
+            }
+            players = []
+        else:
+            if year_check_failed:
+                failed_year_check = {
+                    'team_id': team['ncaa_id'],
+                    'team_name': team['team'],
+                    'url': team['url']
+                }
+                logger.warning(f"Year verification failed for {team['team']} (ID: {team['ncaa_id']})")
 
-                # Check for year verification failure first
-                year_check_failed = not self._verify_team_season(team, season)
-                
-                if year_check_failed:
-                    self.failed_year_check_teams.append({
+            # Only add to zero players if year check passed but no players found
+            if len(players) == 0:
+                if not year_check_failed:
+                    zero_player = {
                         'team_id': team['ncaa_id'],
-                        'team_name': team['team'],
-                        'url': team['url']
-                    })
-                    logger.warning(f"Year verification failed for {team['team']} (ID: {team['ncaa_id']})")
-
-                # Only add to zero players if year check passed but no players found
-                if len(players) == 0:
-                    if not year_check_failed:
-                        self.zero_player_teams.append({
-                            'team_id': team['ncaa_id'],
-                            'team_name': team['team']
-                        })
-                        logger.warning(f"No {entity_label} scraped from {team['team']} (ID: {team['ncaa_id']})")
-                    else:
-                        logger.info(f"No {entity_label} scraped from {team['team']} but year check failed - not counting as zero {entity_label}")
+                        'team_name': team['team']
+                    }
+                    logger.warning(f"No {entity_label} scraped from {team['team']} (ID: {team['ncaa_id']})")
                 else:
-                    logger.info(f"Scraped {len(players)} {entity_label} from {team['team']}")
+                    logger.info(f"No {entity_label} scraped from {team['team']} but year check failed - not counting as zero {entity_label}")
+            else:
+                logger.info(f"Scraped {len(players)} {entity_label} from {team['team']}")
+
+        if zero_player:
+            self.zero_player_teams.append(zero_player)
+        if failed_year_check:
+            self.failed_year_check_teams.append(failed_year_check)
+
+        if writer:
+            rows = [self._csv_row(player) for player in players]
+            changed = self.snapshot is not None and self._rows_changed(team['ncaa_id'], rows)
+            # Only a successful scrape is fingerprinted, so a failed or empty one is retried next run
+            fingerprint = self._fingerprints.get(team['ncaa_id']) if players and not (error or year_check_failed) \
+                else None
+            writer.write_team(team, rows, zero_player, failed_year_check, fingerprint, changed)
+            return []
+        return players
 
-            except Exception as e:
-                logger.error(f"Failed to scrape {team['team']}: {e}")
-                # Only add to zero players, not year check failures
-                self.zero_player_teams.append({
-                    'team_id': team['ncaa_id'],
-                    'team_name': team['team']
-                })
+    def scrape_to_csv(self, season: str, output_file: str, team_ids: Optional[List[int]] = None,
+                      resume: bool = False, incremental: bool = False) -> int:
+        """Scrape teams and stream their rows to output_file, returning the number of rows written
+
+        With incremental, teams whose roster section hashes the same as in the
+        last incremental run keep their existing rows without being extracted
+        again, and with team_ids only those teams are refreshed while every
+        other team's rows are kept. Teams whose rows changed are collected in
+        changed_teams.
+        """
+        writer, team_ids = self._open_csv(output_file, team_ids, resume, incremental)
+        if writer is None:
+            return 0
+        try:
+            self.scrape_multiple_teams(season, team_ids, writer=writer)
+        except BaseException:
+            writer.close(complete=False)
+            logger.info(f"Run interrupted; rerun with --resume to continue {output_file}")
+            raise
+        return self._close_csv(writer, output_file)
+
+    def scrape_seasons_to_csv(self, seasons: List[str], output_files: Dict[str, str],
+                              team_ids: Optional[List[int]] = None, resume: bool = False,
+                              incremental: bool = False) -> Dict[str, 'RosterManager']:
+        """Scrape several seasons in one pass, streaming each season to its own CSV
+
+        Each season gets its own RosterManager (zero-player and failed-year
+        lists, resume journal, incremental snapshot) sharing this manager's
+        teams, context and per-host limits. The unit of work is a team with
+        all its pending seasons, run back to back on one worker so the host's
+        pooled connection is reused across seasons. Teams are interleaved
+        across hosts (see interleave_by_host), so the workers spread over
+        every host instead of queueing on one host's per-host limit. Returns
+        the manager of each season.
+        """
+        managers: Dict[str, RosterManager] = {}
+        writers: Dict[str, RosterCSVWriter] = {}
+        pending: Dict[str, set] = {}
+        for season in seasons:
+            manager = RosterManager(teams_file=self.teams_file, entity_type=self.entity_type, workers=self.workers,
+                                    per_host_limit=self.per_host_limit, context=self.context,
+                                    teams_data=self.teams_data)
+            manager._host_semaphores, manager._host_semaphores_lock = self._host_semaphores, self._host_semaphores_lock
+            managers[season] = manager
+            writer, season_team_ids = manager._open_csv(output_files[season], team_ids, resume, incremental)
+            if writer:
+                writers[season] = writer
+                teams = manager._pending_teams(manager.get_teams(season_team_ids), writer)
+                pending[season] = {team['ncaa_id'] for team in teams}
+
+        units = [[(managers[season], team, season) for season in writers if team['ncaa_id'] in pending[season]]
+                 for team in self.get_teams(None if incremental else team_ids)]
+        units = interleave_by_host([unit for unit in units if unit], lambda unit: unit[0][1].get('url', ''))
+        logger.info(f"Scraping {sum(len(unit) for unit in units)} team-seasons across {len(writers)} seasons")
+
+        try:
+            for unit, results in zip(units, self._scrape_units(units)):
+                for (manager, team, season), result in zip(unit, results):
+                    manager._record_team(team, *result, writer=writers[season])
+        except BaseException:
+            for season, writer in writers.items():
+                writer.close(complete=False)
+                logger.info(f"Run interrupted; rerun with --resume to continue {output_files[season]}")
+            raise
+        for season, writer in writers.items():
+            managers[season]._close_csv(writer, output_files[season])
+        return managers
+
+    def work_queue(self, crawl_queue: CrawlQueue, worker_id: str) -> int:
+        """Claim and scrape jobs from crawl_queue until none are left, returning the number completed
+
+        Each of this manager's workers claims one job at a time (the team's
+        next season when there is one, see CrawlQueue.claim), scraping it
+        with a manager for the job's entity type and season (sharing this
+        manager's context and per-host limits). A heartbeat renews the leases
+        held by worker_id so long jobs are not handed to another worker. A job
+        that raises is released for another attempt until it runs out of
+        attempts, when it is recorded as a zero-player team.
+        """
+        managers: Dict[tuple, RosterManager] = {}
+        managers_lock = threading.Lock()
+        completed = []
+
+        def manager_for(entity_type: str, season: str) -> RosterManager:
+            with managers_lock:
+                if (entity_type, season) not in managers:
+                    manager = RosterManager(teams_file=self.teams_file, entity_type=entity_type,
+                                            per_host_limit=self.per_host_limit, context=self.context,
+                                            teams_data=self.teams_data)
+                    manager._host_semaphores, manager._host_semaphores_lock = (self._host_semaphores,
+                                                                               self._host_semaphores_lock)
+                    managers[(entity_type, season)] = manager
+                return managers[(entity_type, season)]
+
+        def work():
+            job = None
+            while True:
+                # Prefer the next season of the team (or host) this thread just scraped
+                job = crawl_queue.claim(worker_id, after=job)
+                if job is None:
+                    return
+                team, season = job['team'], job['season']
+                manager = manager_for(job['entity_type'], season)
+                players, year_check_failed, error = manager._scrape_team_with_check(team, season)
+                if error and job['attempts'] < crawl_queue.max_attempts:
+                    logger.warning(f"Failed to scrape {team['team']} {season} (attempt {job['attempts']} of "
+                                   f"{crawl_queue.max_attempts}), releasing it: {error}")
+                    crawl_queue.fail(job, worker_id, str(error))
+                    job = None  # leave the retry to whichever thread gets to it, not straight back to this one
+                    continue
+                manager._record_team(team, players, year_check_failed, error,
+                                     QueueJobWriter(crawl_queue, job, worker_id))
+                completed.append(job)
+
+        stop = threading.Event()
+
+        def heartbeat():
+            while not stop.wait(crawl_queue.lease_seconds / 3):
+                crawl_queue.renew(worker_id)
+
+        threading.Thread(target=heartbeat, daemon=True).start()
+        logger.info(f"Worker {worker_id} claiming jobs from {crawl_queue.db_path} with {self.workers} threads")
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for future in [executor.submit(work) for _ in range(self.workers)]:
+                    future.result()
+        finally:
+            stop.set()
+        return len(completed)
+
+    def merge_queue(self, crawl_queue: CrawlQueue, season: str, output_file: str) -> int:
+        """Write this manager's entity type's finished jobs for season to output_file, in teams.json order
+
+        Jobs given up after max_attempts are written as zero-player teams;
+        jobs still pending or leased are left out (with a warning) so the
+        merge can be rerun once the workers finish.
+        """
+        writer = RosterCSVWriter(output_file, ENTITY_CONFIGS[self.entity_type]['output_fields'])
+        unfinished = 0
+        for team, state, result, error in crawl_queue.results(self.entity_type, season):
+            if state == 'done':
+                zero_player, failed_year_check = result['zero_player'], result['failed_year_check']
+                rows = result['rows']
+            elif state == 'failed':
+                logger.error(f"Gave up on {team['team']} {season}: {error}")
+                zero_player, failed_year_check = {'team_id': team['ncaa_id'], 'team_name': team['team']}, None
+                rows = []
+            else:
+                unfinished += 1
                 continue
+            if zero_player:
+                self.zero_player_teams.append(zero_player)
+            if failed_year_check:
+                self.failed_year_check_teams.append(failed_year_check)
+            writer.write_team(team, rows, zero_player, failed_year_check)
+        if unfinished:
+            logger.warning(f"{unfinished} {self.entity_type} jobs for {season} are not finished; "
+                           f"rerun --merge once the workers are done")
+        return self._close_csv(writer, output_file)
+
+    def _open_csv(self, output_file: str, team_ids: Optional[List[int]], resume: bool,
+                  incremental: bool) -> tuple:
+        """Set up the writer (and incremental snapshot) for output_file
+
+        Returns (writer, team_ids to scrape); writer is None when resuming an
+        output that is already complete.
+        """
+        if resume and os.path.exists(output_file) and not os.path.exists(f"{output_file}.journal"):
+            # The journal is only removed once every team is written
+            logger.warning(f"Nothing to resume: {output_file} is already complete (rerun without --resume "
+                           f"to scrape it again)")
+            return None, team_ids
+        if incremental:
+            self.snapshot = RosterSnapshot(output_file)
+            if team_ids:
+                self.snapshot.selected = set(team_ids)
+                team_ids = None
+        return RosterCSVWriter(output_file, ENTITY_CONFIGS[self.entity_type]['output_fields'], resume=resume), team_ids
+
+    def _close_csv(self, writer: RosterCSVWriter, output_file: str) -> int:
+        """Finish a completed output: save the incremental snapshot, close the writer and log the total"""
+        if self.snapshot:
+            self.snapshot.save(writer.completed)
+            self.changed_teams = [
+                {'team_id': record['team_id'], 'team_name': record['team_name'],
+                 'players_before': len(self.snapshot.rows(record['team_id'])), 'players_after': record['players']}
+                for record in writer.completed.values() if record.get('changed')
+            ]
+            logger.info(f"{len(self.changed_teams)} teams changed since the last run"
+                        + (': ' + ', '.join(t['team_name'] for t in self.changed_teams) if self.changed_teams else ''))
+        writer.close()
+        entity_label = ENTITY_CONFIGS[self.entity_type]['entity_label']
+        logger.info(f"Saved {writer.rows_written} {entity_label} to {output_file}")
+        return writer.rows_written
 
-        return all_players
+    def _rows_changed(self, team_id: int, rows: List[Dict]) -> bool:
+        """Compare freshly scraped rows with the team's rows in the previous CSV, as written"""
+        fieldnames = ENTITY_CONFIGS[self.entity_type]['output_fields']
+        written = [{field: '' if row.get(field) is None else str(row.get(field)) for field in fieldnames}
+                   for row in rows]
+        previous = [{field: row.get(field, '') for field in fieldnames} for row in self.snapshot.rows(team_id)]
+        return written != previous
+
+    def _roster_fingerprint(self, team: Dict, season: str) -> Optional[str]:
+        """Hash the normalized roster section of a team's page, or None if it can't be fingerprinted
+
+        Only static standard/table pages are fingerprinted; JavaScript-rendered
+        rosters are not in the fetched HTML, so those teams are always scraped.
+        The page is fetched through the page cache, so the scraper reuses it.
+        """
+        config = TeamConfig.get_config(team['ncaa_id'])
+        if config['type'] not in ('standard', 'table') or team['ncaa_id'] in StandardScraper.JAVASCRIPT_TEAMS:
+            return None
+        url_format = self._url_formats(team, config.get('url_format', 'default'))[0]
+        url = URLBuilder.build_url(team['url'], season, url_format, entity_type=self.entity_type)
+        html = self.fetch_html(url)
+        if not html:
+            return None
+
+        section = None
+        for selector in ('#cardPanel, #listPanel, #tablePanel', ENTITY_CONFIGS[self.entity_type]['sidearm_container'],
+                         '#coaching-staff, #roster-staff', 'table'):
+            section = html.select_one(selector)
+            if section:
+                break
+        section = section or html.find('body') or html
+
+        headings = ' '.join(h.get_text(' ', strip=True) for h in html.find_all(['title', 'h1', 'h2']))
+        text = ' '.join(section.get_text(' ', strip=True).split())
+        links = ' '.join(a.get('href', '') for a in section.find_all('a'))
+        return hashlib.sha256(f"{headings}\n{text}\n{links}".encode('utf-8')).hexdigest()
+
+    def _scrape_teams(self, teams: List[Dict], season: str):
+        """Yield (players, year_check_failed, error) for each team, in input order"""
+        return self._scrape_jobs([(self, team, season) for team in teams])
+
+    def _scrape_jobs(self, jobs: List[tuple]):
+        """Yield the result of each (manager, team, season) job in input order, using this manager's workers"""
+        for results in self._scrape_units([[job] for job in jobs]):
+            yield results[0]
+
+    def _scrape_units(self, units: List[List[tuple]]):
+        """Yield the results of each unit of (manager, team, season) jobs in input order
+
+        A unit's jobs run one after another on the same worker; units run
+        concurrently on this manager's workers.
+        """
+        def run(unit):
+            return [manager._scrape_team_with_check(team, season) for manager, team, season in unit]
+
+        if self.workers == 1:
+            for unit in units:
+                yield run(unit)
+            return
+
+        logger.info(f"Scraping {len(units)} teams with {self.workers} workers "
+                    f"({self.per_host_limit} per host)")
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # executor.map returns results in submission order regardless of completion order
+            yield from executor.map(run, units)
+
+    def _scrape_team_with_check(self, team: Dict, season: str) -> tuple:
+        """Scrape one team and run its season check, holding that team's host slot
+
+        In incremental mode, players is None for a team whose previous rows are kept.
+        """
+        if self.snapshot and self.snapshot.carries(team['ncaa_id']):
+            return None, False, None
+        with self._host_semaphore(team.get('url', '')), self.context.track(team) as record:
+            try:
+                if self.snapshot:
+                    fingerprint = self._roster_fingerprint(team, season)
+                    self._fingerprints[team['ncaa_id']] = fingerprint
+                    if self.snapshot.is_unchanged(team['ncaa_id'], fingerprint):
+                        logger.info(f"Roster unchanged for {team['team']}, keeping previous rows")
+                        if record is not None:
+                            record['path'] = {'incremental': 'unchanged'}
+                        return None, False, None
+                players = self.scrape_team_roster(team, season)
+                # Check for year verification failure first
+                with self.context.timed('verify_seconds'):
+                    year_check_failed = not self._verify_team_season(team, season)
+                if record is not None:
+                    record['players'] = len(players)
+                    record['failed_year_check'] = year_check_failed
+                return players, year_check_failed, None
+            except Exception as e:
+                if record is not None:
+                    record['error'] = str(e)
+                return [], False, e
+
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent requests to the host of url"""
+        host = urlparse(url).netloc.lower()
+        with self._host_semaphores_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_semaphores[host]
+
+    def _csv_row(self, player: Player) -> Dict[str, Any]:
+        """Build the output CSV row for a player or coach"""
+        if self._team_state_map is None:
+            self._team_state_map = {team['ncaa_id']: team.get('team_state', '') for team in self.teams_data}
+
+        # Post-process fields to remove label prefixes and accidental duplicates
+        pdata = player.to_dict()
+        pdata['name'] = FieldExtractors.clean_field_labels(pdata.get('name', ''))
+        
+        # For coaches, map position to title
+        if self.entity_type == 'coach':
+            pdata['title'] = pdata.get('position', '')
+        else:
+            # Only clean player-specific fields if we're saving players
+            pdata['hometown'] = FieldExtractors.clean_field_labels(pdata.get('hometown', ''))
+            pdata['high_school'] = FieldExtractors.clean_field_labels(pdata.get('high_school', ''))
+            pdata['previous_school'] = FieldExtractors.clean_field_labels(pdata.get('previous_school', ''))
+            pdata['academic_year'] = FieldExtractors.clean_field_labels(pdata.get('academic_year', ''))
+            
+            # Add state abbreviation to hometown if not already present (opt-in only)
+            team_id = pdata.get('team_id')
+            if team_id in TeamConfig.ADD_STATE_TO_HOMETOWN:
+                hometown = pdata.get('hometown', '')
+                if hometown and ',' not in hometown:
+                    # Hometown doesn't have state - add team's state abbreviation
+                    team_state = self._team_state_map.get(team_id)
+                    if team_state:
+                        pdata['hometown'] = f"{hometown}, {team_state}"
+        return pdata
 
     def save_to_csv(self, players: List[Player], output_file: str):
         """Save players to CSV file"""
@@ -3185,9 +5355,6 @@ class RosterManager:
 
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
 
-        # Build team_id to team_state mapping
-        team_state_map = {team['ncaa_id']: team.get('team_state', '') for team in self.teams_data}
-
         # Use entity-specific fieldnames
         fieldnames = ENTITY_CONFIGS[self.entity_type]['output_fields']
         entity_label = ENTITY_CONFIGS[self.entity_type]['entity_label']
@@ -3196,31 +5363,7 @@ class RosterManager:
             writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
             writer.writeheader()
             for player in players:
-                # Post-process fields to remove label prefixes and accidental duplicates
-                pdata = player.to_dict()
-                pdata['name'] = FieldExtractors.clean_field_labels(pdata.get('name', ''))
-                
-                # For coaches, map position to title
-                if self.entity_type == 'coach':
-                    pdata['title'] = pdata.get('position', '')
-                else:
-                    # Only clean player-specific fields if we're saving players
-                    pdata['hometown'] = FieldExtractors.clean_field_labels(pdata.get('hometown', ''))
-                    pdata['high_school'] = FieldExtractors.clean_field_labels(pdata.get('high_school', ''))
-                    pdata['previous_school'] = FieldExtractors.clean_field_labels(pdata.get('previous_school', ''))
-                    pdata['academic_year'] = FieldExtractors.clean_field_labels(pdata.get('academic_year', ''))
-                    
-                    # Add state abbreviation to hometown if not already present (opt-in only)
-                    team_id = pdata.get('team_id')
-                    if team_id in TeamConfig.ADD_STATE_TO_HOMETOWN:
-                        hometown = pdata.get('hometown', '')
-                        if hometown and ',' not in hometown:
-                            # Hometown doesn't have state - add team's state abbreviation
-                            team_state = team_state_map.get(team_id)
-                            if team_state:
-                                pdata['hometown'] = f"{hometown}, {team_state}"
-                
-                writer.writerow(pdata)
+                writer.writerow(self._csv_row(player))
 
         logger.info(f"Saved {len(players)} {entity_label} to {output_file}")
 
@@ -3249,15 +5392,15 @@ class RosterManager:
             config = TeamConfig.get_config(team['ncaa_id'])
             url_format = config.get('url_format', 'default') if config else 'default'
             
-            url = URLBuilder.build_url(team['url'], season, url_format, entity_type=self.entity_type)
-            html, status = self.fetch_html(url, return_status=True)
-            
-            # If 404 and using default format, try season_first as fallback
-            if not html and status == 404 and url_format == "default":
-                logger.info(f"Got 404 during season verification for {team['team']}, trying season_first URL format as fallback")
-                url = URLBuilder.build_url(team['url'], season, "season_first", entity_type=self.entity_type)
-                logger.info(f"Trying fallback URL: {url}")
-                html = self.fetch_html(url)
+            # A 404 moves on to the next format (season_first after default, or the reverse if that worked last)
+            formats = self._url_formats(team, url_format)
+            for i, fmt in enumerate(formats):
+                url = URLBuilder.build_url(team['url'], season, fmt, entity_type=self.entity_type)
+                html, status = self.fetch_html(url, return_status=True)
+                if html or status != 404 or i == len(formats) - 1:
+                    break
+                logger.info(f"Got 404 during season verification for {team['team']}, trying {formats[i + 1]} URL format as fallback")
+                self.context.record('fallbacks')
             
             if not html:
                 return False
@@ -3288,13 +5431,23 @@ class RosterManager:
         Returns:
             BeautifulSoup object if return_status=False, or (BeautifulSoup, status_code) tuple if return_status=True
         """
+        page_cache = self.context.page_cache
+        cached = page_cache.get(url, any_scope=True) if page_cache else None
+        if cached is not None:
+            logger.debug(f"Reusing scraped page for season verification: {url}")
+            return cached if return_status else cached[0]
+
         try:
-            response = requests.get(url, timeout=30, verify=False)
+            response = self.context.get(self.context.session or requests, url, timeout=30, verify=False)
             status_code = response.status_code  # Capture before raise_for_status()
             response.raise_for_status()
-            html = BeautifulSoup(response.text, 'html.parser')
+            html = self.context.parse(response.text)
+            if page_cache:
+                page_cache.put(url, html, status_code, final_url=response.url)
             return (html, status_code) if return_status else html
         except requests.HTTPError as e:
+            if page_cache:
+                page_cache.put(url, None, status_code, final_url=response.url)
             if return_status:
                 logger.error(f"Failed to fetch {url}: {e}")
                 return (None, status_code)  # Use the status_code we captured
@@ -3321,11 +5474,30 @@ class RosterManager:
 
         logger.info(f"Saved {len(self.failed_year_check_teams)} teams that failed year check to {output_file}")
 
+    def save_changed_teams_to_csv(self, output_file: str):
+        """Save teams whose rows changed in an incremental run to CSV file"""
+        if not self.changed_teams:
+            logger.info("No teams changed since the last run")
+            return
+
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            fieldnames = ['team_id', 'team_name', 'players_before', 'players_after']
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for team in self.changed_teams:
+                writer.writerow(team)
+
+        logger.info(f"Saved {len(self.changed_teams)} changed teams to {output_file}")
+
 
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='NCAA Women\'s Basketball Roster Scraper - Refactored')
-    parser.add_argument('-season', required=True, help='Season (e.g., "2023-24")')
+    parser.add_argument('-season', required=True,
+                        help='Season (e.g., "2023-24"), a list ("2023-24,2024-25") or a range ("2018-19:2025-26"); '
+                             'several seasons share one session, cache and browser pool and get one CSV each')
     parser.add_argument('-teams', nargs='*', type=int, help='Specific team IDs to scrape')
     parser.add_argument('-team', type=int, help='Single team ID to scrape')
     parser.add_argument('-output', help='Output CSV file path')
@@ -3335,54 +5507,160 @@ def main():
                        default='player',
                        help='Type of entity to scrape: player, coach, or all (default: player)')
     parser.add_argument('--use-playwright', action='store_true', help='Use Playwright instead of shot-scraper')
+    parser.add_argument('--browser-pool', type=int, default=0,
+                        help='Number of persistent Playwright browsers shared by JavaScript teams (default: 0, use shot-scraper)')
+    parser.add_argument('--workers', type=int, default=1, help='Number of teams to scrape concurrently (default: 1)')
+    parser.add_argument('--per-host', type=int, default=2,
+                        help='Maximum concurrent teams per host when --workers > 1 (default: 2)')
+    parser.add_argument('--retries', type=int, default=3,
+                        help='Retries with exponential backoff for connection errors and 429/5xx responses (default: 3)')
+    parser.add_argument('--rate', type=float, default=2.0,
+                        help='Requests per second allowed to each host, 0 for no limit (default: 2)')
+    parser.add_argument('--burst', type=int, default=2,
+                        help='Requests a host may receive back to back before --rate applies (default: 2)')
+    parser.add_argument('--cache-dir', help='Directory for a persistent HTTP cache revalidated with ETag/Last-Modified')
+    parser.add_argument('--cache-ttl', type=float, default=3600,
+                        help='Seconds a cached page is served without revalidation (default: 3600)')
+    parser.add_argument('--cache-max-mb', type=int, default=1024,
+                        help='Maximum size of the HTTP cache in MB; least recently used pages are evicted (default: 1024)')
+    parser.add_argument('--platform-cache', metavar='FILE',
+                        help='JSON file remembering the URL format and scraper path that worked for each team, '
+                             'so later runs skip failed fallbacks')
+    parser.add_argument('--report', metavar='FILE',
+                        help='Write per-team metrics (latency, bytes, parse/extract time, fallbacks, ...) as JSON Lines '
+                             'and log the slowest teams')
+    parser.add_argument('--parser', choices=HTML_PARSERS, default=HTML_PARSER,
+                        help='HTML parser backend (default: $WBB_HTML_PARSER or html.parser)')
+    parser.add_argument('--scoped-parse', action='store_true',
+                        help='Build only the roster containers, tables, headings and scripts of each page')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only re-extract teams whose roster section changed since the last incremental run, '
+                             'merging them into the existing output CSV')
+    parser.add_argument('--format', choices=['csv', 'parquet', 'arrow'], default='csv',
+                        help='Also save each output CSV as Parquet or Arrow IPC with typed, dictionary-encoded '
+                             'columns (requires pyarrow; default: csv only)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted run, skipping teams already written to the output CSV')
+    archive_group = parser.add_mutually_exclusive_group()
+    archive_group.add_argument('--record', metavar='DIR',
+                               help='Save every fetched page, rendered page and JavaScript result to a gzipped archive')
+    archive_group.add_argument('--replay', metavar='DIR',
+                               help='Run entirely offline against an archive written by --record')
+    queue_group = parser.add_mutually_exclusive_group()
+    queue_group.add_argument('--enqueue', metavar='DB',
+                             help='Add a job per selected team, season and entity type to a SQLite work queue and exit')
+    queue_group.add_argument('--work', metavar='DB',
+                             help='Claim and scrape jobs from a work queue until none are left; run one per process '
+                                  'or machine sharing the file')
+    queue_group.add_argument('--merge', metavar='DB',
+                             help='Write the usual CSV outputs from the finished jobs of a work queue')
+    parser.add_argument('--lease', type=float, default=600,
+                        help='Seconds a claimed job stays leased without a heartbeat before another worker '
+                             'may take it over (default: 600)')
+    parser.add_argument('--worker-id', default=f"{socket.gethostname()}:{os.getpid()}",
+                        help='Name this worker holds its leases under (default: host:pid)')
     parser.add_argument('--verbose', action='store_true', help='Verbose logging')
     
     args = parser.parse_args()
+    try:
+        parse_seasons(args.season)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.format != 'csv' and not PYARROW_AVAILABLE:
+        parser.error(f"--format {args.format} requires pyarrow (pip install pyarrow)")
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    manager = RosterManager(entity_type=args.entity_type)
+    set_html_parser(args.parser)
+
+    context = ScrapeContext(
+        page_cache=PageCache(max_entries=max(128, args.workers * 8)),
+        http_cache=HTTPCache(args.cache_dir, ttl=args.cache_ttl, max_bytes=args.cache_max_mb * 1024 * 1024)
+        if args.cache_dir else None,
+        session=create_session(pool_maxsize=max(args.per_host, 2), retries=args.retries,
+                               retry_statuses=(500, 502, 504) if args.rate > 0 else (429, 500, 502, 503, 504)),
+        scoped_parse=args.scoped_parse,
+        rate_limiter=HostRateLimiter(rate=args.rate, burst=args.burst, max_retries=args.retries)
+        if args.rate > 0 else None,
+        platform_cache=PlatformCache(args.platform_cache) if args.platform_cache else None,
+        archive=PageArchive(args.record or args.replay, replay=bool(args.replay))
+        if args.record or args.replay else None,
+        telemetry=RunTelemetry(args.report) if args.report else None
+    )
+
+    # --use-playwright implies a pool sized to the worker count (capped, browsers are heavy)
+    browser_pool_size = args.browser_pool or (min(args.workers, 4) if args.use_playwright else 0)
+    if browser_pool_size and args.replay:
+        logger.info("Replaying an archive; not starting browsers")
+    elif browser_pool_size:
+        if PLAYWRIGHT_AVAILABLE:
+            context.browser_pool = BrowserPool(size=browser_pool_size, user_agent=BROWSER_USER_AGENT)
+        else:
+            logger.warning("Playwright is not installed; falling back to shot-scraper for JavaScript teams")
+
+    try:
+        run_scrape(args, context)
+    finally:
+        if context.browser_pool:
+            context.browser_pool.close()
+        if context.http_cache:
+            logger.info(context.http_cache.stats())
+        logger.info(context.session.get_adapter('https://').stats())
+        if context.rate_limiter:
+            logger.info(context.rate_limiter.stats())
+        if context.platform_cache:
+            logger.info(context.platform_cache.stats())
+        if context.archive:
+            logger.info(context.archive.stats())
+        if context.telemetry:
+            context.telemetry.close()
+            logger.info(context.telemetry.summary())
+
+
+def parse_seasons(spec: str) -> List[str]:
+    """Expand a -season argument: one season, a comma-separated list, or a range like 2018-19:2025-26"""
+    seasons = []
+    for part in spec.replace(' ', ',').split(','):
+        if not part:
+            continue
+        start, _, end = part.partition(':')
+        for season in (start, end or start):
+            if not re.fullmatch(r'\d{4}-\d{2}', season):
+                raise ValueError(f"Invalid season {season!r}, expected e.g. 2023-24")
+        for year in range(int(start[:4]), int((end or start)[:4]) + 1):
+            season = f"{year}-{str(year + 1)[-2:]}"
+            if season not in seasons:
+                seasons.append(season)
+    if not seasons:
+        raise ValueError("No seasons given")
+    return seasons
+
+
+def season_output_file(output_file: str, season: str) -> str:
+    """Per-season name for an -output path when several seasons are scraped"""
+    if '{season}' in output_file:
+        return output_file.replace('{season}', season)
+    if output_file.endswith('.csv'):
+        return f"{output_file[:-4]}_{season}.csv"
+    return f"{output_file}_{season}"
+
+
+def run_scrape(args, context: ScrapeContext):
+    """Scrape and save the teams, entities and seasons selected on the command line"""
+    seasons = parse_seasons(args.season)
+    manager = RosterManager(entity_type=args.entity_type, workers=args.workers, per_host_limit=args.per_host,
+                            context=context)
+
+    def output_for(output_file: str, season: str) -> str:
+        return season_output_file(output_file, season) if len(seasons) > 1 else output_file
 
     # Handle single team with URL
     if args.url and args.team:
-        teams = manager.get_teams([args.team])
-        if teams:
-            team_data = teams[0].copy()
-            team_data['url'] = args.url
-        else:
-            team_data = {'ncaa_id': args.team, 'team': f'Team_{args.team}', 'url': args.url}
-        
-        players = manager.scrape_team_roster(team_data, args.season)
-        
-        # Check year verification for single team case
-        year_check_failed = not manager._verify_team_season(team_data, args.season)
-        
-        if year_check_failed:
-            manager.failed_year_check_teams.append({
-                'team_id': team_data['ncaa_id'],
-                'team_name': team_data.get('team', f'Team_{team_data["ncaa_id"]}'),
-                'url': team_data['url']
-            })
-        
-        # Only add to zero players if year check passed but no players found
-        if len(players) == 0 and not year_check_failed:
-            manager.zero_player_teams.append({
-                'team_id': team_data['ncaa_id'],
-                'team_name': team_data.get('team', f'Team_{team_data["ncaa_id"]}')
-            })
-        
-        if args.output:
-            manager.save_to_csv(players, args.output)
-            if manager.zero_player_teams:
-                zero_output_file = args.output.replace('.csv', '_zero_players.csv')
-                manager.save_zero_player_teams_to_csv(zero_output_file)
-            if manager.failed_year_check_teams:
-                failed_year_output_file = args.output.replace('.csv', '_failed_year_check.csv')
-                manager.save_failed_year_check_teams_to_csv(failed_year_output_file)
-        else:
-            for player in players:
-                print(json.dumps(player.to_dict(), indent=2))
+        for season in seasons:
+            season_manager = manager if len(seasons) == 1 else RosterManager(
+                entity_type=args.entity_type, context=context, teams_data=manager.teams_data)
+            scrape_single_team(args, season_manager, season, output_for(args.output, season) if args.output else None)
         return
 
     # Handle multiple teams
@@ -3392,78 +5670,119 @@ def main():
     elif args.team:
         team_ids = [args.team]
 
-    # Handle 'all' entity type - scrape both players and coaches
-    if args.entity_type == 'all':
-        logger.info("Scraping both players and coaches")
-        
-        # Scrape players
-        logger.info("=== Scraping Players ===")
-        player_manager = RosterManager(entity_type='player')
-        players = player_manager.scrape_multiple_teams(args.season, team_ids)
-        
-        # Determine player output file
-        if args.output:
-            player_output = args.output.replace('.csv', '_players.csv')
-        elif team_ids and len(team_ids) == 1:
-            player_output = f"/Users/dwillis/code/wbb/ncaa/rosters_{args.season}_team_{team_ids[0]}.csv"
-        else:
-            player_output = f"/Users/dwillis/code/wbb/ncaa/rosters_{args.season}.csv"
-        
-        player_manager.save_to_csv(players, player_output)
-        
-        # Scrape coaches
-        logger.info("=== Scraping Coaches ===")
-        coach_manager = RosterManager(entity_type='coach')
-        coaches = coach_manager.scrape_multiple_teams(args.season, team_ids)
-        
-        # Determine coach output file
-        if args.output:
-            coach_output = args.output.replace('.csv', '_coaches.csv')
-        elif team_ids and len(team_ids) == 1:
-            coach_output = f"/Users/dwillis/code/wbb/ncaa/coaches_{args.season}_team_{team_ids[0]}.csv"
+    def default_output(prefix: str, season: str) -> str:
+        if team_ids and len(team_ids) == 1:
+            return f"/Users/dwillis/code/wbb/ncaa/{prefix}_{season}_team_{team_ids[0]}.csv"
+        return f"/Users/dwillis/code/wbb/ncaa/{prefix}_{season}.csv"
+
+    def scrape_entity(entity_type: str, outputs: Dict[str, str]) -> Dict[str, RosterManager]:
+        entity_manager = manager if entity_type == manager.entity_type else RosterManager(
+            entity_type=entity_type, workers=args.workers, per_host_limit=args.per_host, context=context,
+            teams_data=manager.teams_data)
+        if len(seasons) == 1:
+            entity_manager.scrape_to_csv(seasons[0], outputs[seasons[0]], team_ids, resume=args.resume,
+                                         incremental=args.incremental)
+            return {seasons[0]: entity_manager}
+        return entity_manager.scrape_seasons_to_csv(seasons, outputs, team_ids, resume=args.resume,
+                                                    incremental=args.incremental)
+
+    entity_types = ['player', 'coach'] if args.entity_type == 'all' else [args.entity_type]
+    outputs: Dict[str, Dict[str, str]] = {}
+    for entity_type in entity_types:
+        if args.output and args.entity_type == 'all':
+            base_output = args.output.replace('.csv', f"_{ENTITY_CONFIGS[entity_type]['entity_label']}.csv")
         else:
-            coach_output = f"/Users/dwillis/code/wbb/ncaa/coaches_{args.season}.csv"
-        
-        coach_manager.save_to_csv(coaches, coach_output)
-        
-        # Save zero player/coach teams if any
-        if player_manager.zero_player_teams:
-            zero_output = player_output.replace('.csv', '_zero_players.csv')
-            player_manager.save_zero_player_teams_to_csv(zero_output)
-        
-        if coach_manager.zero_player_teams:
-            zero_output = coach_output.replace('.csv', '_zero_coaches.csv')
-            coach_manager.save_zero_player_teams_to_csv(zero_output)
-        
-        # Save failed year check teams if any
-        if player_manager.failed_year_check_teams:
-            failed_output = player_output.replace('.csv', '_failed_year_check.csv')
-            player_manager.save_failed_year_check_teams_to_csv(failed_output)
-            
-    else:
-        # Single entity type scraping
-        players = manager.scrape_multiple_teams(args.season, team_ids)
-        
-        # Determine output file based on entity type
-        entity_prefix = ENTITY_CONFIGS[args.entity_type]['csv_prefix']
-        if args.output:
-            output_file = args.output
-        elif team_ids and len(team_ids) == 1:
-            output_file = f"/Users/dwillis/code/wbb/ncaa/{entity_prefix}_{args.season}_team_{team_ids[0]}.csv"
+            base_output = args.output
+        outputs[entity_type] = {season: output_for(base_output, season) if base_output
+                                else default_output(ENTITY_CONFIGS[entity_type]['csv_prefix'], season)
+                                for season in seasons}
+
+    def save_reports(season_manager: RosterManager, output_file: str):
+        # Save teams with zero players (zero coaches in a combined run)
+        if season_manager.zero_player_teams:
+            zero_suffix = '_zero_coaches.csv' if args.entity_type == 'all' and season_manager.entity_type == 'coach' \
+                else '_zero_players.csv'
+            season_manager.save_zero_player_teams_to_csv(output_file.replace('.csv', zero_suffix))
+
+        # Save teams that failed the year check (a combined run only reports them for players)
+        if season_manager.failed_year_check_teams and not (args.entity_type == 'all'
+                                                           and season_manager.entity_type == 'coach'):
+            failed_year_output_file = output_file.replace('.csv', '_failed_year_check.csv')
+            season_manager.save_failed_year_check_teams_to_csv(failed_year_output_file)
+
+        # Report teams that changed in an incremental run
+        if season_manager.changed_teams:
+            season_manager.save_changed_teams_to_csv(output_file.replace('.csv', '_changed_teams.csv'))
+
+        if args.format != 'csv' and os.path.exists(output_file):
+            ColumnarExport.export(output_file, args.format)
+
+    if args.enqueue or args.work or args.merge:
+        crawl_queue = CrawlQueue(args.enqueue or args.work or args.merge, lease_seconds=args.lease)
+        if args.enqueue:
+            added = crawl_queue.enqueue(manager.get_teams(team_ids), seasons, entity_types)
+            logger.info(f"Queued {added} new jobs in {args.enqueue}")
+        elif args.work:
+            done = manager.work_queue(crawl_queue, args.worker_id)
+            logger.info(f"Worker {args.worker_id} completed {done} jobs")
         else:
-            output_file = f"/Users/dwillis/code/wbb/ncaa/{entity_prefix}_{args.season}.csv"
+            for entity_type in entity_types:
+                for season in seasons:
+                    season_manager = RosterManager(entity_type=entity_type, context=context,
+                                                   teams_data=manager.teams_data)
+                    season_manager.merge_queue(crawl_queue, season, outputs[entity_type][season])
+                    save_reports(season_manager, outputs[entity_type][season])
+        logger.info(crawl_queue.stats())
+        return
 
+    if args.entity_type == 'all':
+        logger.info("Scraping both players and coaches")
+    for entity_type in entity_types:
+        if args.entity_type == 'all':
+            logger.info(f"=== Scraping {ENTITY_CONFIGS[entity_type]['entity_label'].title()} ===")
+        for season, season_manager in scrape_entity(entity_type, outputs[entity_type]).items():
+            save_reports(season_manager, outputs[entity_type][season])
+
+
+def scrape_single_team(args, manager: 'RosterManager', season: str, output_file: Optional[str]):
+    """Scrape one team from an explicit -url and save (or print) its roster"""
+    teams = manager.get_teams([args.team])
+    if teams:
+        team_data = teams[0].copy()
+        team_data['url'] = args.url
+    else:
+        team_data = {'ncaa_id': args.team, 'team': f'Team_{args.team}', 'url': args.url}
+    
+    players = manager.scrape_team_roster(team_data, season)
+    
+    # Check year verification for single team case
+    year_check_failed = not manager._verify_team_season(team_data, season)
+    
+    if year_check_failed:
+        manager.failed_year_check_teams.append({
+            'team_id': team_data['ncaa_id'],
+            'team_name': team_data.get('team', f'Team_{team_data["ncaa_id"]}'),
+            'url': team_data['url']
+        })
+    
+    # Only add to zero players if year check passed but no players found
+    if len(players) == 0 and not year_check_failed:
+        manager.zero_player_teams.append({
+            'team_id': team_data['ncaa_id'],
+            'team_name': team_data.get('team', f'Team_{team_data["ncaa_id"]}')
+        })
+    
+    if output_file:
         manager.save_to_csv(players, output_file)
-        
-        # Save teams with zero players
         if manager.zero_player_teams:
             zero_output_file = output_file.replace('.csv', '_zero_players.csv')
             manager.save_zero_player_teams_to_csv(zero_output_file)
-
-        # Save teams that failed the year check
         if manager.failed_year_check_teams:
             failed_year_output_file = output_file.replace('.csv', '_failed_year_check.csv')
             manager.save_failed_year_check_teams_to_csv(failed_year_output_file)
+    else:
+        for player in players:
+            print(json.dumps(player.to_dict(), indent=2))
 
 
 if __name__ == "__main__":
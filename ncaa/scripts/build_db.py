@@ -1,9 +1,8 @@
-import os
 import json
 import datetime
-import glob
 import sqlite_utils
 from game import Game
+from game_store import GameStore
 
 team_json = json.loads(open('teams.json').read())
 
@@ -101,20 +100,19 @@ period_scores.create({
     "score": int
 }, pk=['game_id', 'team', 'period'], hash_id="id")
 
-for dir in glob.glob('/Users/dwillis/code/wbb-game-data/*-*'):
-    team_id = dir.split('wbb-game-data/')[1].split('-')[0]
+store = GameStore()
+
+for slug in store.slugs():
+    if '-' not in slug:
+        continue
+    team_id = slug.split('-')[0]
     json_team = [x for x in team_json if x['ncaa_id'] == int(team_id)][0]
-    os.chdir(dir)
-    for season in glob.glob('*'):
-        try:
-            os.chdir(season)
-        except:
-            continue
-        for file in glob.glob('*.json'):
-            print(file)
-            if os.stat(file).st_size == 4:
+    for season in store.seasons(slug):
+        for game_id in store.game_ids(slug, season):
+            print(f"{game_id}.json")
+            if not store.has(slug, season, game_id):
                 continue
-            game = Game(file)
+            game = Game(store.path(slug, season, game_id), json_data=store.read(slug, season, game_id))
             if json_team['team'] in game.home_team:
                 home_team_id = team_id
                 visiting_team_id = None
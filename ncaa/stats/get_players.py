@@ -1,9 +1,9 @@
 import csv
-import requests
 from bs4 import BeautifulSoup
 import re
 import sys
-import time
+
+from polite import PoliteSession
 
 
 NCAA_YEAR_DICT = {
@@ -46,6 +46,9 @@ output_headers = ['season', 'team_id', 'player_name', 'player_id', 'player_url']
 # Initialize the output list
 players_data = []
 
+# One request per second to stats.ncaa.org, backing off when throttled
+session = PoliteSession(rate=1.0)
+
 # Read the input CSV and process each team
 with open(input_csv, 'r', encoding='utf-8') as infile:
     reader = csv.DictReader(infile)
@@ -56,11 +59,10 @@ with open(input_csv, 'r', encoding='utf-8') as infile:
         roster_url = f"{base_url}/teams/{team_id}/roster"
 
         print(roster_url)
-        time.sleep(1)
         
         # Fetch the roster page
         print(f"Fetching roster for team ID {team_id} ({roster_url})...")
-        response = requests.get(roster_url, headers={'User-Agent': 'Mozilla/5.0'})
+        response = session.get(roster_url)
         print(response.status_code)
         
         if response.status_code != 200:
@@ -1,9 +1,9 @@
-import time
 import csv
 import sys
-import requests
 from bs4 import BeautifulSoup
 
+from polite import PoliteSession
+
 # Check if the input and output file arguments are provided
 if len(sys.argv) != 4:
     print("Usage: python player_ids.py <input_csv> <output_csv> <error_csv>")
@@ -18,6 +18,9 @@ error_csv = sys.argv[3]
 output_headers = ['season', 'team_id', 'player_name', 'player_id', 'player_url', 'master_id']
 error_headers = ['season', 'team_id', 'player_name', 'player_id', 'player_url', 'master_id']
 
+# One request per second to stats.ncaa.org, backing off when throttled
+session = PoliteSession(rate=1.0)
+
 # Initialize the output CSVs
 with open(output_csv, 'w', newline='', encoding='utf-8') as outfile, \
      open(error_csv, 'w', newline='', encoding='utf-8') as errfile:
@@ -33,12 +36,11 @@ with open(output_csv, 'w', newline='', encoding='utf-8') as outfile, \
         reader = csv.DictReader(infile)
 
         for row in reader:
-            time.sleep(1)
             player_url = row['player_url']
             print(f"Fetching data for player: {row['player_name']} ({player_url})...")
 
             # Fetch the player page
-            response = requests.get(player_url, headers={'User-Agent': 'Mozilla/5.0'})
+            response = session.get(player_url)
             if response.status_code != 200:
                 print(f"Failed to fetch page for {row['player_name']}. Status code: {response.status_code}")
                 error_writer.writerow(row)
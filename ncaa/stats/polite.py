@@ -0,0 +1,32 @@
+"""
+Per-host rate limiting for the stats.ncaa.org scripts.
+
+Replaces a fixed sleep after every request with the token bucket per host
+that rosters.py uses (wbb/ratelimit.py): the time a request itself takes
+counts towards the interval, and 429/503 responses back the host off for
+its Retry-After (seconds or an HTTP date) or an exponentially growing delay
+before retrying.
+
+Usage:
+    from polite import PoliteSession
+    session = PoliteSession(rate=1.0)
+    response = session.get(url)
+"""
+
+import requests
+
+from wbb.ratelimit import HostRateLimiter
+
+
+class PoliteSession:
+    """requests.Session wrapper whose get() waits for the host's token bucket"""
+
+    def __init__(self, rate=1.0, burst=1, max_retries=4, base_backoff=5.0, max_backoff=300.0,
+                 user_agent='Mozilla/5.0'):
+        self.limiter = HostRateLimiter(rate=rate, burst=burst, max_retries=max_retries,
+                                       base_backoff=base_backoff, max_backoff=max_backoff)
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': user_agent})
+
+    def get(self, url, **kwargs):
+        return self.limiter.get(self.session, url, **kwargs)
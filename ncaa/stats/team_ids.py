@@ -1,15 +1,17 @@
 import os
 import csv
-import requests
 from bs4 import BeautifulSoup
 import glob
-from time import sleep
+
+from polite import PoliteSession
 
 def process_team_files(directory='teams'):
     # Headers for requests to mimic Mozilla browser
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     }
+    # Be nice to the server: one request per second, backing off when throttled
+    session = PoliteSession(rate=1.0)
     
     # Find all matching CSV files
     pattern = os.path.join(directory, 'teams_*_d*.csv')
@@ -36,7 +38,7 @@ def process_team_files(directory='teams'):
             for row in reader:
                 try:
                     # Make request to URL
-                    response = requests.get(row['url'], headers=headers)
+                    response = session.get(row['url'], headers=headers)
                     response.raise_for_status()
                     
                     # Parse HTML
@@ -57,9 +59,6 @@ def process_team_files(directory='teams'):
                     row_copy['div'] = div
                     rows_to_write.append(row_copy)
                     
-                    # Be nice to the server
-                    sleep(1)
-                    
                 except Exception as e:
                     print(f"Error processing {row['url']}: {str(e)}")
                     row_copy = row.copy()
@@ -4,6 +4,10 @@ import re
 import requests
 from bs4 import BeautifulSoup
 
+from wbb.parsers import bs4_parser
+
+HTML_PARSER = bs4_parser()
+
 API_URL = "https://wbbblog.com/wp-json/wp/v2/posts/62914"
 OUTPUT_FILE = "coaching_changes.json"
 
@@ -71,7 +75,7 @@ def main():
     data = response.json()
 
     html_content = data["content"]["rendered"]
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = BeautifulSoup(html_content, HTML_PARSER)
 
     entries = []
     current_status = None
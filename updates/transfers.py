@@ -4,6 +4,10 @@ import re
 import requests
 from bs4 import BeautifulSoup
 
+from wbb.parsers import bs4_parser
+
+HTML_PARSER = bs4_parser()
+
 API_URL = "https://wbbblog.com/wp-json/wp/v2/posts/59451"
 OUTPUT_FILE = "transfers.json"
 
@@ -161,7 +165,7 @@ def main():
     resp.raise_for_status()
     data = resp.json()
 
-    soup = BeautifulSoup(data["content"]["rendered"], "html.parser")
+    soup = BeautifulSoup(data["content"]["rendered"], HTML_PARSER)
 
     entries = []
     current_team = None
@@ -0,0 +1 @@
+"""Helpers shared by the scraping scripts across ncaa/, fiba/ and updates/."""
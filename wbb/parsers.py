@@ -0,0 +1,56 @@
+"""
+HTML parser selection shared by every script that builds BeautifulSoup trees.
+
+WBB_HTML_PARSER picks the backend: lxml parses much faster than html.parser,
+and selectolax is used by ncaa/rosters (scripts that only build BeautifulSoup
+trees get lxml for it). An unknown or uninstalled backend falls back to
+html.parser with a warning instead of failing mid-run.
+
+Usage:
+    from wbb.parsers import bs4_parser
+    soup = BeautifulSoup(html, bs4_parser())
+"""
+
+import importlib.util
+import logging
+import os
+
+HTML_PARSERS = ('html.parser', 'lxml', 'selectolax')
+DEFAULT_PARSER = 'html.parser'
+ENV_VAR = 'WBB_HTML_PARSER'
+
+logger = logging.getLogger(__name__)
+
+
+def parser_available(name):
+    """True if the backend's module can be imported (html.parser always can)"""
+    return name == DEFAULT_PARSER or importlib.util.find_spec(name) is not None
+
+
+def requested_parser():
+    """Backend named by $WBB_HTML_PARSER, or html.parser if it is unset or unknown"""
+    name = os.environ.get(ENV_VAR, '').strip().lower()
+    if not name:
+        return DEFAULT_PARSER
+    if name not in HTML_PARSERS:
+        logger.warning(f"Unknown {ENV_VAR} '{name}' (choose from {', '.join(HTML_PARSERS)}), using {DEFAULT_PARSER}")
+        return DEFAULT_PARSER
+    return name
+
+
+def installed_or_default(name):
+    if parser_available(name):
+        return name
+    logger.warning(f"{ENV_VAR}={name} but {name} is not installed, using {DEFAULT_PARSER}")
+    return DEFAULT_PARSER
+
+
+def html_parser_from_env():
+    """Backend for $WBB_HTML_PARSER, falling back to html.parser if it is unknown or not installed"""
+    return installed_or_default(requested_parser())
+
+
+def bs4_parser():
+    """BeautifulSoup features for $WBB_HTML_PARSER; selectolax isn't a tree builder, so it maps to lxml"""
+    name = requested_parser()
+    return installed_or_default('lxml' if name == 'selectolax' else name)
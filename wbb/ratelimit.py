@@ -0,0 +1,129 @@
+"""
+Per-host rate limiting shared by ncaa/rosters and the stats.ncaa.org scripts.
+
+A token bucket per host replaces fixed sleeps between requests: the time a
+request itself takes counts towards the interval, and 429/503 responses back
+only that host off for its Retry-After or an exponentially growing delay.
+
+Usage:
+    from wbb.ratelimit import HostRateLimiter
+    limiter = HostRateLimiter(rate=1.0)
+    response = limiter.get(requests.Session(), url)
+"""
+
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostRateLimiter:
+    """Token bucket per host with adaptive backoff for 429/503 responses
+
+    Each host refills `rate` tokens per second up to `burst`. acquire() only
+    waits for the requesting host's bucket, so teams on unrelated hosts keep
+    running in parallel. A 429 or 503 pauses the host for its Retry-After
+    (seconds or an HTTP date) or, without one, for a delay that doubles with
+    each consecutive throttled response; a success resets the delay. A rate
+    of 0 (or less) means no limit: requests only wait out backoffs.
+    """
+
+    RETRY_STATUSES = (429, 503)
+
+    def __init__(self, rate: float = 2.0, burst: int = 2, max_retries: int = 4, base_backoff: float = 2.0,
+                 max_backoff: float = 300.0):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._hosts: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.backoffs = 0
+        self.waited = 0.0
+
+    def _host(self, url: str) -> Dict[str, float]:
+        """Bucket state for the host of url; call with the lock held"""
+        host = urlparse(url).netloc.lower()
+        if host not in self._hosts:
+            self._hosts[host] = {'tokens': float(self.burst), 'updated': time.monotonic(),
+                                 'blocked_until': 0.0, 'strikes': 0}
+        return self._hosts[host]
+
+    def acquire(self, url: str):
+        """Block until the host of url has a token (and is not backing off), then take it"""
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                state = self._host(url)
+                now = time.monotonic()
+                state['tokens'] = min(self.burst, state['tokens'] + (now - state['updated']) * self.rate)
+                state['updated'] = now
+                wait = state['blocked_until'] - now
+                if wait <= 0:
+                    if self.rate <= 0 or state['tokens'] >= 1:
+                        state['tokens'] = max(0.0, state['tokens'] - 1)
+                        self.requests += 1
+                        self.waited += now - start
+                        return
+                    wait = (1 - state['tokens']) / self.rate
+            # Sleep outside the lock so other hosts are not held up
+            time.sleep(wait)
+
+    def backoff(self, url: str, retry_after: Optional[str] = None) -> float:
+        """Pause the host of url after a throttled response and return the delay in seconds"""
+        with self._lock:
+            state = self._host(url)
+            state['strikes'] += 1
+            delay = retry_after_seconds(retry_after)
+            if delay is None:
+                delay = self.base_backoff * 2 ** (state['strikes'] - 1)
+            delay = min(delay, self.max_backoff)
+            state['blocked_until'] = max(state['blocked_until'], time.monotonic() + delay)
+            state['tokens'] = 0.0
+            self.backoffs += 1
+        logger.warning(f"Throttled by {urlparse(url).netloc}, backing off {delay:.1f}s")
+        return delay
+
+    def success(self, url: str):
+        """Reset the backoff of the host of url"""
+        with self._lock:
+            self._host(url)['strikes'] = 0
+
+    def get(self, requester, url: str, on_retry=None, **kwargs) -> requests.Response:
+        """GET url with requester once the host allows it, retrying throttled responses after backing off"""
+        for attempt in range(self.max_retries + 1):
+            self.acquire(url)
+            response = requester.get(url, **kwargs)
+            if response.status_code not in self.RETRY_STATUSES:
+                self.success(url)
+                return response
+            if attempt < self.max_retries:
+                self.backoff(url, response.headers.get('Retry-After'))
+                if on_retry:
+                    on_retry()
+        return response
+
+    def stats(self) -> str:
+        return (f"Rate limiter: {self.requests} requests to {len(self._hosts)} hosts, "
+                f"{self.waited:.1f}s spent waiting, {self.backoffs} backoffs")